@@ -0,0 +1,279 @@
+"""OpenAI Batch API submission for large AIScrape backfills.
+
+Interactive AIScrape sends one ``responses.create`` call per job. For a new
+company with many years of reports, :func:`submit_batch` instead writes the
+prepared requests to a JSONL file, uploads it with ``purpose="batch"`` and
+creates a batch against ``/v1/responses``. Batches are billed at a discount
+and are not subject to the interactive rate limits; they complete within the
+completion window.
+
+Submitted batches are recorded in ``openapiscrape/.scrape_batches.json`` with
+enough information (target folder, category, response cache key and request
+body per request) to write their results and resubmit failed lines even
+after the app was restarted. Nothing waits on a batch: callers check the
+recorded batches with :func:`wait_for_batch` and a short ``timeout`` and
+collect the ones that have finished.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from app_logging import get_logger
+from scrape_scheduler import classify_error
+
+
+logger = get_logger()
+
+BATCH_STATE_FILENAME = ".scrape_batches.json"
+BATCH_ENDPOINT = "/v1/responses"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_SECONDS = 30.0
+# Resubmit lines that failed with a retryable status at most this many times.
+BATCH_MAX_ROUNDS = 3
+# OpenAI accepts at most 50,000 requests per batch input file.
+MAX_BATCH_REQUESTS = 50_000
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    target_dir: Path
+    category: str
+    body: Dict[str, Any]
+    cache_key: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    retryable: bool = False
+
+
+def build_batch_jsonl(requests: Iterable[BatchRequest]) -> bytes:
+    lines = [
+        json.dumps({"custom_id": req.custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": req.body})
+        for req in requests
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def submit_batch(client: Any, requests: List[BatchRequest]) -> Any:
+    """Upload ``requests`` as a JSONL file and create a batch; return the batch object."""
+
+    data = build_batch_jsonl(requests)
+    uploaded = client.files.create(file=("scrape_backfill.jsonl", data, "application/jsonl"), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=uploaded.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+        metadata={"source": "aiscrape-backfill"},
+    )
+    logger.info("📦 Submitted AIScrape batch %s with %d request(s) (%d bytes)", batch.id, len(requests), len(data))
+    return batch
+
+
+def wait_for_batch(
+    client: Any,
+    batch_id: str,
+    poll_interval: float = BATCH_POLL_SECONDS,
+    on_status: Optional[Callable[[Any], None]] = None,
+    timeout: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Optional[Any]:
+    """Poll ``batch_id`` until it reaches a terminal status; transient errors are retried.
+
+    Returns ``None`` if the batch is still running after ``timeout`` seconds
+    (``0`` checks exactly once) or once ``cancel`` is set.
+    """
+
+    deadline = None if timeout is None else time.monotonic() + max(0.0, timeout)
+    last_status = None
+    while True:
+        try:
+            batch = client.batches.retrieve(batch_id)
+        except Exception as exc:
+            retryable, _, _ = classify_error(exc)
+            if not retryable:
+                raise
+            logger.warning("⚠️ Polling batch %s failed (%s); retrying", batch_id, exc)
+        else:
+            if batch.status != last_status:
+                last_status = batch.status
+                logger.info("📦 Batch %s is %s (%s)", batch_id, batch.status, getattr(batch, "request_counts", None))
+                if on_status is not None:
+                    on_status(batch)
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+        delay = poll_interval
+        if deadline is not None:
+            delay = min(delay, deadline - time.monotonic())
+            if delay <= 0:
+                return None
+        if cancel is not None:
+            if cancel.wait(delay):
+                return None
+        else:
+            time.sleep(delay)
+
+
+def response_text_from_body(body: Dict[str, Any]) -> str:
+    """Output text of a ``/v1/responses`` body as returned in batch output."""
+
+    if isinstance(body.get("output_text"), str) and body["output_text"].strip():
+        return body["output_text"].strip()
+    collected: List[str] = []
+    for item in body.get("output") or []:
+        for content in (item.get("content") or []) if isinstance(item, dict) else []:
+            if isinstance(content, dict) and content.get("type") == "output_text":
+                collected.append(str(content.get("text", "")))
+    combined = "\n".join(part.strip() for part in collected if part).strip()
+    if not combined:
+        raise ValueError("OpenAI response did not contain any text output")
+    return combined
+
+
+def parse_batch_results(text: str) -> Dict[str, BatchResult]:
+    """Parse batch output/error JSONL into results keyed by ``custom_id``."""
+
+    results: Dict[str, BatchResult] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        custom_id = str(record.get("custom_id", ""))
+        response = record.get("response") or {}
+        status = response.get("status_code")
+        body = response.get("body") or {}
+        if record.get("error") or status != 200:
+            error = record.get("error") or body.get("error") or {}
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            retryable = isinstance(status, int) and (status == 429 or status >= 500)
+            results[custom_id] = BatchResult(custom_id, error=f"HTTP {status}: {message}", retryable=retryable)
+            continue
+        try:
+            results[custom_id] = BatchResult(custom_id, text=response_text_from_body(body))
+        except ValueError as exc:
+            results[custom_id] = BatchResult(custom_id, error=str(exc))
+    return results
+
+
+def fetch_batch_results(client: Any, batch: Any) -> Dict[str, BatchResult]:
+    results: Dict[str, BatchResult] = {}
+    for file_id in (getattr(batch, "error_file_id", None), getattr(batch, "output_file_id", None)):
+        if file_id:
+            results.update(parse_batch_results(client.files.content(file_id).text))
+    return results
+
+
+def delete_batch_files(client: Any, batch: Any) -> None:
+    for name in ("input_file_id", "output_file_id", "error_file_id"):
+        file_id = getattr(batch, name, None)
+        if not file_id:
+            continue
+        try:
+            client.files.delete(file_id)
+        except Exception as exc:
+            logger.warning("⚠️ Could not delete batch file %s: %s", file_id, exc)
+
+
+class BatchBackfillState:
+    """JSON record of submitted batches for one company's ``openapiscrape`` folder."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if isinstance(data, dict) and isinstance(data.get("batches"), dict):
+            self.batches = {str(k): v for k, v in data["batches"].items() if isinstance(v, dict)}
+
+    @classmethod
+    def for_scrape_root(cls, scrape_root: Path) -> "BatchBackfillState":
+        return cls(scrape_root / BATCH_STATE_FILENAME)
+
+    def add(self, batch_id: str, account: str, requests: List[BatchRequest], round_no: int = 1) -> None:
+        with self._lock:
+            self.batches[batch_id] = {
+                "account": account,
+                "submitted": time.time(),
+                "round": round_no,
+                "requests": {
+                    req.custom_id: {
+                        "target_dir": str(req.target_dir),
+                        "category": req.category,
+                        "cache_key": req.cache_key,
+                        "body": req.body,
+                    }
+                    for req in requests
+                },
+            }
+            self._save_locked()
+
+    def pending(self, account: str) -> List[str]:
+        with self._lock:
+            return [batch_id for batch_id, rec in self.batches.items() if rec.get("account") == account]
+
+    def pending_custom_ids(self, account: str) -> Set[str]:
+        """``custom_id`` of every request still waiting in a batch for ``account``."""
+
+        with self._lock:
+            return {
+                str(custom_id)
+                for rec in self.batches.values()
+                if rec.get("account") == account
+                for custom_id in (rec.get("requests") or {})
+            }
+
+    def requests(self, batch_id: str) -> Dict[str, BatchRequest]:
+        """Rebuild the recorded requests of ``batch_id`` that carry a body, keyed by ``custom_id``."""
+
+        with self._lock:
+            recorded = (self.batches.get(batch_id) or {}).get("requests") or {}
+            return {
+                str(custom_id): BatchRequest(
+                    custom_id=str(custom_id),
+                    target_dir=Path(meta["target_dir"]),
+                    category=str(meta["category"]),
+                    body=meta["body"],
+                    cache_key=meta.get("cache_key"),
+                )
+                for custom_id, meta in recorded.items()
+                if isinstance(meta, dict) and isinstance(meta.get("body"), dict)
+            }
+
+    def record(self, batch_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.batches.get(batch_id, {}))
+
+    def remove(self, batch_id: str) -> None:
+        with self._lock:
+            if self.batches.pop(batch_id, None) is not None:
+                self._save_locked()
+
+    def _save_locked(self) -> None:
+        payload = json.dumps({"version": 1, "batches": self.batches}, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".scrape_batches.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp_name, self.path)
+        except OSError as exc:
+            logger.warning("⚠️ Could not save AIScrape batch state %s: %s", self.path, exc)
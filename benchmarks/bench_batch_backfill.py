@@ -0,0 +1,149 @@
+"""Run an AIScrape Batch API backfill against the local fake OpenAI endpoint.
+
+Usage::
+
+    python benchmarks/bench_batch_backfill.py [--pdfs 15] [--mode pdf|text]
+                                              [--fail-rate 0.2] [--batch-seconds 2]
+
+Builds synthetic reports (see ``bench_multi_category``), then runs
+``ScrapeManagerMixin._run_batch_backfill`` over every (PDF, category) job
+and checks, exiting non-zero on failure, that:
+
+* the backfill submits one JSONL batch and returns without waiting for it,
+  with no interactive calls;
+* backfilling the same jobs again while the batch is pending (as after a
+  restart) submits nothing new;
+* a fresh app instance collects the recorded batch, resubmits failed lines
+  from their recorded bodies in later rounds and reports every job exactly
+  once;
+* every job ends with a CSV or an error and no batch stays recorded.
+
+Needs the ``openai`` and ``PyMuPDF`` packages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Counter as CounterType, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from batch_backfill import BatchBackfillState  # noqa: E402
+from bench_multi_category import BenchApp, build_entries, build_jobs  # noqa: E402
+from constants import COLUMNS  # noqa: E402
+from fake_openai_server import FakeOpenAIConfig, start_server  # noqa: E402
+from upload_registry import account_fingerprint  # noqa: E402
+
+
+API_KEY = "sk-bench"
+
+
+def collect_until_done(app: BenchApp, scrape_root: Path, deadline: float) -> CounterType[str]:
+    """Poll the recorded batches the way the app's background poll does; count results per custom_id."""
+
+    reported: CounterType[str] = Counter()
+    errors: List[str] = []
+
+    def on_result(custom_id: str, _multiplier: Optional[str], error: Optional[str]) -> None:
+        reported[custom_id] += 1
+        if error is not None:
+            errors.append(f"{custom_id}: {error}")
+
+    client = app._openai_client(API_KEY)
+    account = account_fingerprint(API_KEY, app.get_openai_base_url())
+    state = BatchBackfillState.for_scrape_root(scrape_root)
+    cache = app._scrape_response_cache(scrape_root)
+    while time.monotonic() < deadline:
+        _, remaining = app._collect_scrape_batches(client, state, account, cache, on_result)
+        if not remaining:
+            break
+        time.sleep(0.25)
+    app.finished["errors"] = errors
+    return reported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=15)
+    parser.add_argument("--mode", choices=("pdf", "text"), default="pdf")
+    parser.add_argument("--fail-rate", type=float, default=0.2)
+    parser.add_argument("--batch-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    failures: List[str] = []
+
+    def check(ok: bool, message: str) -> None:
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+        if not ok:
+            failures.append(message)
+
+    server, stats = start_server(
+        FakeOpenAIConfig(fail_rate=args.fail_rate, batch_seconds=args.batch_seconds, seed=7)
+    )
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    print(
+        f"{args.pdfs} PDFs x {len(COLUMNS)} categories ({args.mode} mode), "
+        f"{args.fail_rate:.0%} injected line failures, batches complete after ~{args.batch_seconds:.1f}s"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        entries = build_entries(root, args.pdfs)
+        scrape_root = root / "company" / "openapiscrape"
+        keys = {f"{entry.path.stem}/{category}" for entry in entries for category in COLUMNS}
+        account = account_fingerprint(API_KEY, base_url)
+
+        app = BenchApp(base_url, workers=4)
+        start = time.perf_counter()
+        app._run_batch_backfill(build_jobs(entries, scrape_root, args.mode), API_KEY, scrape_root, bypass_cache=True)
+        submit_time = time.perf_counter() - start
+        pending = BatchBackfillState.for_scrape_root(scrape_root)
+        check(stats.batches == 1, f"one batch submitted (batches={stats.batches})")
+        check(
+            app.finished.get("pending") == 1 and stats.batch_lines == 0,
+            f"the run returned after {submit_time:.2f}s without waiting for the batch",
+        )
+        check(pending.pending_custom_ids(account) == keys, "every job is recorded in the pending batch")
+
+        uploads_before = stats.uploads
+        restarted = BenchApp(base_url, workers=4)
+        restarted._run_batch_backfill(
+            build_jobs(entries, scrape_root, args.mode), API_KEY, scrape_root, bypass_cache=True
+        )
+        check(
+            stats.batches == 1 and stats.uploads == uploads_before,
+            f"re-running while pending submits nothing (batches={stats.batches}, uploads={stats.uploads - uploads_before})",
+        )
+
+        start = time.perf_counter()
+        collector = BenchApp(base_url, workers=4)
+        reported = collect_until_done(collector, scrape_root, time.monotonic() + 60)
+        collect_time = time.perf_counter() - start
+        errors = len(collector.finished.get("errors", []))
+        written = sum(1 for _ in scrape_root.glob("*/*.csv"))
+        check(set(reported) == keys, f"resumed collection reported every job ({len(reported)}/{len(keys)})")
+        check(all(count == 1 for count in reported.values()), "no job was reported twice")
+        if stats.injected:
+            check(stats.batches > 1, f"failed lines were resubmitted (batches={stats.batches})")
+        check(written + errors == len(keys), f"every job has a CSV or an error (csv={written} errors={errors})")
+        check(not BatchBackfillState.for_scrape_root(scrape_root).batches, "no batch is left recorded")
+        check(stats.requests == 0, f"no interactive requests (requests={stats.requests})")
+    server.shutdown()
+
+    print(
+        f"submit: {submit_time:5.2f}s  collect: {collect_time:5.2f}s  batches={stats.batches} "
+        f"batch_lines={stats.batch_lines} injected={stats.injected} uploads={stats.uploads}"
+    )
+    if failures:
+        raise SystemExit(f"{len(failures)} check(s) failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Micro-benchmark for the Combined dataset merge.
+
+Usage::
+
+    python benchmarks/bench_combined.py [--pdfs 30] [--rows 200] [--dates 4]
+
+Builds a synthetic company (PDFs × Financial/Income/Shares × rows) and
+compares the previous per-row merge of ``create_combined_dataset`` with
+:func:`combined_utils.pivot_scrape_tables`. Both must produce identical
+rows, NOTE conflicts and duplicate reports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from combined_utils import pivot_scrape_tables  # noqa: E402
+from constants import COLUMNS  # noqa: E402
+
+
+Table = Tuple[str, str, List[str], List[List[str]]]
+
+
+def build_company(pdfs: int, rows: int, dates: int, seed: int = 11) -> Tuple[List[Table], List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    tables: List[Table] = []
+    dyn_cols: List[Dict[str, Any]] = []
+    for pdf_index in range(pdfs):
+        pdf_name = f"report_{2000 + pdf_index}.pdf"
+        year = 2000 + pdf_index
+        date_labels = [f"30.06.{year - offset}" for offset in range(dates)]
+        for idx, label in enumerate(date_labels):
+            dyn_cols.append(
+                {
+                    "pdf": pdf_name,
+                    "index": idx,
+                    "labels": {typ: label for typ in COLUMNS},
+                    "display_label": f"{pdf_name}:{label}",
+                    "default_name": label,
+                }
+            )
+        for typ in COLUMNS:
+            header = ["CATEGORY", "SUBCATEGORY", "ITEM", "NOTE"] + date_labels
+            table_rows = []
+            for row_index in range(rows):
+                values = [str(rng.randint(-50000, 50000)) for _ in date_labels]
+                note = "asis" if row_index % 7 else ""
+                table_rows.append(
+                    [f"{typ} section {row_index % 12}", f"group {row_index % 5}", f"line item {row_index}", note]
+                    + values
+                )
+            tables.append((pdf_name, typ, header, table_rows))
+    return tables, dyn_cols
+
+
+def legacy_merge(tables: List[Table], dyn_cols: List[Dict[str, Any]]):
+    """The merge loop as it was written inline in ``create_combined_dataset``."""
+
+    conflicts_by_key: Dict[Tuple[str, str, str, str], List[str]] = {}
+    duplicate_tracker: Dict[Tuple[str, str], Dict[Tuple[str, str, str], List[Dict[str, str]]]] = {}
+    key_data: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+    for pdf, typ, header, rows in tables:
+        normalized_header = [col.strip() for col in header]
+        for row in rows or [[]]:
+            padded = list(row[: len(normalized_header)])
+            if len(padded) < len(normalized_header):
+                padded.extend([""] * (len(normalized_header) - len(padded)))
+            mapping = dict(zip(normalized_header, padded))
+            category = str(mapping.get("CATEGORY", "")).strip()
+            subcategory = str(mapping.get("SUBCATEGORY", "")).strip()
+            item = str(mapping.get("ITEM", "")).strip()
+            note_val = mapping.get("NOTE", "")
+            row_info = {
+                "type": str(mapping.get("TYPE", typ) or typ),
+                "category": category,
+                "subcategory": subcategory,
+                "item": item,
+                "note": str(note_val),
+                "pdf": pdf,
+            }
+            duplicate_tracker.setdefault((pdf, typ), {}).setdefault((category, subcategory, item), []).append(row_info)
+            key = (category, subcategory, item, typ)
+            record = key_data.setdefault(key, {"NOTE": "", "values_by_dyn": {}})
+            if note_val:
+                existing_note = record.get("NOTE")
+                if existing_note and existing_note.strip().lower() != note_val.strip().lower():
+                    entries = conflicts_by_key.setdefault(key, [])
+                    seen = {v.lower() for v in entries}
+                    for candidate in (existing_note, note_val):
+                        if str(candidate).lower() not in seen:
+                            entries.append(str(candidate))
+                            seen.add(str(candidate).lower())
+                else:
+                    record["NOTE"] = note_val
+            col_list = record.setdefault("values_by_dyn", {})
+            for dc in dyn_cols:
+                pdf_name = dc.get("pdf")
+                idx = dc.get("index")
+                if pdf_name != pdf or idx is None:
+                    continue
+                label = dc.get("labels", {}).get(typ, "")
+                value = mapping.get(label, "") if label else ""
+                if label:
+                    col_list[(pdf_name, idx)] = value
+    duplicate_rows: Dict[Tuple[str, str], List[Dict[str, str]]] = {}
+    for table_key, key_map in duplicate_tracker.items():
+        for rows in key_map.values():
+            if len(rows) > 1:
+                duplicate_rows.setdefault(table_key, []).extend(rows)
+
+    out = []
+    for key in sorted(key_data, key=lambda k: (k[0], k[1], k[2])):
+        values_map = key_data[key]["values_by_dyn"]
+        values = [values_map.get((str(dc["pdf"]), int(dc["index"])), "") for dc in dyn_cols]
+        out.append([*key, key_data[key]["NOTE"], *values])
+    return out, conflicts_by_key, duplicate_rows
+
+
+def pivot_merge(tables: List[Table], dyn_cols: List[Dict[str, Any]]):
+    pivot = pivot_scrape_tables(tables, dyn_cols)
+    order = sorted(range(len(pivot.keys)), key=lambda i: pivot.keys[i][:3])
+    out = [[*pivot.keys[i], pivot.notes[i], *pivot.values[i]] for i in order]
+    return out, pivot.conflicts, pivot.duplicates
+
+
+def best_of(func, repeats: int, *args):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--dates", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    tables, dyn_cols = build_company(args.pdfs, args.rows, args.dates)
+    legacy_time, legacy = best_of(legacy_merge, args.repeats, tables, dyn_cols)
+    pivot_time, pivot = best_of(pivot_merge, args.repeats, tables, dyn_cols)
+    if legacy != pivot:
+        raise SystemExit("❌ Pivot output differs from the legacy merge")
+
+    print(
+        f"{args.pdfs} PDFs × {len(COLUMNS)} types × {args.rows} rows, "
+        f"{len(dyn_cols)} date columns → {len(pivot[0])} combined rows"
+    )
+    print(f"legacy merge : {legacy_time * 1000:8.1f} ms")
+    print(f"pivot merge  : {pivot_time * 1000:8.1f} ms  ({legacy_time / pivot_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
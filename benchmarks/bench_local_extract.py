@@ -0,0 +1,174 @@
+"""Compare AIScrape with and without the local table-extraction fast path.
+
+Usage::
+
+    python benchmarks/bench_local_extract.py [--pdfs 8] [--latency-ms 2000]
+
+Builds reports with a clean Statement of Financial Position (word layout on
+even reports, ruled table on odd ones), an Income statement and a shares
+note, starts ``fake_openai_server`` and runs
+``ScrapeManagerMixin._run_scrape_jobs`` twice: OpenAI only, then with
+``local_table_extract`` enabled. Reports requests sent, the path each job
+took (from ``.scrape_jobs.json``) and wall time. Needs the ``openai`` and
+``PyMuPDF`` packages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fitz  # noqa: E402
+
+from bench_multi_category import BenchApp  # noqa: E402
+from fake_openai_server import FakeOpenAIConfig, start_server  # noqa: E402
+from models import ScrapeJob  # noqa: E402
+from pdf_utils import PDFEntry  # noqa: E402
+from scrape_scheduler import SCRAPE_JOB_STATE_FILENAME  # noqa: E402
+
+
+Row = Tuple[str, Optional[Tuple[str, str, str]]]
+
+FINANCIAL: List[Row] = [
+    ("ASSETS", None),
+    ("Current assets", None),
+    ("Cash and cash equivalents", ("5", "12,345", "10,000")),
+    ("Trade and other receivables", ("6", "4,000", "3,500")),
+    ("Total current assets", ("", "16,345", "13,500")),
+    ("Non-current assets", None),
+    ("Property, plant and equipment", ("7", "20,000", "19,000")),
+    ("Intangible assets", ("8", "1,655", "1,500")),
+    ("Total non-current assets", ("", "21,655", "20,500")),
+    ("Total assets", ("", "38,000", "34,000")),
+    ("LIABILITIES", None),
+    ("Trade and other payables", ("9", "5,000", "4,000")),
+    ("Borrowings", ("10", "3,000", "-")),
+    ("Total liabilities", ("", "8,000", "4,000")),
+    ("EQUITY", None),
+    ("Issued capital", ("11", "25,000", "25,000")),
+    ("Retained earnings", ("", "5,000", "5,000")),
+    ("Total equity", ("", "30,000", "30,000")),
+]
+INCOME: List[Row] = [
+    ("Revenue from contracts with customers", ("3", "50,000", "45,000")),
+    ("Cost of sales", ("", "(30,000)", "(27,000)")),
+    ("Gross profit", ("", "20,000", "18,000")),
+    ("Administrative expenses", ("", "(5,000)", "(4,500)")),
+    ("Finance costs", ("5", "(1,000)", "(900)")),
+    ("Profit before income tax", ("", "14,000", "12,600")),
+    ("Income tax expense", ("6", "(4,200)", "(3,780)")),
+    ("Profit for the year", ("", "9,800", "8,820")),
+]
+
+
+def draw_statement(page: Any, title: str, rows: Sequence[Row], ruled: bool) -> None:
+    page.insert_text((72, 30), "Example Holdings Limited Annual Report 2024", fontsize=8)
+    page.insert_text((72, 70), title, fontsize=12)
+    page.insert_text((72, 86), "For the year ended 30 June 2024", fontsize=9)
+    page.insert_text((300, 110), "Notes", fontsize=9)
+    for x, text in ((390, "2024"), (470, "2023")):
+        page.insert_text((x, 110), text, fontsize=9)
+        page.insert_text((x, 122), "$'000", fontsize=9)
+    y = 140
+    for label, values in rows:
+        page.insert_text((72, y), label, fontsize=9)
+        if values:
+            page.insert_text((305, y), values[0], fontsize=9)
+            for x, value in zip((425, 505), values[1:]):
+                page.insert_text((x - fitz.get_text_length(value, fontsize=9), y), value, fontsize=9)
+        if ruled:
+            page.draw_line((60, y + 4), (520, y + 4))
+        y += 14
+    if ruled:
+        page.draw_line((60, 100), (520, 100))
+        page.draw_line((60, 126), (520, 126))
+        for x in (60, 295, 340, 430, 520):
+            page.draw_line((x, 100), (x, y - 10))
+
+
+def build_entries(root: Path, pdfs: int) -> List[PDFEntry]:
+    entries = []
+    for idx in range(pdfs):
+        doc = fitz.open()
+        for _ in range(3):
+            doc.new_page().insert_text((72, 72), "Directors' report")
+        draw_statement(doc.new_page(), "Consolidated Statement of Financial Position", FINANCIAL, idx % 2 == 1)
+        draw_statement(doc.new_page(), "Consolidated Statement of Profit or Loss", INCOME, idx % 2 == 1)
+        doc.new_page().insert_text((72, 72), "Note 11 Issued capital\nOrdinary shares fully paid 125,000,000")
+        path = root / f"report_{2000 + idx}.pdf"
+        doc.save(path)
+        entries.append(PDFEntry(path=path, doc=fitz.open(path)))
+    return entries
+
+
+def build_jobs(entries: List[PDFEntry], scrape_root: Path) -> List[ScrapeJob]:
+    pages = {"Financial": [3], "Income": [4], "Shares": [5]}
+    return [
+        ScrapeJob(
+            entry=entry,
+            category=category,
+            pages=category_pages,
+            prompt_text=f"Extract the {category} statement as CSV.",
+            model_name="fake",
+            upload_mode="pdf",
+            target_dir=scrape_root / entry.path.stem,
+        )
+        for entry in entries
+        for category, category_pages in pages.items()
+    ]
+
+
+def run(args: argparse.Namespace, local: bool, root: Path, entries: List[PDFEntry]) -> Dict[str, Any]:
+    server, stats = start_server(FakeOpenAIConfig(latency_ms=args.latency_ms))
+    app = BenchApp(f"http://127.0.0.1:{server.server_address[1]}/v1", args.workers)
+    app.config = SimpleNamespace(local_table_extract=local, response_cache_max_mb=0)
+    scrape_root = root / ("local" if local else "openai") / "openapiscrape"
+    jobs = build_jobs(entries, scrape_root)
+    start = time.perf_counter()
+    app._run_scrape_jobs(jobs, "sk-bench", bypass_cache=True)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    recorded = json.loads((scrape_root / SCRAPE_JOB_STATE_FILENAME).read_text(encoding="utf-8"))["jobs"]
+    return {
+        "jobs": len(jobs),
+        "elapsed": elapsed,
+        "requests": stats.requests,
+        "paths": Counter(rec.get("source", "?") for rec in recorded.values()),
+        "errors": len(app.finished.get("errors", [])),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=2000.0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        entries = build_entries(root, args.pdfs)
+        results = {label: run(args, local, root, entries) for label, local in (("openai only", False), ("local first", True))}
+
+    print(f"{args.pdfs} PDFs x 3 categories, {args.workers} workers, ~{args.latency_ms:.0f} ms per OpenAI call")
+    for label, res in results.items():
+        paths = " ".join(f"{name}={count}" for name, count in sorted(res["paths"].items()))
+        print(
+            f"{label:12s}: {res['elapsed']:6.2f}s  requests={res['requests']:3d}  {paths}  errors={res['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Compare per-category and batched multi-category AIScrape throughput.
+
+Usage::
+
+    python benchmarks/bench_multi_category.py [--pdfs 12] [--workers 4] [--rpm 60]
+                                              [--latency-ms 600] [--mode pdf|text]
+
+Builds synthetic reports whose Financial, Income and Shares pages sit in one
+small page range, starts ``fake_openai_server`` and runs
+``ScrapeManagerMixin._run_scrape_jobs`` over the same jobs twice: once with
+one request per (PDF, category) and once with one batched request per PDF.
+The response cache is bypassed so both runs reach the server. Needs the
+``openai`` and ``PyMuPDF`` packages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fitz  # noqa: E402
+
+from constants import COLUMNS  # noqa: E402
+from fake_openai_server import FakeOpenAIConfig, start_server  # noqa: E402
+from models import ScrapeJob  # noqa: E402
+from pdf_manager import PDFManagerMixin  # noqa: E402
+from pdf_utils import PDFEntry  # noqa: E402
+from scrape_manager import ScrapeManagerMixin  # noqa: E402
+
+
+class _Root:
+    """Runs the end-of-run callbacks inline and drops UI progress updates."""
+
+    def after(self, _delay: int, callback: Any, *args: Any) -> None:
+        if getattr(callback, "__name__", "") in {"_on_scrape_jobs_finished", "_on_batch_backfill_finished"}:
+            callback(*args)
+
+
+class BenchApp(ScrapeManagerMixin):
+    export_pages_to_bytes = PDFManagerMixin.export_pages_to_bytes
+    extract_pages_text = PDFManagerMixin.extract_pages_text
+    extract_pages_text_compacted = PDFManagerMixin.extract_pages_text_compacted
+    _selected_page_texts = PDFManagerMixin._selected_page_texts
+    _cached_page_texts = PDFManagerMixin._cached_page_texts
+
+    def __init__(self, base_url: str, workers: int) -> None:
+        self.root = _Root()
+        self.thread_count = workers
+        self.base_url = base_url
+        self.finished: Dict[str, Any] = {}
+        self._batch_collect_lock = threading.Lock()
+        self._batch_poll_after: Optional[str] = None
+        self._batch_poll_cancel = threading.Event()
+
+    def get_openai_base_url(self) -> str:
+        return self.base_url
+
+    def _on_scrape_jobs_finished(self, total: int, errors: List[str], summary: Optional[str] = None) -> None:
+        self.finished = {"total": total, "errors": errors}
+
+    def _on_batch_backfill_finished(
+        self, total: int, errors: List[str], pending: int, _api_key: str, _scrape_root: Path
+    ) -> None:
+        self.finished = {"total": total, "errors": errors, "pending": pending}
+
+
+def build_entries(root: Path, pdfs: int) -> List[PDFEntry]:
+    entries = []
+    for idx in range(pdfs):
+        doc = fitz.open()
+        for page in range(40):
+            doc.new_page().insert_text((72, 72), f"Report {idx} page {page}\nRevenue {idx * 100 + page}")
+        path = root / f"report_{2000 + idx}.pdf"
+        doc.save(path)
+        entries.append(PDFEntry(path=path, doc=fitz.open(path)))
+    return entries
+
+
+def build_jobs(entries: List[PDFEntry], scrape_root: Path, mode: str) -> List[ScrapeJob]:
+    jobs = []
+    for idx, entry in enumerate(entries):
+        start = 10 + idx % 5
+        for offset, category in enumerate(COLUMNS):
+            pages = [start + offset * 2, start + offset * 2 + 1]
+            jobs.append(
+                ScrapeJob(
+                    entry=entry,
+                    category=category,
+                    pages=pages,
+                    prompt_text=f"Extract the {category} statement as CSV. " * 20,
+                    model_name="fake",
+                    upload_mode=mode,
+                    target_dir=scrape_root / entry.path.stem,
+                )
+            )
+    return jobs
+
+
+def run(args: argparse.Namespace, batched: bool, root: Path, entries: List[PDFEntry]) -> Dict[str, Any]:
+    config = FakeOpenAIConfig(rpm=args.rpm, latency_ms=args.latency_ms)
+    server, stats = start_server(config)
+    app = BenchApp(f"http://127.0.0.1:{server.server_address[1]}/v1", args.workers)
+    scrape_root = root / ("batched" if batched else "per_category") / "openapiscrape"
+    jobs = build_jobs(entries, scrape_root, args.mode)
+    start = time.perf_counter()
+    app._run_scrape_jobs(jobs, "sk-bench", bypass_cache=True, batched=batched)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    written = sum(1 for _ in scrape_root.glob("*/*.csv"))
+    return {
+        "jobs": len(jobs),
+        "elapsed": elapsed,
+        "requests": stats.requests,
+        "uploads": stats.uploads,
+        "limited": stats.limited,
+        "csv": written,
+        "errors": len(app.finished.get("errors", [])),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rpm", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=600.0)
+    parser.add_argument("--mode", choices=("pdf", "text"), default="pdf")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        entries = build_entries(root, args.pdfs)
+        results = {label: run(args, batched, root, entries) for label, batched in (("per-category", False), ("batched", True))}
+
+    print(
+        f"{args.pdfs} PDFs x {len(COLUMNS)} categories ({args.mode} mode), {args.workers} workers, "
+        f"server limit {args.rpm} rpm, ~{args.latency_ms:.0f} ms latency"
+    )
+    for label, res in results.items():
+        print(
+            f"{label:12s}: {res['elapsed']:6.2f}s  {res['jobs'] / res['elapsed']:5.2f} jobs/s  "
+            f"requests={res['requests']:3d} uploads={res['uploads']:3d} 429s={res['limited']:3d} "
+            f"csv={res['csv']:3d} errors={res['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare page-scan throughput of the thread and process engines.
+
+Usage::
+
+    python benchmarks/bench_page_scan.py [PDF_FOLDER] [--workers N]
+
+Without a folder a set of synthetic annual reports is generated in a
+temporary directory. Results are printed as pages/sec for each engine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import fitz  # type: ignore[import-untyped]  # noqa: E402
+
+from constants import DEFAULT_PATTERNS, YEAR_DEFAULT_PATTERNS  # noqa: E402
+from page_scan import extract_page_texts, scan_pdf_path, scan_texts  # noqa: E402
+
+
+FILLER = (
+    "The Group continued to invest in its operations during the year. Revenue from "
+    "contracts with customers is recognised when control of goods passes. "
+)
+
+
+def _build_synthetic_pdfs(target: Path, count: int, pages: int) -> List[Path]:
+    headings = [
+        "Consolidated statement of financial position",
+        "Consolidated statement of profit or loss",
+        "Directors' report",
+        "Notes to the financial statements",
+    ]
+    paths: List[Path] = []
+    for pdf_index in range(count):
+        doc = fitz.open()
+        for page_index in range(pages):
+            page = doc.new_page()
+            heading = headings[page_index % len(headings)]
+            body = f"Annual Report 20{10 + pdf_index % 15}\n{heading}\n" + FILLER * 20
+            page.insert_textbox(fitz.Rect(36, 36, 560, 800), body, fontsize=8)
+        path = target / f"report_{pdf_index:02d}.pdf"
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def _compile() -> Tuple[dict, list]:
+    pattern_map = {
+        column: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for column, patterns in DEFAULT_PATTERNS.items()
+    }
+    year_patterns = [re.compile(p, re.IGNORECASE) for p in YEAR_DEFAULT_PATTERNS]
+    return pattern_map, year_patterns
+
+
+def _thread_scan(path: Path, pattern_map: dict, year_patterns: list) -> int:
+    doc = fitz.open(path)
+    try:
+        texts = extract_page_texts(doc)
+    finally:
+        doc.close()
+    scan_texts(texts, pattern_map, year_patterns)
+    return len(texts)
+
+
+def run(paths: List[Path], workers: int) -> None:
+    pattern_map, year_patterns = _compile()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = sum(executor.map(lambda p: _thread_scan(p, pattern_map, year_patterns), paths))
+    thread_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(scan_pdf_path, paths, [pattern_map] * len(paths), [year_patterns] * len(paths))
+        )
+    process_elapsed = time.perf_counter() - start
+    process_pages = sum(result.page_count for result in results)
+
+    print(f"PDFs: {len(paths)}  pages: {pages}  workers: {workers}")
+    print(f"thread  : {thread_elapsed:7.2f}s  {pages / thread_elapsed:9.1f} pages/sec")
+    print(f"process : {process_elapsed:7.2f}s  {process_pages / process_elapsed:9.1f} pages/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", nargs="?", help="Folder of PDFs to scan (synthetic if omitted)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--count", type=int, default=8, help="Synthetic PDF count")
+    parser.add_argument("--pages", type=int, default=200, help="Pages per synthetic PDF")
+    args = parser.parse_args()
+
+    if args.folder:
+        paths = sorted(Path(args.folder).rglob("*.pdf"))
+        run(paths, args.workers)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _build_synthetic_pdfs(Path(tmp), args.count, args.pages)
+        run(paths, args.workers)
+
+
+if __name__ == "__main__":
+    main()
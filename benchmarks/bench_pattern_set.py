@@ -0,0 +1,124 @@
+"""Micro-benchmark for page classification with :class:`page_scan.PatternSet`.
+
+Usage::
+
+    python benchmarks/bench_pattern_set.py [--pages 300] [--patterns 60]
+
+Builds a synthetic 300-page report and a pattern list split across the
+review categories, then compares the plain page × pattern ``search`` loop
+with the literal-prefiltered pattern set. Both must produce identical
+matches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from constants import COLUMNS  # noqa: E402
+from page_scan import PatternSet, RawMatch  # noqa: E402
+
+
+WORDS = (
+    "revenue expenses group company consolidated notes directors auditor "
+    "cash flows equity liabilities assets dividends segment impairment tax "
+    "operating investing financing reserves goodwill borrowings leases"
+).split()
+HEADINGS = [
+    "Consolidated statement of financial position",
+    "Consolidated statement of profit or loss",
+    "Statement of changes in equity",
+    "Consolidated statement of cash flows",
+    "Shares on issue",
+]
+
+
+def build_pages(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    pages = []
+    for index in range(count):
+        body = " ".join(rng.choice(WORDS) for _ in range(450))
+        heading = HEADINGS[index % len(HEADINGS)] if index % 9 == 0 else ""
+        pages.append(f"Annual Report 2023\n{heading}\n{body}\nPage {index + 1}")
+    return pages
+
+
+def build_patterns(count: int) -> Dict[str, List[re.Pattern[str]]]:
+    templates = [
+        r"statement of {word} position",
+        r"consolidated {word} statement",
+        r"{word} per share",
+        r"summary of {word} results",
+        r"notes to the {word}",
+    ]
+    pattern_map: Dict[str, List[re.Pattern[str]]] = {column: [] for column in COLUMNS}
+    for index in range(count):
+        column = COLUMNS[index % len(COLUMNS)]
+        text = templates[index % len(templates)].format(word=WORDS[index % len(WORDS)] + str(index))
+        pattern_map[column].append(re.compile(text.replace(" ", r"\s+"), re.IGNORECASE))
+    # Make sure some patterns actually hit.
+    pattern_map[COLUMNS[0]].append(re.compile(r"statement\s+of\s+financial\s+position", re.IGNORECASE))
+    pattern_map[COLUMNS[1]].append(re.compile(r"statement\s+of\s+profit\s+or\s+loss", re.IGNORECASE))
+    pattern_map[COLUMNS[-1]].append(re.compile(r"shares\s+on\s+issue", re.IGNORECASE))
+    return pattern_map
+
+
+def naive_scan(pages: List[str], pattern_map: Dict[str, List[re.Pattern[str]]]) -> Dict[str, List[RawMatch]]:
+    matches: Dict[str, List[RawMatch]] = {column: [] for column in pattern_map}
+    for page_index, text in enumerate(pages):
+        for column, patterns in pattern_map.items():
+            for pattern in patterns:
+                match_obj = pattern.search(text)
+                if match_obj:
+                    matches[column].append((page_index, pattern.pattern, match_obj.group(0).strip()))
+                    break
+    return matches
+
+
+def set_scan(pages: List[str], pattern_map: Dict[str, List[re.Pattern[str]]]) -> Dict[str, List[RawMatch]]:
+    pattern_set = PatternSet(pattern_map)
+    matches: Dict[str, List[RawMatch]] = {column: [] for column in pattern_map}
+    for page_index, text in enumerate(pages):
+        pattern_set.scan_page(page_index, text, matches)
+    return matches
+
+
+def _time(func, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--patterns", type=int, default=60)
+    args = parser.parse_args()
+
+    pages = build_pages(args.pages)
+    pattern_map = build_patterns(args.patterns)
+    total_patterns = sum(len(p) for p in pattern_map.values())
+
+    if naive_scan(pages, pattern_map) != set_scan(pages, pattern_map):
+        raise SystemExit("PatternSet results differ from the plain loop")
+
+    naive = _time(naive_scan, pages, pattern_map)
+    prefiltered = _time(set_scan, pages, pattern_map)
+    print(f"pages: {len(pages)}  patterns: {total_patterns}")
+    print(f"plain loop : {naive * 1000:8.1f} ms  {len(pages) / naive:9.0f} pages/sec")
+    print(f"pattern set: {prefiltered * 1000:8.1f} ms  {len(pages) / prefiltered:9.0f} pages/sec")
+    print(f"speed-up   : {naive / prefiltered:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
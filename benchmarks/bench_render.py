@@ -0,0 +1,93 @@
+"""Compare ms/thumbnail for the old and new page render paths.
+
+Usage::
+
+    python benchmarks/bench_render.py [PDF_OR_FOLDER] [--width 220] [--pages 40]
+
+``legacy`` renders at a fixed 1.5x zoom and downsizes with LANCZOS, as
+``render_page`` used to. ``direct`` lets MuPDF render at the target size.
+``high`` is the oversampled fullscreen path. Without an argument a synthetic
+text-heavy report is generated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import fitz  # type: ignore[import-untyped]  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from render_cache import pixmap_to_image, rasterize_page  # noqa: E402
+
+
+def legacy_render(doc: "fitz.Document", page_index: int, width: int) -> Image.Image:
+    page = doc.load_page(page_index)
+    image = pixmap_to_image(page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5)))
+    scale = width / image.width
+    return image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))), Image.LANCZOS)
+
+
+def _synthetic_pdf(target: Path, pages: int) -> Path:
+    doc = fitz.open()
+    row = "Revenue from contracts with customers    1,234,567    1,111,222\n"
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(36, 36, 560, 800), row * 60, fontsize=9)
+    path = target / "synthetic.pdf"
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _pages(paths: List[Path], limit: int) -> List[Tuple["fitz.Document", int]]:
+    pages: List[Tuple["fitz.Document", int]] = []
+    for path in paths:
+        doc = fitz.open(path)
+        for page_index in range(len(doc)):
+            pages.append((doc, page_index))
+            if len(pages) >= limit:
+                return pages
+    return pages
+
+
+def _bench(name: str, pages: List[Tuple["fitz.Document", int]], render: Callable) -> None:
+    start = time.perf_counter()
+    for doc, page_index in pages:
+        render(doc, page_index)
+    elapsed = time.perf_counter() - start
+    print(f"{name:7s}: {elapsed * 1000 / len(pages):7.2f} ms/thumbnail")
+
+
+def run(paths: List[Path], width: int, limit: int) -> None:
+    pages = _pages(paths, limit)
+    print(f"pages: {len(pages)}  width: {width}px")
+    _bench("legacy", pages, lambda d, i: legacy_render(d, i, width))
+    _bench("direct", pages, lambda d, i: rasterize_page(d, i, width))
+    _bench("high", pages, lambda d, i: rasterize_page(d, i, width, high_quality=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", help="PDF file or folder (synthetic if omitted)")
+    parser.add_argument("--width", type=int, default=220)
+    parser.add_argument("--pages", type=int, default=40)
+    args = parser.parse_args()
+
+    if args.source:
+        source = Path(args.source)
+        paths = sorted(source.rglob("*.pdf")) if source.is_dir() else [source]
+        run(paths, args.width, args.pages)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        run([_synthetic_pdf(Path(tmp), args.pages)], args.width, args.pages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Exercise the AIScrape scheduler against the local fake OpenAI endpoint.
+
+Usage::
+
+    python benchmarks/bench_scrape_scheduler.py [--jobs 40] [--workers 8] [--rpm 60]
+                                                [--fail-rate 0.15] [--latency-ms 150]
+
+Starts ``fake_openai_server`` on a free port, then runs the same batch twice:
+once on a plain fixed-size thread pool (what ``_run_scrape_jobs`` used to
+do, where every 429 is a lost job) and once through
+:class:`scrape_scheduler.ScrapeScheduler`. Requests go through ``urllib`` so
+the benchmark does not need the ``openai`` package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_openai_server import FakeOpenAIConfig, start_server  # noqa: E402
+from scrape_scheduler import RequestSlot, ScheduledJob, ScrapeJobState, ScrapeScheduler  # noqa: E402
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, status_code: int, headers: Dict[str, str]) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.headers = headers
+
+
+def post_response(base_url: str, prompt: str, slot: Optional[RequestSlot] = None) -> str:
+    payload = json.dumps({"model": "fake", "input": prompt}).encode("utf-8")
+    request = urllib.request.Request(
+        f"{base_url}/responses", data=payload, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            body = json.loads(response.read())
+            if slot is not None:
+                slot.observe(
+                    {k.lower(): v for k, v in response.headers.items()},
+                    body.get("usage", {}).get("total_tokens"),
+                )
+    except urllib.error.HTTPError as exc:
+        raise HTTPStatusError(exc.code, {k.lower(): v for k, v in exc.headers.items()}) from None
+    return body["output"][0]["content"][0]["text"]
+
+
+def run_fixed_pool(base_url: str, jobs: int, workers: int) -> Dict[str, float]:
+    ok = failed = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(post_response, base_url, f"job {idx}") for idx in range(jobs)]
+        for future in futures:
+            try:
+                future.result()
+                ok += 1
+            except Exception:
+                failed += 1
+    return {"ok": ok, "failed": failed, "elapsed": time.perf_counter() - start}
+
+
+def run_scheduler(base_url: str, jobs: int, workers: int, state_dir: Path) -> Dict[str, float]:
+    results = {"ok": 0, "failed": 0}
+
+    def on_done(job, result, error) -> None:
+        results["failed" if error else "ok"] += 1
+
+    scheduler = ScrapeScheduler(
+        lambda prompt, slot: post_response(base_url, prompt, slot),
+        on_done,
+        workers=workers,
+        state=ScrapeJobState.for_scrape_root(state_dir),
+        max_attempts=8,
+        base_delay=0.25,
+        max_delay=5.0,
+        rng=random.Random(3),
+    )
+    batch = [ScheduledJob(key=f"job{idx}", model="fake", tokens=500, payload=f"job {idx}") for idx in range(jobs)]
+    stats = scheduler.run(batch)
+    return {
+        **results,
+        "elapsed": stats.elapsed,
+        "retries": stats.retries,
+        "throttled": stats.throttled,
+        "concurrency": stats.concurrency.get("fake", 0.0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rpm", type=int, default=60)
+    parser.add_argument("--fail-rate", type=float, default=0.15)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    config = FakeOpenAIConfig(rpm=args.rpm, fail_rate=args.fail_rate, latency_ms=args.latency_ms)
+
+    server, _ = start_server(config)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    fixed = run_fixed_pool(base_url, args.jobs, args.workers)
+    server.shutdown()
+
+    # Fresh server so both runs start with an empty rate window.
+    server, stats = start_server(config)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    with tempfile.TemporaryDirectory() as tmp:
+        scheduled = run_scheduler(base_url, args.jobs, args.workers, Path(tmp))
+    server.shutdown()
+
+    print(
+        f"{args.jobs} jobs, {args.workers} workers, server limit {args.rpm} rpm, "
+        f"{args.fail_rate:.0%} injected failures, ~{args.latency_ms:.0f} ms latency"
+    )
+    print(f"fixed pool : ok={fixed['ok']:3d} failed={fixed['failed']:3d}  {fixed['elapsed']:6.2f}s")
+    print(
+        f"scheduler  : ok={scheduled['ok']:3d} failed={scheduled['failed']:3d}  {scheduled['elapsed']:6.2f}s  "
+        f"retries={scheduled['retries']} throttled={scheduled['throttled']} "
+        f"final concurrency={scheduled['concurrency']} (server saw {stats.requests} requests)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+"""Local stand-in for the OpenAI endpoints AIScrape uses.
+
+Usage::
+
+    python benchmarks/fake_openai_server.py [--port 8765] [--rpm 60] [--tpm 200000]
+                                            [--fail-rate 0.1] [--latency-ms 400] [--batch-seconds 2]
+
+Point AIScrape at it with *Configuration → OpenAI Endpoint…* set to
+``http://127.0.0.1:8765/v1`` (any API key works). The server implements
+``POST /v1/files``, ``GET``/``DELETE /v1/files/<id>``,
+``GET /v1/files/<id>/content``, ``POST /v1/batches``,
+``GET /v1/batches/<id>`` and ``POST /v1/responses``, answers with a small
+statement CSV, sends ``x-ratelimit-*`` headers, enforces the given
+requests/tokens per minute with real 429s and additionally injects random
+429/503 failures and latency. Requests using AIScrape's batched
+multi-category prompt get one marked section per category. ``"stream": true``
+responses are sent as server-sent events, one line of text per delta. Batches complete
+after ``--batch-seconds`` without rate limits; injected failures become
+per-line 500 results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import email.parser
+import email.policy
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+SAMPLE_CSV = (
+    "Multiplier: 1000\n"
+    "CATEGORY,SUBCATEGORY,ITEM,NOTE,30.06.2024,30.06.2023\n"
+    "Assets,Current assets,Cash and cash equivalents,asis,1250,1100\n"
+    "Assets,Current assets,Trade receivables,asis,830,790\n"
+    "Liabilities,Current liabilities,Trade payables,asis,-640,-610\n"
+)
+
+
+@dataclass
+class FakeOpenAIConfig:
+    rpm: int = 60
+    tpm: int = 200_000
+    fail_rate: float = 0.0
+    latency_ms: float = 300.0
+    batch_seconds: float = 2.0
+    # Delay between streamed lines of output text.
+    stream_line_ms: float = 50.0
+    seed: int = 5
+
+
+@dataclass
+class FakeOpenAIStats:
+    requests: int = 0
+    uploads: int = 0
+    deletes: int = 0
+    batches: int = 0
+    batch_lines: int = 0
+    files: Dict[str, bytes] = field(default_factory=dict)
+    limited: int = 0
+    injected: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class _Limiter:
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window: Deque[Tuple[float, int]] = deque()
+        self.lock = threading.Lock()
+
+    def admit(self, tokens: int) -> Tuple[bool, float, int, int]:
+        """Return ``(allowed, retry_after, remaining_requests, remaining_tokens)``."""
+
+        now = time.monotonic()
+        with self.lock:
+            while self.window and now - self.window[0][0] >= 60.0:
+                self.window.popleft()
+            used = sum(cost for _, cost in self.window)
+            if len(self.window) >= self.rpm or used + tokens > self.tpm:
+                retry = max(0.05, self.window[0][0] + 60.0 - now) if self.window else 1.0
+                return False, retry, max(0, self.rpm - len(self.window)), max(0, self.tpm - used)
+            self.window.append((now, tokens))
+            return True, 0.0, self.rpm - len(self.window), self.tpm - used - tokens
+
+
+_SECTION_NAME_RE = re.compile(r"=== BEGIN ([A-Za-z]+) ===")
+
+
+def _answer(body: bytes) -> str:
+    """The sample CSV, once per section when the prompt asks for marked sections."""
+
+    sections = list(dict.fromkeys(_SECTION_NAME_RE.findall(body.decode("utf-8", "replace"))))
+    if not sections:
+        return SAMPLE_CSV
+    return "\n".join(f"=== BEGIN {name} ===\n{SAMPLE_CSV}=== END {name} ===" for name in sections)
+
+
+def _wants_stream(body: bytes) -> bool:
+    try:
+        return bool(json.loads(body or b"{}").get("stream"))
+    except (ValueError, AttributeError):
+        return False
+
+
+def _referenced_files(body: bytes) -> List[str]:
+    """File ids referenced by ``input_file`` parts of a responses request."""
+
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        return []
+    found: List[str] = []
+    for message in payload.get("input", []) if isinstance(payload.get("input"), list) else []:
+        content = message.get("content") if isinstance(message, dict) else None
+        for part in content if isinstance(content, list) else []:
+            if isinstance(part, dict) and part.get("file_id"):
+                found.append(str(part["file_id"]))
+    return found
+
+
+def _multipart_file(body: bytes, content_type: str) -> Tuple[bytes, str]:
+    """Return ``(file bytes, purpose)`` from a ``multipart/form-data`` upload."""
+
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body
+    )
+    data, purpose = b"", ""
+    for part in message.iter_parts() if message.is_multipart() else []:
+        name = part.get_param("name", header="content-disposition")
+        payload = part.get_payload(decode=True) or b""
+        if name == "file":
+            data = payload
+        elif name == "purpose":
+            purpose = payload.decode("utf-8", "replace").strip()
+    return data, purpose
+
+
+def _response_object(body: bytes, response_id: str, message_id: str) -> Dict[str, Any]:
+    tokens = max(1, len(body) // 4) + 400
+    return {
+        "id": response_id,
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": "fake",
+        "output": [
+            {
+                "id": message_id,
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": _answer(body), "annotations": []}],
+            }
+        ],
+        "usage": {"input_tokens": tokens - 400, "output_tokens": 400, "total_tokens": tokens},
+    }
+
+
+def make_handler(config: FakeOpenAIConfig, stats: FakeOpenAIStats):
+    limiter = _Limiter(config.rpm, config.tpm)
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+    ids = itertools.count(1)
+    batches: Dict[str, Dict[str, Any]] = {}
+
+    def store_file(data: bytes) -> str:
+        file_id = f"file-{next(ids)}"
+        with stats.lock:
+            stats.files[file_id] = data
+        return file_id
+
+    def run_batch(batch: Dict[str, Any], lines: List[bytes]) -> None:
+        time.sleep(config.batch_seconds / 2)
+        batch["status"] = "in_progress"
+        time.sleep(config.batch_seconds / 2)
+        output: List[str] = []
+        errors: List[str] = []
+        for line in lines:
+            request = json.loads(line)
+            body = json.dumps(request.get("body", {})).encode("utf-8")
+            with rng_lock:
+                roll = rng.random()
+            with stats.lock:
+                stats.batch_lines += 1
+                missing = [fid for fid in _referenced_files(body) if fid not in stats.files]
+            result: Dict[str, Any] = {"id": f"batch_req_{next(ids)}", "custom_id": request.get("custom_id")}
+            if missing:
+                status, payload = 400, {"error": {"message": f"Invalid file id: {missing[0]}"}}
+            elif roll < config.fail_rate:
+                with stats.lock:
+                    stats.injected += 1
+                status, payload = 500, {"error": {"message": "Injected failure", "type": "server_error"}}
+            else:
+                status, payload = 200, _response_object(body, f"resp_{next(ids)}", f"msg_{next(ids)}")
+            result["response"] = {"status_code": status, "request_id": f"req_{next(ids)}", "body": payload}
+            result["error"] = None
+            (output if status == 200 else errors).append(json.dumps(result))
+        batch["output_file_id"] = store_file(("\n".join(output) + "\n").encode("utf-8")) if output else None
+        batch["error_file_id"] = store_file(("\n".join(errors) + "\n").encode("utf-8")) if errors else None
+        batch["request_counts"] = {"total": len(lines), "completed": len(output), "failed": len(errors)}
+        batch["completed_at"] = int(time.time())
+        batch["status"] = "completed"
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+            return
+
+        def _send(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+            self._send_bytes(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+        def _send_bytes(
+            self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _file_object(self, file_id: str, size: int = 0, purpose: str = "assistants") -> Dict:
+            return {
+                "id": file_id,
+                "object": "file",
+                "bytes": size,
+                "created_at": int(time.time()),
+                "filename": "upload.pdf",
+                "purpose": purpose,
+                "status": "processed",
+            }
+
+        def _path_parts(self) -> List[str]:
+            return [part for part in self.path.split("?")[0].split("/") if part]
+
+        def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+            parts = self._path_parts()
+            if len(parts) >= 2 and parts[-2] == "batches":
+                batch = batches.get(parts[-1])
+                if batch is None:
+                    self._send(404, {"error": {"message": f"No such Batch object: {parts[-1]}"}})
+                else:
+                    self._send(200, batch)
+                return
+            content = len(parts) >= 3 and parts[-1] == "content"
+            file_id = parts[-2] if content else parts[-1] if parts else ""
+            with stats.lock:
+                data = stats.files.get(file_id)
+            if data is None:
+                self._send(404, {"error": {"message": f"No such File object: {file_id}"}})
+            elif content:
+                self._send_bytes(200, data, "application/octet-stream")
+            else:
+                self._send(200, self._file_object(file_id, len(data)))
+
+        def do_DELETE(self) -> None:  # noqa: N802 - stdlib naming
+            parts = self._path_parts()
+            file_id = parts[-1] if parts else ""
+            with stats.lock:
+                known = stats.files.pop(file_id, None) is not None
+                stats.deletes += int(known)
+            if not known:
+                self._send(404, {"error": {"message": f"No such File object: {file_id}"}})
+                return
+            self._send(200, {"id": file_id, "object": "file", "deleted": True})
+
+        def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+            length = int(self.headers.get("Content-Length", 0) or 0)
+            body = self.rfile.read(length) if length else b""
+            path = self.path.rstrip("/")
+            if path.endswith("/files"):
+                data, purpose = _multipart_file(body, self.headers.get("Content-Type", ""))
+                file_id = store_file(data)
+                with stats.lock:
+                    stats.uploads += 1
+                self._send(200, self._file_object(file_id, len(data), purpose or "assistants"))
+                return
+            if path.endswith("/batches"):
+                request = json.loads(body or b"{}")
+                with stats.lock:
+                    data = stats.files.get(str(request.get("input_file_id")))
+                    stats.batches += 1
+                if data is None:
+                    self._send(400, {"error": {"message": "Unknown input_file_id"}})
+                    return
+                batch_id = f"batch_{next(ids)}"
+                batch = {
+                    "id": batch_id,
+                    "object": "batch",
+                    "endpoint": request.get("endpoint", "/v1/responses"),
+                    "input_file_id": request["input_file_id"],
+                    "completion_window": request.get("completion_window", "24h"),
+                    "status": "validating",
+                    "created_at": int(time.time()),
+                    "output_file_id": None,
+                    "error_file_id": None,
+                    "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                }
+                batches[batch_id] = batch
+                lines = [line for line in data.splitlines() if line.strip()]
+                threading.Thread(target=run_batch, args=(batch, lines), daemon=True).start()
+                self._send(200, batch)
+                return
+            if not path.endswith("/responses"):
+                self._send(404, {"error": {"message": f"Unknown path {self.path}"}})
+                return
+
+            with stats.lock:
+                stats.requests += 1
+                missing = [fid for fid in _referenced_files(body) if fid not in stats.files]
+            if missing:
+                self._send(400, {"error": {"message": f"Invalid file id: {missing[0]}", "type": "invalid_request_error"}})
+                return
+            tokens = max(1, len(body) // 4) + 400
+            with rng_lock:
+                jitter = rng.uniform(0.5, 1.5)
+                roll = rng.random()
+            time.sleep(config.latency_ms / 1000.0 * jitter)
+
+            allowed, retry_after, remaining_requests, remaining_tokens = limiter.admit(tokens)
+            limit_headers = {
+                "x-ratelimit-limit-requests": str(config.rpm),
+                "x-ratelimit-limit-tokens": str(config.tpm),
+                "x-ratelimit-remaining-requests": str(remaining_requests),
+                "x-ratelimit-remaining-tokens": str(remaining_tokens),
+                "x-ratelimit-reset-requests": f"{retry_after:.3f}s",
+                "x-ratelimit-reset-tokens": f"{retry_after:.3f}s",
+            }
+            if not allowed:
+                with stats.lock:
+                    stats.limited += 1
+                limit_headers["retry-after-ms"] = str(int(retry_after * 1000))
+                self._send(429, {"error": {"message": "Rate limit reached", "type": "requests"}}, limit_headers)
+                return
+            if roll < config.fail_rate:
+                with stats.lock:
+                    stats.injected += 1
+                status = 429 if roll < config.fail_rate / 2 else 503
+                self._send(status, {"error": {"message": "Injected failure", "type": "server_error"}}, limit_headers)
+                return
+
+            response = _response_object(body, f"resp_{next(ids)}", f"msg_{next(ids)}")
+            if _wants_stream(body):
+                self._stream(response, limit_headers)
+                return
+            self._send(200, response, limit_headers)
+
+        def _stream(self, response: Dict[str, Any], headers: Dict[str, str]) -> None:
+            """Send ``response`` as server-sent events, one line of output text at a time."""
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.close_connection = True
+            sequence = itertools.count()
+            text = response["output"][0]["content"][0]["text"]
+            events: List[Dict[str, Any]] = [{"type": "response.created", "response": {**response, "output": []}}]
+            events.extend(
+                {
+                    "type": "response.output_text.delta",
+                    "item_id": response["output"][0]["id"],
+                    "output_index": 0,
+                    "content_index": 0,
+                    "delta": chunk,
+                }
+                for chunk in text.splitlines(keepends=True)
+            )
+            events.append({"type": "response.completed", "response": response})
+            delay = config.stream_line_ms / 1000.0
+            for event in events:
+                event["sequence_number"] = next(sequence)
+                self.wfile.write(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                if event["type"] == "response.output_text.delta":
+                    time.sleep(delay)
+
+    return Handler
+
+
+def start_server(config: FakeOpenAIConfig, port: int = 0) -> Tuple[ThreadingHTTPServer, FakeOpenAIStats]:
+    """Start the server on a background thread; ``port=0`` picks a free port."""
+
+    stats = FakeOpenAIStats()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(config, stats))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rpm", type=int, default=60)
+    parser.add_argument("--tpm", type=int, default=200_000)
+    parser.add_argument("--fail-rate", type=float, default=0.1)
+    parser.add_argument("--latency-ms", type=float, default=400.0)
+    parser.add_argument("--batch-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    config = FakeOpenAIConfig(
+        rpm=args.rpm,
+        tpm=args.tpm,
+        fail_rate=args.fail_rate,
+        latency_ms=args.latency_ms,
+        batch_seconds=args.batch_seconds,
+    )
+    server, stats = start_server(config, args.port)
+    print(f"Fake OpenAI endpoint on http://127.0.0.1:{server.server_address[1]}/v1 (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(5)
+            print(
+                f"requests={stats.requests} uploads={stats.uploads} deletes={stats.deletes} "
+                f"batches={stats.batches} batch_lines={stats.batch_lines} "
+                f"limited={stats.limited} injected={stats.injected}"
+            )
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import os
 import pandas as pd
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 def get_stock_multiplier_path(logger=None, company_dir=None, current_company_name=None):
@@ -418,3 +419,116 @@ def build_stock_multiplier_prompt(
     except Exception as e:
         if logger:
             logger.warning(f"⚠️ Could not open generated {fpath}: {e}")
+
+
+CombinedKey = Tuple[str, str, str, str]
+
+
+def _cell(row: Sequence[str], idx: Optional[int]) -> str:
+    if idx is None or idx >= len(row):
+        return ""
+    return row[idx]
+
+
+@dataclass
+class CombinedPivot:
+    """Scrape tables pivoted into ``(CATEGORY, SUBCATEGORY, ITEM, TYPE)`` rows.
+
+    ``keys`` keeps first-seen order; ``notes[i]`` and ``values[i]`` belong to
+    ``keys[i]``, with one value per dynamic (date) column.
+    """
+
+    keys: List[CombinedKey] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+    values: List[List[str]] = field(default_factory=list)
+    conflicts: Dict[CombinedKey, List[str]] = field(default_factory=dict)
+    duplicates: Dict[Tuple[str, str], List[Dict[str, str]]] = field(default_factory=dict)
+
+
+def pivot_scrape_tables(
+    tables: Iterable[Tuple[str, str, Sequence[str], Sequence[Sequence[str]]]],
+    dyn_cols: Sequence[Dict[str, Any]],
+) -> CombinedPivot:
+    """Merge ``(pdf name, type, header, rows)`` scrape tables into one matrix.
+
+    Each table's header is resolved once into the row positions feeding its
+    dynamic columns, so a row only touches the date columns of its own PDF.
+    Header names are matched after stripping; a duplicated name resolves to
+    its last occurrence. Tables without rows contribute one blank row.
+    """
+
+    dyn_by_pdf: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+    for pos, dc in enumerate(dyn_cols):
+        if dc.get("index") is None:
+            continue
+        dyn_by_pdf.setdefault(dc.get("pdf"), []).append((pos, dc.get("labels", {})))
+
+    pivot = CombinedPivot()
+    key_index: Dict[CombinedKey, int] = {}
+    width = len(dyn_cols)
+    duplicate_tracker: Dict[Tuple[str, str], Dict[Tuple[str, str, str], List[Tuple[str, str]]]] = {}
+
+    for pdf_name, typ, header, rows in tables:
+        names = [str(col).strip() for col in header]
+        position = {name: idx for idx, name in enumerate(names)}
+        cat_idx = position.get("CATEGORY")
+        sub_idx = position.get("SUBCATEGORY")
+        item_idx = position.get("ITEM")
+        note_idx = position.get("NOTE")
+        type_idx = position.get("TYPE")
+        # (matrix column, source column or None when the label is not in the header)
+        targets: List[Tuple[int, Optional[int]]] = []
+        for pos, labels in dyn_by_pdf.get(pdf_name, []):
+            label = labels.get(typ, "")
+            if label:
+                targets.append((pos, position.get(label)))
+
+        tracker = duplicate_tracker.setdefault((pdf_name, typ), {})
+        for row in rows or [[]]:
+            category = str(_cell(row, cat_idx)).strip()
+            subcategory = str(_cell(row, sub_idx)).strip()
+            item = str(_cell(row, item_idx)).strip()
+            note_val = _cell(row, note_idx)
+            row_type = _cell(row, type_idx) or typ
+            tracker.setdefault((category, subcategory, item), []).append((str(row_type), str(note_val)))
+
+            key = (category, subcategory, item, typ)
+            slot = key_index.get(key)
+            if slot is None:
+                slot = len(pivot.keys)
+                key_index[key] = slot
+                pivot.keys.append(key)
+                pivot.notes.append("")
+                pivot.values.append([""] * width)
+            if note_val:
+                existing_note = pivot.notes[slot]
+                if existing_note and existing_note.strip().lower() != note_val.strip().lower():
+                    entries = pivot.conflicts.setdefault(key, [])
+                    seen = {v.lower() for v in entries}
+                    for candidate in (existing_note, note_val):
+                        candidate_str = str(candidate)
+                        if candidate_str.lower() not in seen:
+                            entries.append(candidate_str)
+                            seen.add(candidate_str.lower())
+                else:
+                    pivot.notes[slot] = note_val
+            if targets:
+                out = pivot.values[slot]
+                for pos, src in targets:
+                    out[pos] = _cell(row, src)
+
+    for (pdf_name, typ), key_map in duplicate_tracker.items():
+        for (category, subcategory, item), seen_rows in key_map.items():
+            if len(seen_rows) > 1:
+                pivot.duplicates.setdefault((pdf_name, typ), []).extend(
+                    {
+                        "type": row_type,
+                        "category": category,
+                        "subcategory": subcategory,
+                        "item": item,
+                        "note": note_val,
+                        "pdf": pdf_name,
+                    }
+                    for row_type, note_val in seen_rows
+                )
+    return pivot
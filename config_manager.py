@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping
@@ -14,6 +15,8 @@ from constants import (
     DEFAULT_NOTE_COLOR_SCHEME,
     DEFAULT_OPENAI_MODEL,
     DEFAULT_PATTERNS,
+    SCAN_MODE_THREAD,
+    SCAN_MODES,
     YEAR_DEFAULT_PATTERNS,
 )
 
@@ -52,8 +55,20 @@ class ConfigManager:
     """Dataclass-backed configuration container."""
 
     api_key: str = ""
+    openai_base_url: str = ""
     downloads_dir: str = ""
     thread_count: int = 3
+    scan_workers: int = field(default_factory=lambda: min(8, os.cpu_count() or 4))
+    scan_mode: str = SCAN_MODE_THREAD
+    text_cache_max_mb: int = 512
+    render_cache_max_mb: int = 256
+    response_cache_max_mb: int = 128
+    bypass_response_cache: bool = False
+    batch_scrape_categories: bool = False
+    stream_scrape_responses: bool = False
+    compact_text_payload: bool = True
+    text_tables_only: bool = False
+    local_table_extract: bool = False
     auto_load_last_company: bool = False
     last_company: str = ""
     downloads_minutes: int = 5
@@ -161,13 +176,16 @@ class ConfigManager:
             if name not in data:
                 continue
             value = data[name]
-            if name in {"api_key", "downloads_dir", "last_company"}:
+            if name in {"api_key", "openai_base_url", "downloads_dir", "last_company"}:
                 if isinstance(value, str):
                     setattr(self, name, value.strip())
-            elif name in {"thread_count", "downloads_minutes", "scrape_row_height"}:
+            elif name == "scan_mode":
+                if value in SCAN_MODES:
+                    self.scan_mode = value
+            elif name in {"thread_count", "scan_workers", "text_cache_max_mb", "render_cache_max_mb", "response_cache_max_mb", "downloads_minutes", "scrape_row_height"}:
                 coerced = self._coerce_int(value, getattr(self, name))
                 setattr(self, name, coerced)
-            elif name == "auto_load_last_company":
+            elif name in {"auto_load_last_company", "bypass_response_cache", "batch_scrape_categories", "stream_scrape_responses", "compact_text_payload", "text_tables_only", "local_table_extract"}:
                 setattr(self, name, bool(value))
             elif name in {"note_colors", "scrape_column_widths", "openai_models", "upload_modes"}:
                 self._merge_dict_field(name, value)
@@ -282,8 +300,20 @@ class ConfigManager:
 
         return {
             "api_key": self.api_key,
+            "openai_base_url": self.openai_base_url,
             "downloads_dir": self.downloads_dir,
             "thread_count": int(self.thread_count),
+            "scan_workers": int(self.scan_workers),
+            "scan_mode": self.scan_mode,
+            "text_cache_max_mb": int(self.text_cache_max_mb),
+            "render_cache_max_mb": int(self.render_cache_max_mb),
+            "response_cache_max_mb": int(self.response_cache_max_mb),
+            "bypass_response_cache": bool(self.bypass_response_cache),
+            "batch_scrape_categories": bool(self.batch_scrape_categories),
+            "stream_scrape_responses": bool(self.stream_scrape_responses),
+            "compact_text_payload": bool(self.compact_text_payload),
+            "text_tables_only": bool(self.text_tables_only),
+            "local_table_extract": bool(self.local_table_extract),
             "auto_load_last_company": bool(self.auto_load_last_company),
             "last_company": self.last_company,
             "downloads_minutes": int(self.downloads_minutes),
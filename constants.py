@@ -14,6 +14,11 @@ YEAR_DEFAULT_PATTERNS = [r"(\d{4})\s+Annual\s+Report"]
 
 DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
 
+# PDF page scanning engines used by load_pdfs
+SCAN_MODE_THREAD = "thread"
+SCAN_MODE_PROCESS = "process"
+SCAN_MODES = (SCAN_MODE_THREAD, SCAN_MODE_PROCESS)
+
 SCRAPE_EXPECTED_COLUMNS = [
     "CATEGORY",
     "SUBCATEGORY",
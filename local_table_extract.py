@@ -0,0 +1,443 @@
+"""Local extraction of cleanly tabular statements without an OpenAI call.
+
+Many Financial Position and Income statements are plain tables: one label
+column, an optional note-reference column and one numeric column per
+reporting date. :func:`extract_statement` reads such tables straight from
+PyMuPDF, first with ``page.find_tables()`` and otherwise from word
+positions, and renders them in the same ``Multiplier:`` + CSV format the
+AIScrape prompts ask the model for, so the regular parsing and storage
+apply.
+
+The result carries a confidence score. It is only used when the statement
+title is present, every reporting date was recognised, nearly every value
+cell was filled and (for Financial) total assets reconcile with total
+liabilities and equity; AIScrape falls back to OpenAI otherwise. Shares and
+custom categories are always sent to OpenAI.
+"""
+
+from __future__ import annotations
+
+import calendar
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+LOCAL_MIN_CONFIDENCE = 0.9
+SUPPORTED_CATEGORIES = {"Financial", "Income"}
+# Lines this close to the top or bottom of the page are headers/footers.
+PAGE_MARGIN = 0.06
+# Words whose vertical centres are this close (points) share a line.
+LINE_TOLERANCE = 3.0
+
+_MONTHS = {name.lower(): idx for idx, name in enumerate(calendar.month_abbr) if name}
+_MONTH_RE = r"(?P<{0}>jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE_RE = re.compile(
+    r"(?P<dmy>(?P<d1>\d{1,2})\s+" + _MONTH_RE.format("m1") + r",?\s+(?P<y1>(?:19|20)\d{2}))"
+    r"|(?P<mdy>" + _MONTH_RE.format("m2") + r"\s+(?P<d2>\d{1,2}),?\s+(?P<y2>(?:19|20)\d{2}))"
+    r"|(?P<num>(?P<d3>\d{1,2})[/.-](?P<m3>\d{1,2})[/.-](?P<y3>\d{4}|\d{2})\b)"
+    r"|(?P<my>" + _MONTH_RE.format("m4") + r"\s+(?P<y4>(?:19|20)\d{2}))"
+    r"|(?P<y>\b(?P<y5>(?:19|20)\d{2})\b)",
+    re.IGNORECASE,
+)
+_VALUE_RE = re.compile(r"^\(?[-−]?[$€£]?\d[\d,]*(\.\d+)?\)?%?$")
+_DASHES = {"-", "–", "—", "−", "nil"}
+_SCALE_PATTERNS = [
+    (re.compile(r"\bbillions?\b|\$\s?bn\b|\bbn\b", re.IGNORECASE), "1000000000"),
+    (re.compile(r"\bmillions?\b|\$\s?m\b|\$\s?mn\b|\busd\s?m\b", re.IGNORECASE), "1000000"),
+    (re.compile(r"(?<![\d,.])['’]?000s?\b|\bthousands?\b", re.IGNORECASE), "1000"),
+]
+_TITLES = {
+    "Financial": ("financial position", "balance sheet"),
+    "Income": (
+        "profit or loss",
+        "income statement",
+        "statement of income",
+        "comprehensive income",
+        "statement of operations",
+        "statement of earnings",
+    ),
+}
+
+
+@dataclass
+class LocalExtraction:
+    """Outcome of one local extraction attempt."""
+
+    text: Optional[str] = None
+    confidence: float = 0.0
+    reason: str = ""
+    rows: int = 0
+    method: str = ""
+    multiplier: str = "1"
+    elapsed: float = 0.0
+
+    @property
+    def accepted(self) -> bool:
+        return self.text is not None and self.confidence >= LOCAL_MIN_CONFIDENCE
+
+
+@dataclass
+class _Table:
+    dates: List[str]
+    # x centres of the value columns (word-position tables only).
+    columns: List[float] = field(default_factory=list)
+    # (label, values) pairs; values is None for heading lines.
+    lines: List[Tuple[str, Optional[List[str]]]] = field(default_factory=list)
+
+
+def _default_day_month(text: str) -> str:
+    """``DD.MM`` used for bare-year columns: the first full date on the page, else ``31.12``."""
+
+    for match in _DATE_RE.finditer(text):
+        if match.group("dmy") or match.group("mdy"):
+            return normalize_date(match.group(0), "31.12")[:5]
+    return "31.12"
+
+
+def normalize_date(text: str, default_day_month: str = "31.12") -> str:
+    """First date in ``text`` as ``DD.MM.YYYY`` (month-only → month end), or ``""``."""
+
+    match = _DATE_RE.search(text)
+    if not match:
+        return ""
+    if match.group("dmy"):
+        day, month, year = int(match.group("d1")), _MONTHS[match.group("m1")[:3].lower()], int(match.group("y1"))
+    elif match.group("mdy"):
+        day, month, year = int(match.group("d2")), _MONTHS[match.group("m2")[:3].lower()], int(match.group("y2"))
+    elif match.group("num"):
+        day, month, year = int(match.group("d3")), int(match.group("m3")), int(match.group("y3"))
+        if year < 100:
+            year += 2000
+    elif match.group("my"):
+        month, year = _MONTHS[match.group("m4")[:3].lower()], int(match.group("y4"))
+        day = calendar.monthrange(year, month)[1]
+    else:
+        year = int(match.group("y5"))
+        return f"{default_day_month}.{year}"
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return ""
+    return f"{day:02d}.{month:02d}.{year}"
+
+
+def clean_value(token: str) -> Optional[str]:
+    """``"(1,234)"`` → ``"-1234"``, dashes → ``"0"``; ``None`` when ``token`` is not a value."""
+
+    stripped = token.strip()
+    if stripped.lower() in _DASHES:
+        return "0"
+    if not _VALUE_RE.match(stripped):
+        return None
+    negative = stripped.startswith("(") and stripped.endswith(")") or "-" in stripped or "−" in stripped
+    digits = re.sub(r"[^\d.]", "", stripped)
+    if not digits or digits == ".":
+        return None
+    return f"-{digits}" if negative and digits.strip("0.") else digits
+
+
+def guess_multiplier(text: str) -> str:
+    """Scale stated nearest the top of ``text`` (``"1000"`` for ``$'000`` etc.), else ``"1"``."""
+
+    best: Optional[Tuple[int, str]] = None
+    for pattern, value in _SCALE_PATTERNS:
+        match = pattern.search(text)
+        if match and (best is None or match.start() < best[0]):
+            best = (match.start(), value)
+    return best[1] if best else "1"
+
+
+def _tables_from_find_tables(page: Any, default_dm: str) -> List[_Table]:
+    finder = getattr(page, "find_tables", None)
+    if finder is None:
+        return []
+    try:
+        found = finder()
+    except Exception:
+        return []
+    tables: List[_Table] = []
+    for tab in getattr(found, "tables", []):
+        rows = [[(cell or "").strip() for cell in row] for row in tab.extract()]
+        header_end = next(
+            (idx for idx, row in enumerate(rows[:4]) if any(normalize_date(cell) for cell in row[1:])), None
+        )
+        if header_end is None:
+            continue
+        width = max(len(row) for row in rows)
+        header = [" ".join(row[col] for row in rows[: header_end + 1] if col < len(row)) for col in range(width)]
+        date_cols = [col for col in range(1, width) if normalize_date(header[col], default_dm)]
+        table = _Table(dates=[normalize_date(header[col], default_dm) for col in date_cols])
+        for row in rows[header_end + 1 :]:
+            label = " ".join(
+                cell for col, cell in enumerate(row) if col not in date_cols and cell and clean_value(cell) is None
+            )
+            cells = [row[col] if col < len(row) else "" for col in date_cols]
+            values = [clean_value(cell) if cell else None for cell in cells]
+            if not label and not any(values):
+                continue
+            if not any(value is not None for value in values):
+                table.lines.append((label, None))
+            else:
+                table.lines.append((label, [value if value is not None else "" for value in values]))
+        tables.append(table)
+    return tables
+
+
+def _word_lines(page: Any) -> List[List[Tuple[float, float, str]]]:
+    height = float(page.rect.height)
+    words = [
+        w for w in page.get_text("words") if PAGE_MARGIN * height < (w[1] + w[3]) / 2 < (1 - PAGE_MARGIN) * height
+    ]
+    words.sort(key=lambda w: ((w[1] + w[3]) / 2, w[0]))
+    lines: List[List[Tuple[float, float, str]]] = []
+    last_y: Optional[float] = None
+    for w in words:
+        y = (w[1] + w[3]) / 2
+        if last_y is None or y - last_y > LINE_TOLERANCE:
+            lines.append([])
+        lines[-1].append((float(w[0]), float(w[2]), str(w[4])))
+        last_y = y
+    return [sorted(line) for line in lines]
+
+
+def _table_from_words(page: Any, default_dm: str, columns: Optional[List[float]] = None) -> Optional[_Table]:
+    """Rebuild the statement from word positions.
+
+    Value columns are anchored on the reporting-date header: each year in
+    the header line (right of the label area) is one column, and the header
+    text above it supplies the day and month. A continuation page without a
+    header reuses ``columns`` from the previous page. Numbers that do not
+    line up with a date column (note references) are dropped.
+    """
+
+    lines = _word_lines(page)
+    label_edge = float(page.rect.width) * 0.35
+    dates: List[str] = []
+    start = 0
+    for idx, line in enumerate(lines):
+        years = [(x0, x1) for x0, x1, text in line if x0 > label_edge and re.fullmatch(r"(19|20)\d{2}\W?", text)]
+        if not years:
+            continue
+        centers = [(x0 + x1) / 2 for x0, x1 in years]
+        bounds = [-1e9] + [(a + b) / 2 for a, b in zip(centers, centers[1:])] + [1e9]
+        for col in range(len(centers)):
+            band = " ".join(
+                text
+                for prior in lines[max(0, idx - 2) : idx + 1]
+                for x0, x1, text in prior
+                if x0 > label_edge and bounds[col] <= (x0 + x1) / 2 < bounds[col + 1]
+            )
+            dates.append(normalize_date(band, default_dm))
+        columns, start = centers, idx + 1
+        break
+    if not columns:
+        return None
+    if not dates:
+        dates = [""] * len(columns)
+    gap = min((b - a for a, b in zip(columns, columns[1:])), default=120.0)
+    tolerance = max(20.0, gap / 2)
+    table = _Table(dates=dates, columns=columns)
+    pending_label = ""
+    for line in lines[start:]:
+        values: List[Optional[str]] = [None] * len(columns)
+        label_parts: List[str] = []
+        label_end = 0.0
+        for x0, x1, text in line:
+            value = clean_value(text)
+            if value is not None and x0 > label_edge:
+                col = min(range(len(columns)), key=lambda c: abs((x0 + x1) / 2 - columns[c]))
+                if abs((x0 + x1) / 2 - columns[col]) <= tolerance:
+                    values[col] = value
+                continue
+            if value is not None and label_parts and x0 - label_end > 15:
+                continue  # note reference set apart from the label
+            if x1 <= columns[0] - tolerance:
+                label_parts.append(text)
+                label_end = x1
+        label = " ".join(label_parts).strip()
+        if all(value is None for value in values):
+            if label:
+                if pending_label:
+                    table.lines.append((pending_label, None))
+                pending_label = label
+            continue
+        if pending_label and label[:1].islower():
+            # A long item wrapped onto the line that carries its values.
+            label, pending_label = f"{pending_label} {label}", ""
+        if pending_label:
+            table.lines.append((pending_label, None))
+            pending_label = ""
+        table.lines.append((label, [value if value is not None else "" for value in values]))
+    if pending_label:
+        table.lines.append((pending_label, None))
+    return table
+
+
+_GRAND_TOTAL_RE = re.compile(r"total (assets|liabilities|(shareholders['’] |stockholders['’] )?equity)|net assets")
+_TOTAL_RE = re.compile(r"^(total|net assets|net (profit|loss)|(profit|loss) (for|after|before)|gross profit)\b")
+
+
+def _classify_financial(lower: str, state: Dict[str, str]) -> Tuple[str, str, str]:
+    category = state.get("category", "")
+    if "intangible" in lower and not _TOTAL_RE.match(lower):
+        return category, state.get("subcategory", ""), "intangibles"
+    if _TOTAL_RE.match(lower):
+        if "liabilities and" in lower:
+            return "", "", "excluded"
+        if _GRAND_TOTAL_RE.fullmatch(lower.strip(" :")):
+            return category, "", "excluded"
+        return category, state.get("subcategory", ""), "excluded"
+    if category == "ASSETS":
+        return category, state.get("subcategory", ""), "asis"
+    if category == "LIABILITIES":
+        return category, state.get("subcategory", ""), "negated"
+    if "controlling interest" in lower or "minority interest" in lower:
+        return category, state.get("subcategory", ""), "negated"
+    return category, state.get("subcategory", ""), "excluded"
+
+
+def _financial_heading(lower: str, state: Dict[str, str]) -> None:
+    for keyword, category in (("liabilit", "LIABILITIES"), ("equity", "SHAREHOLDERS’ EQUITY"), ("asset", "ASSETS")):
+        if keyword in lower:
+            state["category"] = category
+            bare = lower.strip(" :").replace("’", "'") in {"assets", "liabilities", "equity", "shareholders' equity"}
+            state["subcategory"] = "" if bare else lower.upper()
+            return
+    state["subcategory"] = lower.upper()
+
+
+def _classify_income(lower: str, state: Dict[str, str]) -> Tuple[str, str, str]:
+    subcategory = state.get("subcategory", "")
+    if re.search(r"per share|earnings per|dividend|number of shares", lower):
+        return "SHARES", subcategory, "excluded"
+    if _TOTAL_RE.match(lower) or "comprehensive income for" in lower or "profit attributable" in lower:
+        return "TOTAL", subcategory, "excluded"
+    if "tax" in lower:
+        return "TAX", subcategory, "negated" if "expense" in lower else "asis"
+    if "finance" in lower or "interest" in lower:
+        return "FINANCE", subcategory, "negated" if re.search(r"cost|expense", lower) else "asis"
+    if re.search(r"expense|cost|impairment|depreciation|amortisation|amortization|loss", lower):
+        return "EXPENSES", subcategory, "negated"
+    if re.search(r"revenue|income|sales|gain", lower):
+        return "REVENUE", subcategory, "asis"
+    return "OTHER", subcategory, "asis"
+
+
+def _quote(text: str) -> str:
+    return '"' + text.upper().replace('"', '""') + '"'
+
+
+def _financial_balances(rows: List[Tuple[str, List[str]]], columns: int) -> Optional[bool]:
+    """Whether total assets equal total liabilities plus equity (or net assets equal equity) in every column."""
+
+    def find(pattern: str) -> Optional[List[float]]:
+        for label, values in rows:
+            if re.fullmatch(pattern, label.lower().strip(" :")):
+                try:
+                    return [float(value or 0) for value in values]
+                except ValueError:
+                    return None
+        return None
+
+    assets = find(r"total assets")
+    liabilities = find(r"total liabilities")
+    equity = find(r"total (shareholders['’] |stockholders['’] )?equity")
+    net_assets = find(r"net assets")
+    if equity is None:
+        return None
+    checks: List[bool] = []
+    for col in range(columns):
+        if assets is not None and liabilities is not None:
+            total = assets[col]
+            checks.append(abs(total - liabilities[col] - equity[col]) <= max(1.0, abs(total) * 0.001))
+        elif net_assets is not None:
+            checks.append(abs(net_assets[col] - equity[col]) <= max(1.0, abs(net_assets[col]) * 0.001))
+        else:
+            return None
+    return all(checks)
+
+
+def extract_statement(doc: Any, pages: Sequence[int], category: str) -> LocalExtraction:
+    """Try to extract ``category`` from ``pages`` of ``doc`` without OpenAI."""
+
+    started = time.perf_counter()
+
+    def result(**values: Any) -> LocalExtraction:
+        return LocalExtraction(elapsed=time.perf_counter() - started, **values)
+
+    if category not in SUPPORTED_CATEGORIES:
+        return result(reason=f"no local extractor for {category}")
+    page_indexes = sorted(dict.fromkeys(int(page) for page in pages))
+    try:
+        page_objs = [doc.load_page(idx) for idx in page_indexes]
+        page_text = "\n".join(page.get_text("text") for page in page_objs)
+    except Exception as exc:
+        return result(reason=f"could not read pages: {exc}")
+    if not any(title in page_text.lower() for title in _TITLES[category]):
+        return result(reason="statement title not found")
+
+    default_dm = _default_day_month(page_text)
+    tables: List[_Table] = []
+    method = "find_tables"
+    columns: Optional[List[float]] = None
+    for page in page_objs:
+        found = [t for t in _tables_from_find_tables(page, default_dm) if len(t.lines) >= 3]
+        if found:
+            tables.extend(found)
+            continue
+        method = "words"
+        table = _table_from_words(page, default_dm, columns)
+        if table is not None:
+            tables.append(table)
+            columns = table.columns
+    if not tables:
+        return result(reason="no table with reporting-date columns", method=method)
+    dates = tables[0].dates
+    if not dates or not all(dates) or any(t.dates != dates and any(t.dates) for t in tables):
+        return result(reason=f"reporting dates not recognised ({dates})", method=method)
+
+    state: Dict[str, str] = {}
+    out_rows: List[List[str]] = []
+    value_rows: List[Tuple[str, List[str]]] = []
+    for table in tables:
+        for label, values in table.lines:
+            lower = label.lower().strip()
+            if values is None:
+                if category == "Financial":
+                    _financial_heading(lower, state)
+                else:
+                    state["subcategory"] = label.upper()
+                continue
+            if not label:
+                return result(reason="value row without a label", method=method)
+            if category == "Financial":
+                cat, sub, note = _classify_financial(lower, state)
+            else:
+                cat, sub, note = _classify_income(lower, state)
+            value_rows.append((label, values))
+            out_rows.append([_quote(cat), _quote(sub), _quote(label), f'"{note}"', *[v or "0" for v in values]])
+
+    if len(value_rows) < 3:
+        return result(reason="fewer than 3 value rows", method=method)
+    cells = sum(len(values) for _, values in value_rows)
+    filled = sum(1 for _, values in value_rows for value in values if value)
+    confidence = filled / cells if cells else 0.0
+    if category == "Financial":
+        balanced = _financial_balances(value_rows, len(dates))
+        if not balanced:
+            reason = "totals not found" if balanced is None else "total assets do not reconcile"
+            return result(reason=reason, confidence=0.0, method=method, rows=len(value_rows))
+    elif not any(_TOTAL_RE.match(label.lower()) for label, _ in value_rows):
+        return result(reason="no profit/total row", confidence=0.0, method=method, rows=len(value_rows))
+
+    multiplier = guess_multiplier(page_text)
+    lines = [f"Multiplier: {multiplier}", ",".join(["CATEGORY", "SUBCATEGORY", "ITEM", "NOTE", *dates])]
+    lines.extend(",".join(row) for row in out_rows)
+    return result(
+        text="\n".join(lines),
+        confidence=confidence,
+        reason="ok" if confidence >= LOCAL_MIN_CONFIDENCE else f"only {confidence:.0%} of value cells filled",
+        rows=len(value_rows),
+        method=method,
+        multiplier=multiplier,
+    )
@@ -16,5 +16,14 @@ class ScrapeJob:
     model_name: str
     upload_mode: str
     target_dir: Path
-    temp_pdf: Optional[Path] = None
+    pdf_bytes: Optional[bytes] = None
+    text_payload: Optional[str] = None
+
+
+@dataclass
+class ScrapeJobGroup:
+    """Jobs sent as one request; a batched group carries its union payload."""
+
+    jobs: List[ScrapeJob]
+    pdf_bytes: Optional[bytes] = None
     text_payload: Optional[str] = None
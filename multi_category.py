@@ -0,0 +1,95 @@
+"""Helpers for AIScrape's batched multi-category mode.
+
+In batched mode the Financial, Income and Shares jobs of one PDF are sent as
+a single request: the union of their pages is attached once and every
+category prompt is included as its own section. The model is asked to wrap
+each section's output in ``=== BEGIN <Category> ===`` / ``=== END <Category>
+===`` markers, and :func:`split_batched_response` cuts the reply back into
+one response text per category so the regular per-category parsing applies.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+BEGIN_MARKER = "=== BEGIN {category} ==="
+END_MARKER = "=== END {category} ==="
+
+_SECTION_RE = re.compile(
+    r"^[ \t]*=+[ \t]*BEGIN[ \t]+(?P<name>[^=\n]+?)[ \t]*=+[ \t]*$"
+    r"(?P<body>.*?)"
+    r"^[ \t]*=+[ \t]*END[ \t]+(?P=name)[ \t]*=+[ \t]*$",
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
+
+
+def union_pages(page_lists: Sequence[Sequence[int]]) -> List[int]:
+    """Sorted, de-duplicated page indexes across all ``page_lists``."""
+
+    return sorted({int(page) for pages in page_lists for page in pages})
+
+
+def _page_ranges(pages: Sequence[int]) -> str:
+    """``[0, 1, 2, 5]`` → ``"1-3, 6"`` (1-based for the prompt)."""
+
+    parts: List[str] = []
+    ordered = sorted(dict.fromkeys(pages))
+    start = prev = None
+    for page in ordered:
+        if start is None:
+            start = prev = page
+        elif page == prev + 1:
+            prev = page
+        else:
+            parts.append(f"{start + 1}" if start == prev else f"{start + 1}-{prev + 1}")
+            start = prev = page
+    if start is not None:
+        parts.append(f"{start + 1}" if start == prev else f"{start + 1}-{prev + 1}")
+    return ", ".join(parts)
+
+
+def build_batched_prompt(
+    sections: Sequence[Tuple[str, str, Sequence[int]]],
+    attached_pages: Optional[Sequence[int]] = None,
+) -> str:
+    """Combine ``(category, prompt, pages)`` sections into one request prompt.
+
+    ``attached_pages`` is the page union in the order it is attached as a
+    PDF, so each section can name both the report pages and their attached
+    positions; text payloads already carry report page numbers.
+    """
+
+    position = {page: idx for idx, page in enumerate(attached_pages or [])}
+    lines = [
+        "This request covers several statements from the same report. "
+        "Complete every section below independently.",
+        "Write each section's complete answer (multiplier line and CSV rows) between its own markers, "
+        "exactly as shown, and output nothing outside the markers:",
+    ]
+    for category, _, _ in sections:
+        lines.append(f"{BEGIN_MARKER.format(category=category)}\n...\n{END_MARKER.format(category=category)}")
+    for category, prompt, pages in sections:
+        heading = f"\n##### Section {category}: report page(s) {_page_ranges(pages)}"
+        attached = [position[page] for page in pages if page in position]
+        if attached:
+            heading += f" (attached page(s) {_page_ranges(attached)})"
+        lines.append(f"{heading}\n{prompt.strip()}")
+    return "\n".join(lines)
+
+
+def split_batched_response(text: str, categories: Sequence[str]) -> Dict[str, str]:
+    """Return the section text for each category present in ``text``.
+
+    A section that appears more than once keeps its last occurrence;
+    categories with no section are left out.
+    """
+
+    wanted = {category.lower(): category for category in categories}
+    found: Dict[str, str] = {}
+    for match in _SECTION_RE.finditer(text):
+        category = wanted.get(match.group("name").strip().lower())
+        if category is not None:
+            found[category] = match.group("body").strip()
+    return found
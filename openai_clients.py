@@ -0,0 +1,223 @@
+"""Shared OpenAI clients with pooled connections and per-request timings.
+
+Creating ``OpenAI(api_key=...)`` per call opens a new connection pool each
+time, so every AIScrape request paid for its own TCP and TLS handshake.
+:func:`get_openai_clients` returns a process-wide registry that hands out
+one client per ``(api key, base URL, pool size)``; the clients are safe to
+share between worker threads.
+
+Each request made through a registry client records its connect time (TCP +
+TLS, zero when a pooled connection was reused), time to first byte and total
+time in :class:`LatencyStats`.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - handled at runtime
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import openai
+    from openai import OpenAI
+except ImportError:  # pragma: no cover - handled at runtime
+    openai = None  # type: ignore[assignment]
+    OpenAI = None  # type: ignore[assignment]
+
+from app_logging import get_logger
+
+
+logger = get_logger()
+
+# Requests kept for the "recent" view of the latency statistics.
+RECENT_TIMINGS = 200
+
+
+@dataclass
+class RequestTiming:
+    method: str
+    path: str
+    status: int
+    connect: float
+    ttfb: float
+    total: float
+    reused: bool
+
+
+class LatencyStats:
+    """Thread-safe aggregate of :class:`RequestTiming` records."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.recent: Deque[RequestTiming] = deque(maxlen=RECENT_TIMINGS)
+        self.requests = 0
+        self.reused = 0
+        self.connect_total = 0.0
+        self.ttfb_total = 0.0
+        self.total_total = 0.0
+
+    def record(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.recent.append(timing)
+            self.requests += 1
+            self.reused += int(timing.reused)
+            self.connect_total += timing.connect
+            self.ttfb_total += timing.ttfb
+            self.total_total += timing.total
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            count = self.requests
+            return {
+                "requests": count,
+                "reused_connections": self.reused,
+                "connect_s": round(self.connect_total, 3),
+                "avg_connect_ms": round(self.connect_total / count * 1000, 1) if count else 0.0,
+                "avg_ttfb_ms": round(self.ttfb_total / count * 1000, 1) if count else 0.0,
+                "avg_total_ms": round(self.total_total / count * 1000, 1) if count else 0.0,
+            }
+
+
+@lru_cache(maxsize=None)
+def _timed_transport_class(http: Any) -> type:
+    """Build the timing transport for ``http`` (``httpx`` or a compatible fork)."""
+
+    class _TimedStream(http.SyncByteStream):
+        def __init__(self, inner: Any, on_close: Callable[[], None]) -> None:
+            self._inner = inner
+            self._on_close = on_close
+
+        def __iter__(self):
+            yield from self._inner
+
+        def close(self) -> None:
+            try:
+                self._inner.close()
+            finally:
+                self._on_close()
+
+    class TimedTransport(http.BaseTransport):
+        """HTTP transport that times connect, first byte and completion."""
+
+        def __init__(self, stats: LatencyStats, pool_size: int) -> None:
+            limits = http.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            self._inner = http.HTTPTransport(limits=limits)
+            self._stats = stats
+
+        def handle_request(self, request: Any) -> Any:
+            marks: Dict[str, float] = {}
+
+            def trace(event_name: str, _info: Dict[str, Any]) -> None:
+                if event_name.startswith(("connection.connect_tcp", "connection.start_tls")):
+                    marks[event_name] = time.perf_counter()
+
+            request.extensions["trace"] = trace
+            start = time.perf_counter()
+            response = self._inner.handle_request(request)
+            ttfb = time.perf_counter() - start
+            connect = 0.0
+            for phase in ("connection.connect_tcp", "connection.start_tls"):
+                began, done = marks.get(f"{phase}.started"), marks.get(f"{phase}.complete")
+                if began is not None and done is not None:
+                    connect += done - began
+            reused = "connection.connect_tcp.started" not in marks
+            finished = False
+
+            def finish() -> None:
+                nonlocal finished
+                if finished:
+                    return
+                finished = True
+                self._stats.record(
+                    RequestTiming(
+                        method=request.method,
+                        path=request.url.path,
+                        status=response.status_code,
+                        connect=connect,
+                        ttfb=ttfb,
+                        total=time.perf_counter() - start,
+                        reused=reused,
+                    )
+                )
+
+            return http.Response(
+                status_code=response.status_code,
+                headers=response.headers,
+                stream=_TimedStream(response.stream, finish),
+                extensions=response.extensions,
+            )
+
+        def close(self) -> None:
+            self._inner.close()
+
+    return TimedTransport
+
+
+def _openai_http_module() -> Any:
+    """Return the HTTP library the installed ``openai`` package is built on."""
+
+    client_cls = getattr(openai, "DefaultHttpxClient", None)
+    for base in getattr(client_cls, "__mro__", ())[1:]:
+        if base.__name__ == "Client":
+            return sys.modules.get(base.__module__.partition(".")[0])
+    return httpx
+
+
+class OpenAIClientRegistry:
+    """One shared ``OpenAI`` client per API key, endpoint and pool size."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str, int], Any] = {}
+        self.latency = LatencyStats()
+
+    def get(self, api_key: str, base_url: str = "", pool_size: int = 8) -> Any:
+        if OpenAI is None:
+            raise ValueError("OpenAI client is not available")
+        key = (api_key, base_url or "", max(1, int(pool_size)))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create(*key)
+                self._clients[key] = client
+                logger.info("🔌 Created shared OpenAI client (pool=%d, endpoint=%s)", key[2], base_url or "default")
+            return client
+
+    def _create(self, api_key: str, base_url: str, pool_size: int) -> Any:
+        kwargs: Dict[str, Any] = {"api_key": api_key}
+        if base_url:
+            kwargs["base_url"] = base_url
+        http = _openai_http_module()
+        if http is not None:
+            transport = _timed_transport_class(http)(self.latency, pool_size)
+            client_cls = getattr(openai, "DefaultHttpxClient", None) or http.Client
+            kwargs["http_client"] = client_cls(transport=transport)
+        return OpenAI(**kwargs)
+
+    def close_all(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+
+_registry = OpenAIClientRegistry()
+
+
+def get_openai_clients() -> OpenAIClientRegistry:
+    """Return the process-wide OpenAI client registry."""
+
+    return _registry
@@ -0,0 +1,218 @@
+"""Page text scanning helpers shared by the thread and process scan engines.
+
+Everything in this module is safe to import inside a worker process: it only
+depends on :mod:`re`, PyMuPDF and the on-disk text cache, never on Tk or
+Pillow.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fitz  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - handled at runtime
+    fitz = None  # type: ignore[assignment]
+
+from text_cache import compute_text_key, read_texts, write_texts
+
+
+# (page_index, pattern source, matched text) – cheap to pickle between processes.
+RawMatch = Tuple[int, str, str]
+PatternMap = Dict[str, List["re.Pattern[str]"]]
+
+
+@dataclass
+class ScanResult:
+    """Compact outcome of scanning one PDF."""
+
+    path: Path
+    matches: Dict[str, List[RawMatch]] = field(default_factory=dict)
+    year: str = ""
+    page_count: int = 0
+    error: Optional[str] = None
+    text_key: str = ""
+    text_cached: bool = False
+
+
+def pattern_signature(patterns: Sequence["re.Pattern[str]"]) -> Tuple[Tuple[str, int], ...]:
+    """Return a hashable description of compiled patterns for change detection."""
+
+    return tuple((pattern.pattern, pattern.flags) for pattern in patterns)
+
+
+def find_year(text: str, year_patterns: Sequence["re.Pattern[str]"]) -> str:
+    for pattern in year_patterns:
+        year_match = pattern.search(text)
+        if year_match:
+            return year_match.group(1) if year_match.groups() else year_match.group(0)
+    return ""
+
+
+try:  # Python 3.11+
+    import re._parser as _sre_parse  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+# Literal runs shorter than this are not selective enough to be worth a check.
+MIN_PREFILTER_LITERAL = 3
+# Under IGNORECASE ``re`` also matches dotted/dotless i variants that
+# ``str.casefold`` maps elsewhere, so those letters end a literal run.
+_UNFOLDABLE = frozenset("iI")
+
+
+def required_literal(pattern: "re.Pattern[str]") -> Optional[str]:
+    """Return a literal every match of ``pattern`` must contain, if one is obvious.
+
+    Only top-level literal runs are considered, so the result is conservative:
+    ``None`` means "always run the regex". Under IGNORECASE the literal is
+    casefolded and must be looked up in casefolded text.
+    """
+
+    ignore_case = bool(pattern.flags & re.IGNORECASE)
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+    best = ""
+    run: List[str] = []
+    for op, arg in list(parsed) + [(None, None)]:
+        char = chr(arg) if op is _sre_parse.LITERAL else None
+        if char is not None and ignore_case and (not char.isascii() or char in _UNFOLDABLE):
+            char = None
+        if char is not None:
+            run.append(char)
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(best) < MIN_PREFILTER_LITERAL:
+        return None
+    return best.casefold() if ignore_case else best
+
+
+class PatternSet:
+    """All category patterns prepared for classifying pages in one sweep.
+
+    Each pattern carries an optional required literal. A page's text is
+    casefolded once, and patterns whose literal is absent are skipped
+    without running the regex. Pattern order per column is preserved, so the
+    reported pattern is exactly the one the plain page × pattern loop would
+    have picked.
+    """
+
+    def __init__(self, pattern_map: PatternMap) -> None:
+        self.columns: List[Tuple[str, List[Tuple["re.Pattern[str]", Optional[str], bool]]]] = []
+        self.needs_fold = False
+        for column, patterns in pattern_map.items():
+            prepared = []
+            for pattern in patterns:
+                literal = required_literal(pattern)
+                folded = literal is not None and bool(pattern.flags & re.IGNORECASE)
+                self.needs_fold = self.needs_fold or folded
+                prepared.append((pattern, literal, folded))
+            self.columns.append((column, prepared))
+
+    def scan_page(self, page_index: int, text: str, matches: Dict[str, List[RawMatch]]) -> None:
+        """Append the first matching pattern of every column for a single page."""
+
+        folded_text = text.casefold() if self.needs_fold else text
+        for column, prepared in self.columns:
+            for pattern, literal, folded in prepared:
+                if literal is not None and literal not in (folded_text if folded else text):
+                    continue
+                match_obj = pattern.search(text)
+                if match_obj:
+                    matches.setdefault(column, []).append(
+                        (page_index, pattern.pattern, match_obj.group(0).strip())
+                    )
+                    break
+
+
+def scan_texts(
+    texts: Sequence[str],
+    pattern_map: PatternMap,
+    year_patterns: Sequence["re.Pattern[str]"],
+) -> Tuple[Dict[str, List[RawMatch]], str]:
+    pattern_set = PatternSet(pattern_map)
+    matches: Dict[str, List[RawMatch]] = {column: [] for column in pattern_map}
+    year_value = ""
+    for page_index, text in enumerate(texts):
+        pattern_set.scan_page(page_index, text, matches)
+        if not year_value:
+            year_value = find_year(text, year_patterns)
+    return matches, year_value
+
+
+def extract_page_texts(doc: "fitz.Document") -> List[str]:  # type: ignore[name-defined]
+    return [doc.load_page(index).get_text("text") for index in range(len(doc))]
+
+
+def load_page_texts(
+    pdf_path: Path,
+    cache_dir: Optional[Path],
+    text_key: str = "",
+    doc: Optional["fitz.Document"] = None,  # type: ignore[name-defined]
+) -> Tuple[List[str], str, bool]:
+    """Return ``(texts, key, cache_hit)`` for ``pdf_path``.
+
+    Text is served from ``cache_dir`` when possible. Otherwise it is extracted
+    from ``doc`` (or a document opened just for this call) and written back.
+    """
+
+    key = text_key
+    if cache_dir is not None and not key:
+        try:
+            key = compute_text_key(pdf_path)
+        except OSError:
+            key = ""
+    if cache_dir is not None and key:
+        cached = read_texts(cache_dir, key)
+        if cached is not None:
+            return cached, key, True
+
+    if doc is not None:
+        texts = extract_page_texts(doc)
+    else:
+        opened = fitz.open(pdf_path)  # type: ignore[arg-type]
+        try:
+            texts = extract_page_texts(opened)
+        finally:
+            opened.close()
+    if cache_dir is not None and key:
+        write_texts(cache_dir, key, texts)
+    return texts, key, False
+
+
+def scan_pdf_path(
+    pdf_path: Path,
+    pattern_map: PatternMap,
+    year_patterns: Sequence["re.Pattern[str]"],
+    cache_dir: Optional[Path] = None,
+    text_key: str = "",
+) -> ScanResult:
+    """Load the page text of ``pdf_path`` and scan every page.
+
+    This is the process-pool entry point, so the document handle never leaves
+    the worker and only the compact :class:`ScanResult` is pickled back.
+    """
+
+    if fitz is None:  # pragma: no cover - checked at runtime
+        return ScanResult(path=pdf_path, error="PyMuPDF is not installed")
+    try:
+        texts, key, cached = load_page_texts(pdf_path, cache_dir, text_key)
+    except Exception as exc:
+        return ScanResult(path=pdf_path, error=str(exc))
+    matches, year_value = scan_texts(texts, pattern_map, year_patterns)
+    return ScanResult(
+        path=pdf_path,
+        matches=matches,
+        year=year_value,
+        page_count=len(texts),
+        text_key=key,
+        text_cached=cached,
+    )
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import json
 import re
-import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-import os
 import tkinter as tk
 from tkinter import messagebox, ttk
 
@@ -17,8 +16,21 @@ except ImportError:  # pragma: no cover - handled at runtime
 from PIL import Image, ImageTk
 
 from app_logging import get_logger
-from constants import COLUMNS
+from constants import COLUMNS, SCAN_MODE_PROCESS
+from page_scan import (
+    RawMatch,
+    ScanResult,
+    extract_page_texts,
+    load_page_texts,
+    pattern_signature,
+    scan_pdf_path,
+    scan_texts,
+)
 from pdf_utils import Match, PDFEntry
+from render_cache import RenderCache, file_identity, rasterize_page
+from text_cache import TEXT_CACHE_DIRNAME, PageTextCache
+from text_compaction import CompactionResult, compact_page_texts, table_blocks_text
+from thumbnail_pipeline import ThumbnailPipeline
 
 
 logger = get_logger()
@@ -49,6 +61,12 @@ class PDFManagerMixin:
     folder_path: tk.StringVar
     company_var: tk.StringVar
     thumbnail_width_var: tk.IntVar
+    page_text_cache: Optional[PageTextCache]
+    render_cache: Optional[RenderCache]
+    thumbnail_pipeline: ThumbnailPipeline
+    scanned_folder: Optional[Path]
+    scanned_pattern_signatures: Dict[str, Tuple[Tuple[str, int], ...]]
+    scanned_year_signature: Optional[Tuple[Tuple[str, int], ...]]
 
     def _compile_patterns(self) -> Tuple[Dict[str, List[re.Pattern[str]]], List[re.Pattern[str]]]:
         pattern_map: Dict[str, List[re.Pattern[str]]] = {}
@@ -96,6 +114,10 @@ class PDFManagerMixin:
             pass
 
     def clear_entries(self) -> None:
+        self.thumbnail_pipeline.cancel()
+        render_cache = getattr(self, "render_cache", None)
+        if render_cache is not None:
+            render_cache.clear()
         for entry in self.pdf_entries:
             try:
                 entry.doc.close()
@@ -103,6 +125,8 @@ class PDFManagerMixin:
                 pass
         self.pdf_entries.clear()
         self.category_rows.clear()
+        self._review_rows_by_index = {}
+        self._review_row_pool = []
         for child in self.inner_frame.winfo_children():
             child.destroy()
         self.active_scrape_key = None
@@ -162,10 +186,194 @@ class PDFManagerMixin:
             close_progress()
             return
 
-        total = len(pdf_paths)
-        current = 0
+        workers = self.get_scan_worker_count()
+        self.page_text_cache = self._open_page_text_cache()
+        self.pdf_entries.clear()
+        if self.get_scan_mode() == SCAN_MODE_PROCESS:
+            self._scan_pdfs_in_processes(pdf_paths, pattern_map, year_patterns, workers)
+        else:
+            self._scan_pdfs_in_threads(pdf_paths, pattern_map, year_patterns, workers)
+        if self.page_text_cache is not None:
+            self.page_text_cache.evict()
+            self.page_text_cache.save_index()
+        self._remember_scanned_patterns(folder_path, pattern_map, year_patterns)
+
+        self.root.title("Loading complete")
+
+        self._rebuild_review_grid()
+        self._save_config()
+        self.refresh_combined_tab()
+
+        status_label.config(text="✅ All PDFs loaded")
+        self.root.update_idletasks()
+
+        # --- Close progress window after done ---
+        close_progress()
+
+    def _remember_scanned_patterns(
+        self,
+        folder: Path,
+        pattern_map: Dict[str, List[re.Pattern[str]]],
+        year_patterns: List[re.Pattern[str]],
+    ) -> None:
+        self.scanned_folder = folder
+        self.scanned_pattern_signatures = {
+            column: pattern_signature(patterns) for column, patterns in pattern_map.items()
+        }
+        self.scanned_year_signature = pattern_signature(year_patterns)
+
+    def rescan_patterns(self) -> None:
+        """Re-run only the pattern columns that changed since the last scan.
+
+        Falls back to :meth:`load_pdfs` when nothing has been loaded yet or the
+        folder changed. Page text comes from the text cache (or the already
+        open documents), so no PDF is reopened.
+        """
+
+        folder = self.folder_path.get()
+        if (
+            not self.pdf_entries
+            or not folder
+            or self.scanned_folder is None
+            or Path(folder) != self.scanned_folder
+        ):
+            self.load_pdfs()
+            return
+
+        pattern_map, year_patterns = self._compile_patterns()
+        if any(not patterns for patterns in pattern_map.values()):
+            return
+
+        changed = [
+            column
+            for column, patterns in pattern_map.items()
+            if pattern_signature(patterns) != self.scanned_pattern_signatures.get(column)
+        ]
+        year_changed = pattern_signature(year_patterns) != self.scanned_year_signature
+        if not changed and not year_changed:
+            logger.info("🔁 Patterns unchanged; nothing to rescan")
+            return
+
+        changed_map = {column: pattern_map[column] for column in changed}
+        cache = self.page_text_cache
+        changed_selections: List[Tuple[PDFEntry, str]] = []
+        year_updated = False
+        for entry in self.pdf_entries:
+            texts = cache.read(entry.text_key) if cache is not None and entry.text_key else None
+            if texts is None:
+                texts = extract_page_texts(entry.doc)
+            raw_matches, year_value = scan_texts(
+                texts, changed_map, year_patterns if year_changed else []
+            )
+            for column in changed:
+                if self._replace_regex_matches(entry, column, raw_matches.get(column, [])):
+                    changed_selections.append((entry, column))
+            if year_changed and not self._has_stored_year(entry) and entry.year != year_value:
+                entry.year = year_value
+                year_updated = True
+
+        self._remember_scanned_patterns(Path(folder), pattern_map, year_patterns)
+        logger.info(
+            "🔁 Rescanned %d column(s)%s across %d PDF(s)",
+            len(changed),
+            " and year" if year_changed else "",
+            len(self.pdf_entries),
+        )
+
+        if year_updated:
+            # Year labels live outside the category rows.
+            self._rebuild_review_grid()
+            return
+        for entry in self.pdf_entries:
+            for column in changed:
+                row = self.category_rows.get((entry.path, column))
+                if row is not None:
+                    row.refresh()
+        for entry, column in changed_selections:
+            self._refresh_scrape_panel(entry, column)
+
+    def _replace_regex_matches(self, entry: PDFEntry, category: str, found: List[RawMatch]) -> bool:
+        """Swap the regex matches of ``category`` while keeping manual picks.
+
+        Selected pages that no longer match are kept as manual matches so the
+        analyst's selection survives a pattern edit. Returns ``True`` when the
+        selected pages changed.
+        """
+
+        old_matches = entry.matches.get(category, [])
+        old_index = entry.current_index.get(category)
+        current_page: Optional[int] = None
+        if old_index is not None and 0 <= old_index < len(old_matches):
+            current_page = old_matches[old_index].page_index
+        old_selected = list(entry.selected_pages.get(category, []))
+
+        matches = [
+            Match(page_index=page_index, source="regex", pattern=pattern, matched_text=text)
+            for page_index, pattern, text in found
+        ]
+        kept_pages = {match.page_index for match in matches}
+        keep_manual = set(old_selected)
+        if current_page is not None:
+            keep_manual.add(current_page)
+        for match in old_matches:
+            if match.page_index in kept_pages:
+                continue
+            if match.source == "manual" or match.page_index in keep_manual:
+                matches.append(Match(page_index=match.page_index, source="manual"))
+                kept_pages.add(match.page_index)
+        matches.sort(key=lambda m: m.page_index)
+        entry.matches[category] = matches
+
+        new_index: Optional[int] = None
+        if current_page is not None:
+            new_index = next(
+                (idx for idx, match in enumerate(matches) if match.page_index == current_page), None
+            )
+        if new_index is None and matches:
+            new_index = 0
+        entry.current_index[category] = new_index
+        if not old_selected and new_index is not None:
+            entry.selected_pages[category] = [matches[new_index].page_index]
+        return entry.selected_pages.get(category, []) != old_selected
+
+    def _has_stored_year(self, entry: PDFEntry) -> bool:
+        record = self.assigned_pages.get(entry.path.name)
+        return isinstance(record, dict) and bool(record.get("year"))
+
+    def _open_page_text_cache(self) -> Optional[PageTextCache]:
+        company = self.company_var.get().strip()
+        if not company:
+            return None
+        max_mb = getattr(self.config, "text_cache_max_mb", 0)
+        return PageTextCache(self.companies_dir / company / TEXT_CACHE_DIRNAME, max_mb * 1024 * 1024)
 
-        import concurrent.futures
+    def _entry_from_scan(
+        self,
+        pdf_path: Path,
+        doc: "fitz.Document",  # type: ignore[name-defined]
+        raw_matches: Dict[str, List[RawMatch]],
+        year_value: str,
+        text_key: str = "",
+    ) -> PDFEntry:
+        matches: Dict[str, List[Match]] = {column: [] for column in COLUMNS}
+        for column, found in raw_matches.items():
+            matches[column] = [
+                Match(page_index=page_index, source="regex", pattern=pattern, matched_text=text)
+                for page_index, pattern, text in found
+            ]
+        entry = PDFEntry(path=pdf_path, doc=doc, matches=matches, year=year_value, text_key=text_key)
+        self._apply_existing_assignments(entry)
+        return entry
+
+    def _scan_pdfs_in_threads(
+        self,
+        pdf_paths: List[Path],
+        pattern_map: Dict[str, List[re.Pattern[str]]],
+        year_patterns: List[re.Pattern[str]],
+        workers: int,
+    ) -> None:
+        cache = self.page_text_cache
+        cache_dir = cache.cache_dir if cache is not None else None
 
         def process_pdf(pdf_path: Path) -> Optional[PDFEntry]:
             try:
@@ -174,35 +382,14 @@ class PDFManagerMixin:
                 messagebox.showwarning("PDF Error", f"Could not open '{pdf_path}': {exc}")
                 return None
 
-            matches: Dict[str, List[Match]] = {column: [] for column in COLUMNS}
-            year_value = ""
-            for page_index in range(len(doc)):
-                page = doc.load_page(page_index)
-                page_text = page.get_text("text")
-                for column, patterns in pattern_map.items():
-                    for pattern in patterns:
-                        match_obj = pattern.search(page_text)
-                        if match_obj:
-                            matches[column].append(
-                                Match(page_index=page_index, source="regex",
-                                      pattern=pattern.pattern,
-                                      matched_text=match_obj.group(0).strip())
-                            )
-                            break
-                if not year_value:
-                    for pattern in year_patterns:
-                        year_match = pattern.search(page_text)
-                        if year_match:
-                            year_value = year_match.group(1) if year_match.groups() else year_match.group(0)
-                            break
-
-            entry = PDFEntry(path=pdf_path, doc=doc, matches=matches, year=year_value)
-            self._apply_existing_assignments(entry)
-            return entry
-
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        self.pdf_entries.clear()
-        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+            known_key = cache.known_key(pdf_path) if cache is not None else ""
+            texts, text_key, _ = load_page_texts(pdf_path, cache_dir, known_key, doc=doc)
+            if cache is not None:
+                cache.remember(pdf_path, text_key)
+            raw_matches, year_value = scan_texts(texts, pattern_map, year_patterns)
+            return self._entry_from_scan(pdf_path, doc, raw_matches, year_value, text_key)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {executor.submit(process_pdf, p): p for p in pdf_paths}
             for i, future in enumerate(as_completed(futures), start=1):
                 entry = future.result()
@@ -210,17 +397,58 @@ class PDFManagerMixin:
                     self.pdf_entries.append(entry)
                 self.root.after(0, lambda n=i, t=len(pdf_paths): self.root.title(f"Loading PDFs {n}/{t}"))
 
-        self.root.title("Loading complete")
-
-        self._rebuild_review_grid()
-        self._save_config()
-        self.refresh_combined_tab()
-
-        status_label.config(text="✅ All PDFs loaded")
-        self.root.update_idletasks()
-
-        # --- Close progress window after done ---
-        close_progress()
+    def _scan_pdfs_in_processes(
+        self,
+        pdf_paths: List[Path],
+        pattern_map: Dict[str, List[re.Pattern[str]]],
+        year_patterns: List[re.Pattern[str]],
+        workers: int,
+    ) -> None:
+        """Extract and match page text in worker processes.
+
+        Workers only return :class:`ScanResult` objects; the documents used by
+        the Review grid are opened afterwards on the main thread.
+        """
+
+        cache = self.page_text_cache
+        cache_dir = cache.cache_dir if cache is not None else None
+        results: List[ScanResult] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    scan_pdf_path,
+                    p,
+                    pattern_map,
+                    year_patterns,
+                    cache_dir,
+                    cache.known_key(p) if cache is not None else "",
+                ): p
+                for p in pdf_paths
+            }
+            for i, future in enumerate(as_completed(futures), start=1):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    results.append(ScanResult(path=futures[future], error=str(exc)))
+                self.root.title(f"Loading PDFs {i}/{len(pdf_paths)}")
+                self.root.update_idletasks()
+
+        cached = sum(1 for result in results if result.text_cached)
+        logger.info("📄 Scanned %d PDF(s) in worker processes (%d from text cache)", len(results), cached)
+        for result in results:
+            if cache is not None:
+                cache.remember(result.path, result.text_key)
+            if result.error is not None:
+                messagebox.showwarning("PDF Error", f"Could not open '{result.path}': {result.error}")
+                continue
+            try:
+                doc = fitz.open(result.path)  # type: ignore[arg-type]
+            except Exception as exc:
+                messagebox.showwarning("PDF Error", f"Could not open '{result.path}': {exc}")
+                continue
+            self.pdf_entries.append(
+                self._entry_from_scan(result.path, doc, result.matches, result.year, result.text_key)
+            )
 
     def _apply_existing_assignments(self, entry: PDFEntry) -> None:
         record = self.assigned_pages.get(entry.path.name)
@@ -304,69 +532,219 @@ class PDFManagerMixin:
         *,
         target_width: Optional[int] = None,
         target_height: Optional[int] = None,
+        high_quality: bool = False,
     ) -> Optional[ImageTk.PhotoImage]:
+        image = self.render_page_image(
+            doc,
+            page_index,
+            target_width=target_width,
+            target_height=target_height,
+            high_quality=high_quality,
+        )
+        if image is None:
+            return None
         try:
-            page = doc.load_page(page_index)
-            zoom_matrix = fitz.Matrix(1.5, 1.5)
-            pix = page.get_pixmap(matrix=zoom_matrix)
-            mode = "RGBA" if pix.alpha else "RGB"
-            image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-            if image.mode == "RGBA":
-                image = image.convert("RGB")
-            scale: Optional[float] = None
-            if target_width and target_width > 0:
-                scale = target_width / image.width
-            if target_height and target_height > 0:
-                height_scale = target_height / image.height
-                scale = min(scale, height_scale) if scale else height_scale
-            if scale and abs(scale - 1.0) > 0.01:
-                new_size = (
-                    max(1, int(image.width * scale)),
-                    max(1, int(image.height * scale)),
-                )
-                image = image.resize(new_size, Image.LANCZOS)
             return ImageTk.PhotoImage(image, master=self.root)
         except Exception:
             return None
 
-    def export_pages_to_pdf(self, doc: fitz.Document, pages: List[int]) -> Optional[Path]:  # type: ignore[type-arg]
+    def render_page_image(
+        self,
+        doc: fitz.Document,  # type: ignore[type-arg]
+        page_index: int,
+        *,
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+        high_quality: bool = False,
+    ) -> Optional[Image.Image]:
+        """Return a PIL image of ``page_index`` scaled to the target size.
+
+        Results are served from :attr:`render_cache`. A size that is not cached
+        yet is reduced from the cached master raster when that is large enough,
+        otherwise MuPDF renders it directly at the target resolution.
+        """
+
+        cache: Optional[RenderCache] = getattr(self, "render_cache", None)
+        identity, size_key = self._render_key_parts(doc, target_width, target_height, high_quality)
+        image = self.cached_page_image(
+            doc, page_index, target_width=target_width, target_height=target_height, high_quality=high_quality
+        )
+        if image is not None:
+            return image
+        master = cache.get((identity, page_index, None)) if cache is not None else None
+        try:
+            image = None
+            if master is not None and not high_quality:
+                image = self._reduce_master(master, target_width, target_height)
+            if image is not None:
+                cache.record("rescale")  # type: ignore[union-attr]
+            else:
+                image = rasterize_page(
+                    doc, page_index, target_width, target_height, high_quality=high_quality
+                )
+                if cache is not None:
+                    cache.record("miss")
+                    if master is None or image.width > master.width:
+                        cache.put((identity, page_index, None), image)
+        except Exception:
+            return None
+        if cache is not None:
+            cache.put((identity, page_index, size_key), image)
+        return image
+
+    @staticmethod
+    def _render_key_parts(
+        doc: fitz.Document,  # type: ignore[type-arg]
+        target_width: Optional[int],
+        target_height: Optional[int],
+        high_quality: bool,
+    ) -> Tuple[Any, Tuple[int, int, str]]:
+        identity = file_identity(str(getattr(doc, "name", "") or id(doc)))
+        quality = "high" if high_quality else "fast"
+        return identity, (int(target_width or 0), int(target_height or 0), quality)
+
+    def cached_page_image(
+        self,
+        doc: fitz.Document,  # type: ignore[type-arg]
+        page_index: int,
+        *,
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+        high_quality: bool = False,
+    ) -> Optional[Image.Image]:
+        """Return the cached image for this exact size without rendering anything."""
+
+        cache: Optional[RenderCache] = getattr(self, "render_cache", None)
+        if cache is None:
+            return None
+        identity, size_key = self._render_key_parts(doc, target_width, target_height, high_quality)
+        image = cache.get((identity, page_index, size_key))
+        if image is not None:
+            cache.record("hit")
+        return image
+
+    def store_page_image(
+        self,
+        doc: fitz.Document,  # type: ignore[type-arg]
+        page_index: int,
+        image: Image.Image,
+        *,
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+    ) -> None:
+        """Add an image rendered elsewhere (e.g. the thumbnail pipeline) to the cache."""
+
+        cache: Optional[RenderCache] = getattr(self, "render_cache", None)
+        if cache is None:
+            return
+        identity, size_key = self._render_key_parts(doc, target_width, target_height, False)
+        cache.record("miss")
+        master = cache.get((identity, page_index, None))
+        if master is None or image.width > master.width:
+            cache.put((identity, page_index, None), image)
+        cache.put((identity, page_index, size_key), image)
+
+    @staticmethod
+    def _reduce_master(
+        master: Image.Image, target_width: Optional[int], target_height: Optional[int]
+    ) -> Optional[Image.Image]:
+        """Downscale ``master`` to the target size, or ``None`` if it is too small."""
+
+        scale: Optional[float] = None
+        if target_width and target_width > 0:
+            scale = target_width / master.width
+        if target_height and target_height > 0:
+            height_scale = target_height / master.height
+            scale = min(scale, height_scale) if scale else height_scale
+        if scale is None or scale > 1.01:
+            return None
+        if abs(scale - 1.0) <= 0.01:
+            return master
+        new_size = (max(1, int(master.width * scale)), max(1, int(master.height * scale)))
+        return master.resize(new_size, Image.LANCZOS)
+
+    def show_render_cache_stats(self) -> None:
+        cache: Optional[RenderCache] = getattr(self, "render_cache", None)
+        if cache is None:
+            messagebox.showinfo("Render Cache", "The render cache is disabled.")
+            return
+        stats = cache.stats()
+        messagebox.showinfo(
+            "Render Cache",
+            "\n".join(
+                [
+                    f"Hits: {stats.hits}",
+                    f"Rescaled from master: {stats.rescales}",
+                    f"Misses (rendered by MuPDF): {stats.misses}",
+                    f"Hit rate: {stats.hit_rate:.1%}",
+                    f"Evictions: {stats.evictions}",
+                    f"Entries: {stats.entries}",
+                    f"Memory: {stats.bytes_used / (1024 * 1024):.1f} / "
+                    f"{stats.max_bytes / (1024 * 1024):.0f} MB",
+                ]
+            ),
+        )
+
+    def export_pages_to_bytes(self, doc: fitz.Document, pages: List[int]) -> Optional[bytes]:  # type: ignore[type-arg]
+        """Build a PDF of ``pages`` in memory and return its bytes.
+
+        Unused objects are dropped and streams deflated so the slice uploaded
+        to OpenAI and kept in ``PDF_FOLDER`` is as small as the source allows.
+        """
+
         if not pages:
             return None
-        temp_path: Optional[Path] = None
         try:
             unique_pages = sorted(dict.fromkeys(int(page) for page in pages))
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                temp_path = Path(tmp.name)
             new_doc = fitz.open()
             try:
                 for page_index in unique_pages:
                     new_doc.insert_pdf(doc, from_page=page_index, to_page=page_index)
-                new_doc.save(temp_path)
+                # A fixed document ID keeps identical slices byte-identical.
+                return new_doc.tobytes(garbage=3, deflate=True, no_new_id=True)
             finally:
                 new_doc.close()
-            return temp_path
         except Exception:
-            try:
-                if temp_path is not None:
-                    temp_path.unlink()
-            except Exception:
-                pass
             return None
 
-    def extract_pages_text(self, doc: fitz.Document, pages: List[int]) -> Optional[str]:  # type: ignore[type-arg]
-        if not pages:
-            return None
-        snippets: List[str] = []
-        seen: List[int] = sorted(dict.fromkeys(int(page) for page in pages))
-        for page_index in seen:
+    def _selected_page_texts(
+        self,
+        doc: fitz.Document,  # type: ignore[type-arg]
+        pages: List[int],
+        cached_texts: Optional[List[str]],
+    ) -> List[Tuple[int, str]]:
+        texts: List[Tuple[int, str]] = []
+        for page_index in sorted(dict.fromkeys(int(page) for page in pages)):
             try:
-                page = doc.load_page(page_index)
-                text = page.get_text("text")
+                if cached_texts is not None and 0 <= page_index < len(cached_texts):
+                    text = cached_texts[page_index]
+                else:
+                    text = doc.load_page(page_index).get_text("text")
             except Exception:
                 logger.exception(
                     "Failed to extract text for page %s in %s", page_index + 1, getattr(doc, "name", "document")
                 )
                 continue
+            texts.append((page_index, text))
+        return texts
+
+    def _cached_page_texts(self, cache_key: str) -> Optional[List[str]]:
+        cache = getattr(self, "page_text_cache", None)
+        if cache_key and cache is not None:
+            return cache.read(cache_key)
+        return None
+
+    def extract_pages_text(
+        self,
+        doc: fitz.Document,  # type: ignore[type-arg]
+        pages: List[int],
+        *,
+        cache_key: str = "",
+    ) -> Optional[str]:
+        if not pages:
+            return None
+        snippets: List[str] = []
+        for page_index, text in self._selected_page_texts(doc, pages, self._cached_page_texts(cache_key)):
             cleaned = text.strip()
             if not cleaned:
                 continue
@@ -374,6 +752,35 @@ class PDFManagerMixin:
         combined = "\n\n".join(snippets).strip()
         return combined or None
 
+    def extract_pages_text_compacted(
+        self,
+        doc: fitz.Document,  # type: ignore[type-arg]
+        pages: List[int],
+        *,
+        cache_key: str = "",
+        tables_only: bool = False,
+    ) -> Optional[CompactionResult]:
+        """Like :meth:`extract_pages_text`, with running headers/footers and whitespace removed.
+
+        Headers and footers are detected against the whole document when its
+        page texts are cached, otherwise against the selected pages.
+        """
+
+        if not pages:
+            return None
+        cached_texts = self._cached_page_texts(cache_key)
+        texts = self._selected_page_texts(doc, pages, cached_texts)
+        block_texts: Optional[List[Optional[str]]] = None
+        if tables_only:
+            block_texts = []
+            for page_index, _ in texts:
+                try:
+                    block_texts.append(table_blocks_text(doc.load_page(page_index)))
+                except Exception:
+                    block_texts.append(None)
+        result = compact_page_texts(texts, cached_texts, block_texts)
+        return result if result.text else None
+
     def _get_selected_page_index(self, entry: PDFEntry, category: str) -> Optional[int]:
         matches = entry.matches.get(category, [])
         index = entry.current_index.get(category)
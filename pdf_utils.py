@@ -14,7 +14,7 @@ try:
 except ImportError:  # pragma: no cover - handled at runtime
     fitz = None  # type: ignore[assignment]
 
-from PIL import ImageTk
+from PIL import Image, ImageTk
 
 from constants import COLUMNS, CONTROL_MASK, SCRAPE_EXPECTED_COLUMNS, SHIFT_MASK
 
@@ -39,6 +39,7 @@ class PDFEntry:
     current_index: Dict[str, Optional[int]] = field(default_factory=dict)
     selected_pages: Dict[str, List[int]] = field(default_factory=dict)
     year: str = ""
+    text_key: str = ""
 
     def __post_init__(self) -> None:
         for column in COLUMNS:
@@ -84,16 +85,7 @@ class MatchThumbnail:
         self.refresh()
 
     def refresh(self) -> None:
-        photo = self.app.render_page(
-            self.entry.doc,
-            self.match.page_index,
-            target_width=self.row.target_width,
-        )
-        self.photo = photo
-        if photo is not None:
-            self.image_label.configure(image=photo, text="")
-        else:
-            self.image_label.configure(image="", text="Preview unavailable")
+        self.app.request_thumbnail(self)
 
         info_parts = [f"Page {self.match.page_index + 1}"]
         if self.match.source == "manual":
@@ -103,6 +95,27 @@ class MatchThumbnail:
         self.info_label.configure(text=" | ".join(info_parts))
         self.update_state()
 
+    def set_image(self, image: "Image.Image") -> None:
+        try:
+            photo = ImageTk.PhotoImage(image, master=self.app.root)
+        except Exception:
+            photo = None
+        self.photo = photo
+        if photo is not None:
+            self.image_label.configure(image=photo, text="")
+        else:
+            self.image_label.configure(image="", text="Preview unavailable")
+
+    def show_placeholder(self) -> None:
+        self.photo = None
+        self.image_label.configure(image="", text="Loading…")
+
+    def exists(self) -> bool:
+        try:
+            return bool(self.container.winfo_exists())
+        except tk.TclError:
+            return False
+
     def destroy(self) -> None:
         self.container.destroy()
 
@@ -0,0 +1,186 @@
+"""Page rasterisation and a bounded in-memory cache of rendered page images.
+
+MuPDF renders pages directly at the requested size (see :func:`rasterize_page`)
+rather than at a fixed zoom followed by a PIL downscale. Two kinds of entries
+share one byte budget: a *master* raster per ``(pdf, page)`` – the largest
+rendering produced so far – and *sized* images per ``(pdf, page, target
+size)``. Shrinking the thumbnail width therefore reduces the cached master
+instead of rasterising the page again. Entries are evicted
+least-recently-used first.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+try:
+    import fitz  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - handled at runtime
+    fitz = None  # type: ignore[assignment]
+
+from PIL import Image
+
+
+# Zoom used when neither a target width nor height is requested.
+DEFAULT_ZOOM = 1.5
+# Supersampling factor of the high-quality (fullscreen) path.
+HIGH_QUALITY_OVERSAMPLE = 2.0
+
+# (path, size, mtime_ns) – a re-saved PDF never hits stale images.
+FileIdentity = Tuple[str, int, int]
+# (file identity, page index, (target width, target height, quality) or None for the master)
+RenderKey = Tuple[FileIdentity, int, Optional[Tuple[int, int, str]]]
+
+
+def file_identity(path: str) -> FileIdentity:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, -1, -1)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+def target_zoom(
+    page_rect: "fitz.Rect",  # type: ignore[name-defined]
+    target_width: Optional[int],
+    target_height: Optional[int],
+) -> float:
+    """Return the zoom at which ``page_rect`` fits the requested target size."""
+
+    zoom: Optional[float] = None
+    if target_width and target_width > 0 and page_rect.width > 0:
+        zoom = target_width / page_rect.width
+    if target_height and target_height > 0 and page_rect.height > 0:
+        height_zoom = target_height / page_rect.height
+        zoom = min(zoom, height_zoom) if zoom else height_zoom
+    return zoom or DEFAULT_ZOOM
+
+
+def pixmap_to_image(pix: "fitz.Pixmap") -> Image.Image:  # type: ignore[name-defined]
+    mode = "RGBA" if pix.alpha else "RGB"
+    image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
+    if image.mode == "RGBA":
+        image = image.convert("RGB")
+    return image
+
+
+def rasterize_page(
+    doc: "fitz.Document",  # type: ignore[name-defined]
+    page_index: int,
+    target_width: Optional[int] = None,
+    target_height: Optional[int] = None,
+    *,
+    high_quality: bool = False,
+) -> Image.Image:
+    """Let MuPDF render ``page_index`` directly at the target size.
+
+    With ``high_quality`` the page is rendered at twice the resolution and
+    reduced with LANCZOS, which gives crisper small text for the fullscreen
+    preview at roughly four times the rasterisation cost.
+    """
+
+    page = doc.load_page(page_index)
+    zoom = target_zoom(page.rect, target_width, target_height)
+    if not high_quality:
+        return pixmap_to_image(page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False))
+    oversampled = zoom * HIGH_QUALITY_OVERSAMPLE
+    image = pixmap_to_image(page.get_pixmap(matrix=fitz.Matrix(oversampled, oversampled), alpha=False))
+    final_size = (
+        max(1, round(image.width / HIGH_QUALITY_OVERSAMPLE)),
+        max(1, round(image.height / HIGH_QUALITY_OVERSAMPLE)),
+    )
+    return image.resize(final_size, Image.LANCZOS)
+
+
+def image_nbytes(image: Image.Image) -> int:
+    return image.width * image.height * max(1, len(image.getbands()))
+
+
+@dataclass
+class RenderCacheStats:
+    hits: int = 0
+    rescales: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes_used: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.rescales + self.misses
+        return (self.hits + self.rescales) / lookups if lookups else 0.0
+
+
+class RenderCache:
+    """Thread-safe byte-bounded LRU of PIL page images."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._items: "OrderedDict[RenderKey, Image.Image]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = RenderCacheStats(max_bytes=self.max_bytes)
+
+    def get(self, key: RenderKey) -> Optional[Image.Image]:
+        with self._lock:
+            image = self._items.get(key)
+            if image is not None:
+                self._items.move_to_end(key)
+            return image
+
+    def put(self, key: RenderKey, image: Image.Image) -> None:
+        size = image_nbytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._bytes -= image_nbytes(previous)
+            self._items[key] = image
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._items:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= image_nbytes(evicted)
+                self._stats.evictions += 1
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: ``"hit"``, ``"rescale"`` or ``"miss"``."""
+
+        with self._lock:
+            if outcome == "hit":
+                self._stats.hits += 1
+            elif outcome == "rescale":
+                self._stats.rescales += 1
+            else:
+                self._stats.misses += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> RenderCacheStats:
+        with self._lock:
+            snapshot = RenderCacheStats(**vars(self._stats))
+            snapshot.entries = len(self._items)
+            snapshot.bytes_used = self._bytes
+            snapshot.max_bytes = self.max_bytes
+            return snapshot
+
+    def as_dict(self) -> Dict[str, float]:
+        stats = self.stats()
+        return {
+            "hits": stats.hits,
+            "rescales": stats.rescales,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+            "entries": stats.entries,
+            "bytes_used": stats.bytes_used,
+            "max_bytes": stats.max_bytes,
+            "hit_rate": stats.hit_rate,
+        }
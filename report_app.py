@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import tkinter as tk
 from tkinter import messagebox, ttk
@@ -19,16 +20,26 @@ from PIL import ImageTk
 from app_logging import get_logger
 from company_manager import CompanyManagerMixin
 from config_manager import ConfigManager
-from constants import COLUMNS, DEFAULT_OPENAI_MODEL, DEFAULT_NOTE_COLOR_SCHEME, FALLBACK_NOTE_PALETTE
+from constants import (
+    COLUMNS,
+    DEFAULT_NOTE_COLOR_SCHEME,
+    DEFAULT_OPENAI_MODEL,
+    FALLBACK_NOTE_PALETTE,
+    SCAN_MODE_THREAD,
+    SCAN_MODES,
+)
 from pdf_manager import PDFManagerMixin
 from pdf_utils import PDFEntry
 from scrape_manager import ScrapeManagerMixin
+from render_cache import RenderCache
 from scrape_panel import ScrapeResultPanel
+from text_cache import PageTextCache
+from thumbnail_pipeline import ThumbnailPipeline
 from ui_combined import CombinedUIMixin
 from ui_main import MainUIMixin
 from ui_review import ReviewUIMixin
 from ui_scrape import ScrapeUIMixin
-from ui_widgets import CategoryRow
+from ui_widgets import CategoryRow, ReviewEntryRow
 
 
 class ReportAppV2(
@@ -87,7 +98,17 @@ class ReportAppV2(
         self.fallback_note_palette: List[str] = list(FALLBACK_NOTE_PALETTE)
 
         self.pdf_entries: List[PDFEntry] = []
+        self.page_text_cache: Optional[PageTextCache] = None
+        self.scanned_folder: Optional[Path] = None
+        self.scanned_pattern_signatures: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        self.scanned_year_signature: Optional[Tuple[Tuple[str, int], ...]] = None
         self.category_rows: Dict[Tuple[Path, str], CategoryRow] = {}
+        self._review_entry_positions: Dict[Path, int] = {}
+        self._reprioritize_after: Optional[str] = None
+        self._review_rows_by_index: Dict[int, ReviewEntryRow] = {}
+        self._review_row_pool: List[ReviewEntryRow] = []
+        self._review_slot_height = 0
+        self._review_update_after: Optional[str] = None
         self.assigned_pages: Dict[str, Dict[str, Any]] = {}
         self.assigned_pages_path: Optional[Path] = None
         self.fullscreen_preview_window: Optional[tk.Toplevel] = None
@@ -97,6 +118,7 @@ class ReportAppV2(
 
         self.scrape_panels: Dict[Tuple[Path, str], ScrapeResultPanel] = {}
         self.active_scrape_key: Optional[Tuple[Path, str]] = None
+        self.stale_scrape_keys: Set[Tuple[Path, str]] = set()
         self.scrape_row_registry: Dict[Tuple[str, str, str], List[Tuple[ScrapeResultPanel, str]]] = {}
         self.scrape_row_state_by_key: Dict[Tuple[str, str, str], str] = {}
         self.scrape_preview_photo: Optional[ImageTk.PhotoImage] = None
@@ -108,11 +130,21 @@ class ReportAppV2(
         self.scrape_preview_render_width: int = 0
         self.scrape_preview_render_page: Optional[int] = None
         self._scrape_thread: Optional[threading.Thread] = None
+        # Backfill runs and the background batch poll share the lock so each batch is collected once.
+        self._batch_collect_lock = threading.Lock()
+        self._batch_poll_after: Optional[str] = None
+        self._batch_poll_cancel = threading.Event()
 
         self.downloads_dir = tk.StringVar(master=self.root)
         self.recent_download_minutes = tk.IntVar(master=self.root, value=5)
         # Auto-load last company toggle
         self.auto_load_last_company_var = tk.BooleanVar(master=self.root, value=False)
+        self.bypass_response_cache_var = tk.BooleanVar(master=self.root, value=False)
+        self.batch_scrape_categories_var = tk.BooleanVar(master=self.root, value=False)
+        self.stream_scrape_responses_var = tk.BooleanVar(master=self.root, value=False)
+        self.compact_text_payload_var = tk.BooleanVar(master=self.root, value=True)
+        self.text_tables_only_var = tk.BooleanVar(master=self.root, value=False)
+        self.local_table_extract_var = tk.BooleanVar(master=self.root, value=False)
 
         # Combined tab state
         self.combined_date_tree: Optional[ttk.Treeview] = None
@@ -131,9 +163,16 @@ class ReportAppV2(
         self.combined_rename_names: List[str] = []  # dynamic column names used as headers
         self.combined_date_all_col_ids: List[str] = []
         self.combined_table_col_ids: List[str] = []
+        self.combined_refresh_requests = 0
+        self.combined_refresh_runs = 0
+        self.combined_refresh_coalesced = 0
+        self._combined_refresh_after: Optional[str] = None
 
         self._suspend_api_key_save = True
         self.config = ConfigManager.load()
+        self.render_cache = RenderCache(self.config.render_cache_max_mb * 1024 * 1024)
+        self.thumbnail_pipeline = ThumbnailPipeline(self.root, self.get_scan_worker_count())
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._apply_config_state()
         self._suspend_api_key_save = False
         self._build_ui()
@@ -167,6 +206,13 @@ class ReportAppV2(
         self.logger.info("Logger initialized and bound to ReportAppV2")
         self.logger.info("✅ Shared logger setup complete")
 
+    def _on_close(self) -> None:
+        """Stop background workers, then destroy the root window."""
+
+        self.thumbnail_pipeline.shutdown()
+        self.stop_batch_polling()
+        self.root.destroy()
+
     def _apply_config_state(self) -> None:
         """Populate runtime state from the shared configuration object."""
 
@@ -200,6 +246,12 @@ class ReportAppV2(
 
         auto_load = bool(getattr(self.config, "auto_load_last_company", False))
         self.auto_load_last_company_var.set(auto_load)
+        self.bypass_response_cache_var.set(bool(getattr(self.config, "bypass_response_cache", False)))
+        self.batch_scrape_categories_var.set(bool(getattr(self.config, "batch_scrape_categories", False)))
+        self.stream_scrape_responses_var.set(bool(getattr(self.config, "stream_scrape_responses", False)))
+        self.compact_text_payload_var.set(bool(getattr(self.config, "compact_text_payload", True)))
+        self.text_tables_only_var.set(bool(getattr(self.config, "text_tables_only", False)))
+        self.local_table_extract_var.set(bool(getattr(self.config, "local_table_extract", False)))
 
         api_key = getattr(self.config, "api_key", "") or ""
         self.api_key_var.set(api_key)
@@ -345,6 +397,12 @@ class ReportAppV2(
         self.config.downloads_dir = self.downloads_dir.get().strip()
         self.config.last_company = self.company_var.get().strip()
         self.config.auto_load_last_company = bool(self.auto_load_last_company_var.get())
+        self.config.bypass_response_cache = bool(self.bypass_response_cache_var.get())
+        self.config.batch_scrape_categories = bool(self.batch_scrape_categories_var.get())
+        self.config.stream_scrape_responses = bool(self.stream_scrape_responses_var.get())
+        self.config.compact_text_payload = bool(self.compact_text_payload_var.get())
+        self.config.text_tables_only = bool(self.text_tables_only_var.get())
+        self.config.local_table_extract = bool(self.local_table_extract_var.get())
         try:
             self.config.save()
         except OSError:
@@ -377,6 +435,52 @@ class ReportAppV2(
         except OSError as exc:
             self.logger.warning("⚠️ Could not save thread count: %s", exc)
 
+    def get_openai_base_url(self) -> str:
+        """Return the OpenAI-compatible endpoint for AIScrape ("" for the default)."""
+
+        return str(getattr(self.config, "openai_base_url", "") or "").strip()
+
+    def set_openai_base_url(self, value: str) -> None:
+        """Persist the OpenAI endpoint used by AIScrape."""
+
+        self.config.openai_base_url = str(value or "").strip()
+        try:
+            self.config.save()
+            self.logger.info("💾 Saved OpenAI endpoint = %s", self.config.openai_base_url or "(default)")
+        except OSError as exc:
+            self.logger.warning("⚠️ Could not save OpenAI endpoint: %s", exc)
+
+    def get_scan_worker_count(self) -> int:
+        """Return the number of workers used to scan PDFs in ``load_pdfs``."""
+
+        value = getattr(self.config, "scan_workers", 0)
+        if isinstance(value, int) and value > 0:
+            return value
+        return min(8, os.cpu_count() or 4)
+
+    def get_scan_mode(self) -> str:
+        """Return the configured PDF scan engine (thread or process pool)."""
+
+        mode = getattr(self.config, "scan_mode", SCAN_MODE_THREAD)
+        return mode if mode in SCAN_MODES else SCAN_MODE_THREAD
+
+    def set_scan_settings(self, workers: int, mode: str) -> None:
+        """Persist the PDF scan worker count and engine."""
+
+        try:
+            count = int(workers)
+            if count <= 0:
+                raise ValueError
+        except (TypeError, ValueError):
+            count = self.get_scan_worker_count()
+        self.config.scan_workers = count
+        self.config.scan_mode = mode if mode in SCAN_MODES else SCAN_MODE_THREAD
+        try:
+            self.config.save()
+            self.logger.info("💾 Saved scan workers = %d (mode=%s) to config", count, self.config.scan_mode)
+        except OSError as exc:
+            self.logger.warning("⚠️ Could not save scan settings: %s", exc)
+
     def _persist_api_key(self, value: str) -> None:
         trimmed = value.strip()
         if trimmed == getattr(self.config, "api_key", ""):
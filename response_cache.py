@@ -0,0 +1,119 @@
+"""Content-addressed cache of raw AIScrape responses.
+
+Responses live in ``companies/<company>/response_cache/<key>.txt.gz`` where
+the key is the SHA-256 of the model name, the prompt text and the request
+content – the bytes of the exported page slice in PDF mode or the extracted
+text payload in text mode. Re-running a job whose request did not change
+(e.g. after deleting its CSV) is answered from disk instead of OpenAI.
+Entries are evicted least-recently-used first once the directory exceeds its
+byte budget.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from app_logging import get_logger
+
+
+logger = get_logger()
+
+RESPONSE_CACHE_DIRNAME = "response_cache"
+BLOB_SUFFIX = ".txt.gz"
+# Bump when the request layout changes so old responses are not reused.
+KEY_VERSION = "1"
+
+
+def response_key(model: str, prompt: str, content: Union[bytes, str]) -> str:
+    """Return the cache key for one request."""
+
+    digest = hashlib.sha256()
+    for part in (f"v{KEY_VERSION}", model.strip(), prompt):
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    payload = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+    digest.update(len(payload).to_bytes(8, "big"))
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe directory of gzipped response texts with LRU eviction."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{BLOB_SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                text = fh.read()
+            os.utime(path)  # mark as recently used
+        except (OSError, EOFError, UnicodeDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        if self.max_bytes <= 0:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=".resp.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as fh:
+                    fh.write(text.encode("utf-8"))
+                os.replace(tmp_name, self._path(key))
+            except Exception:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError as exc:
+            logger.warning("⚠️ Could not store AIScrape response in cache: %s", exc)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries beyond the byte budget; return the count."""
+
+        with self._lock:
+            try:
+                entries = []
+                for path in self.cache_dir.glob(f"*{BLOB_SUFFIX}"):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, path))
+            except OSError:
+                return 0
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            if removed:
+                logger.info("🧹 Evicted %d cached AIScrape response(s) from %s", removed, self.cache_dir)
+            return removed
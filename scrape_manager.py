@@ -2,29 +2,88 @@ from __future__ import annotations
 
 import csv
 import io
-import shutil
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from tkinter import messagebox
 
+try:
+    import fitz  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - handled at runtime
+    fitz = None  # type: ignore[assignment]
+
 try:
     from openai import OpenAI
 except ImportError:  # pragma: no cover - handled at runtime
     OpenAI = None  # type: ignore[assignment]
 
 from app_logging import get_logger
+from batch_backfill import (
+    BATCH_MAX_ROUNDS,
+    BATCH_POLL_SECONDS,
+    MAX_BATCH_REQUESTS,
+    BatchBackfillState,
+    BatchRequest,
+    delete_batch_files,
+    fetch_batch_results,
+    submit_batch,
+    wait_for_batch,
+)
 from constants import COLUMNS, DEFAULT_OPENAI_MODEL, SCRAPE_EXPECTED_COLUMNS
-from models import ScrapeJob
-from pdf_utils import normalize_header_row
+from local_table_extract import extract_statement
+from models import ScrapeJob, ScrapeJobGroup
+from multi_category import build_batched_prompt, split_batched_response, union_pages
+from openai_clients import get_openai_clients
+from pdf_utils import PDFEntry, normalize_header_row
+from response_cache import RESPONSE_CACHE_DIRNAME, ResponseCache, response_key
+from scrape_scheduler import (
+    JOB_DONE,
+    JOB_FAILED,
+    RequestSlot,
+    ScheduledJob,
+    ScrapeJobState,
+    ScrapeScheduler,
+    classify_error,
+    estimate_tokens,
+)
+from scrape_store import get_scrape_store
+from scrape_stream import STREAM_UI_INTERVAL, IncrementalScrapeParser, StreamingCSVWriter
+from upload_registry import UploadRegistry, account_fingerprint, is_missing_file_error, upload_pdf_bytes
+
+
+class _SourceDocument:
+    """Private PyMuPDF handle on the report being prepared, reopened when the path changes.
 
+    ``PDFEntry.doc`` belongs to the Tk thread and PyMuPDF documents are not
+    safe to share between threads, so AIScrape workers open their own copy.
+    """
+
+    def __init__(self) -> None:
+        self._path: Optional[Path] = None
+        self._doc: Any = None
+
+    def get(self, entry: PDFEntry) -> Any:
+        if self._doc is None or self._path != entry.path:
+            self.close()
+            if fitz is None:
+                raise RuntimeError("PyMuPDF is not installed")
+            self._doc = fitz.open(entry.path)
+            self._path = entry.path
+        return self._doc
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+        self._doc = None
+        self._path = None
 
 
 class ScrapeManagerMixin:
     logger = get_logger()
 
     scrape_button: Any
+    backfill_button: Any
     scrape_progress: Any
     pdf_entries: List[Any]
     company_var: Any
@@ -35,6 +94,9 @@ class ScrapeManagerMixin:
     scrape_panels: Dict[Any, Any]
     active_scrape_key: Optional[Any]
     root: Any
+    _batch_collect_lock: threading.Lock
+    _batch_poll_after: Optional[str]
+    _batch_poll_cancel: threading.Event
 
     def _get_prompt_text(self, company: str, category: str) -> Optional[str]:
         candidate_paths: List[Path] = []
@@ -114,31 +176,110 @@ class ScrapeManagerMixin:
         return multiplier, header, normalized_rows
 
     def _csv_has_data(self, path: Path) -> bool:
-        try:
-            with path.open("r", encoding="utf-8", newline="") as fh:
-                reader = csv.reader(fh)
-                header_seen = False
-                for raw_row in reader:
-                    if not any(cell.strip() for cell in raw_row):
-                        continue
-                    normalized = [cell.strip() for cell in raw_row]
-                    if not header_seen:
-                        header_seen = True
-                        if normalize_header_row(normalized) is None:
-                            return True
-                        continue
-                    return True
-        except OSError:
-            return False
-        return False
+        table = get_scrape_store().get(path)
+        return table is not None and table.has_data()
+
+    def _openai_client(self, api_key: str) -> Any:
+        """Shared client for ``api_key``; its pool matches the AIScrape thread count."""
+
+        pool_size = getattr(self, "thread_count", 3)
+        if not isinstance(pool_size, int) or pool_size <= 0:
+            pool_size = 3
+        return get_openai_clients().get(api_key, self.get_openai_base_url(), pool_size)
+
+    def _create_openai_response(
+        self,
+        client: Any,
+        slot: Optional[RequestSlot],
+        on_delta: Optional[Callable[[str], None]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call ``responses.create`` and report rate-limit headers and usage to ``slot``.
+
+        With ``on_delta`` the response is streamed: each output text delta is
+        passed to it and the completed response is returned.
+        """
+
+        if on_delta is not None:
+            kwargs["stream"] = True
+        if slot is None:
+            result = client.responses.create(**kwargs)
+            headers = None
+        else:
+            # The scheduler owns retries and back-off; stop the SDK retrying too.
+            raw = client.with_options(max_retries=0).responses.with_raw_response.create(**kwargs)
+            result = raw.parse()
+            headers = raw.headers
+        response = self._consume_response_stream(result, on_delta) if on_delta is not None else result
+        if slot is not None:
+            usage = getattr(response, "usage", None)
+            slot.observe(headers, getattr(usage, "total_tokens", None))
+        return response
+
+    def _consume_response_stream(self, stream: Any, on_delta: Callable[[str], None]) -> Any:
+        response = None
+        with stream:
+            for event in stream:
+                event_type = getattr(event, "type", "")
+                if event_type == "response.output_text.delta":
+                    on_delta(str(getattr(event, "delta", "")))
+                elif event_type == "response.completed":
+                    response = getattr(event, "response", None)
+                elif event_type in {"response.failed", "response.incomplete", "error"}:
+                    details = getattr(getattr(event, "response", None), "error", None) or getattr(event, "message", "")
+                    raise ValueError(f"OpenAI stream ended with {event_type}: {details}")
+        if response is None:
+            raise ValueError("OpenAI stream ended before the response completed")
+        return response
+
+    def _pdf_request_input(self, prompt: str, file_ids: List[str]) -> List[Dict[str, Any]]:
+        user_entries: List[Dict[str, Any]] = [
+            {"type": "input_text", "text": prompt},
+            {
+                "type": "input_text",
+                "text": "Parse the attached PDFs and return the multiplier value and CSV rows.",
+            },
+        ]
+        user_entries.extend({"type": "input_file", "file_id": fid} for fid in file_ids)
+        return [
+            {
+                "role": "system",
+                "content": "You are a financial statement parser.",
+            },
+            {"role": "user", "content": user_entries},
+        ]
+
+    def _text_request_input(self, prompt: str, text_payload: str) -> List[Dict[str, Any]]:
+        user_entries: List[Dict[str, Any]] = [
+            {"type": "input_text", "text": prompt},
+            {
+                "type": "input_text",
+                "text": "Parse the provided text excerpt and return the multiplier value and CSV rows.",
+            },
+            {"type": "input_text", "text": text_payload},
+        ]
+        return [
+            {
+                "role": "system",
+                "content": "You are a financial statement parser.",
+            },
+            {"role": "user", "content": user_entries},
+        ]
 
     def _call_openai_with_pdfs(
-        self, api_key: str, prompt: str, pdf_paths: List[Path], model_name: str
+        self,
+        api_key: str,
+        prompt: str,
+        pdfs: List[Tuple[str, bytes]],
+        model_name: str,
+        slot: Optional[RequestSlot] = None,
+        uploads: Optional[UploadRegistry] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> str:
         sanitized_key = api_key.strip()
         if not sanitized_key:
             raise ValueError("API key is required")
-        if not pdf_paths:
+        if not pdfs:
             raise ValueError("No PDF pages available for OpenAI request")
 
         selected_model = model_name.strip() or DEFAULT_OPENAI_MODEL
@@ -146,48 +287,49 @@ class ScrapeManagerMixin:
         if OpenAI is None:  # pragma: no cover - checked at runtime
             raise ValueError("OpenAI client is not available")
 
-        client = OpenAI(api_key=sanitized_key)
-        file_ids: List[str] = []
-        for pdf_path in pdf_paths:
-            self.logger.info("AIScrape uploading %s", pdf_path)
-            with pdf_path.open("rb") as pdf_file:
-                uploaded = client.files.create(file=pdf_file, purpose="assistants")
-                file_id = getattr(uploaded, "id", None)
-                if not file_id:
-                    raise ValueError(f"Failed to upload {pdf_path.name} to OpenAI")
-                file_ids.append(str(file_id))
-                self.logger.info("AIScrape uploaded %s as file id %s", pdf_path.name, file_id)
+        client = self._openai_client(sanitized_key)
+        account = account_fingerprint(sanitized_key, self.get_openai_base_url())
 
-        user_entries: List[Dict[str, Any]] = [
-            {"type": "input_text", "text": prompt},
-            {
-                "type": "input_text",
-                "text": "Parse the attached PDFs and return the multiplier value and CSV rows.",
-            },
-        ]
-        user_entries.extend({"type": "input_file", "file_id": fid} for fid in file_ids)
+        def upload_all() -> List[str]:
+            if uploads is not None:
+                return [uploads.file_id_for(client, account, data, name) for name, data in pdfs]
+            return [upload_pdf_bytes(client, data, name) for name, data in pdfs]
 
-        self.logger.info(
-            "AIScrape submitting request (model=%s, files=%s)",
-            selected_model,
-            file_ids,
-        )
-        response = client.responses.create(
-            model=selected_model,
-            input=
-            [
-                {
-                    "role": "system",
-                    "content": "You are a financial statement parser.",
-                },
-                {"role": "user", "content": user_entries},
-            ],
-        )
+        def submit(file_ids: List[str]) -> Any:
+            self.logger.info(
+                "AIScrape submitting request (model=%s, files=%s)",
+                selected_model,
+                file_ids,
+            )
+            return self._create_openai_response(
+                client,
+                slot,
+                on_delta,
+                model=selected_model,
+                input=self._pdf_request_input(prompt, file_ids),
+            )
+
+        file_ids = upload_all()
+        try:
+            response = submit(file_ids)
+        except Exception as exc:
+            if uploads is None or not is_missing_file_error(exc):
+                raise
+            # A registered file was deleted remotely: upload again once.
+            self.logger.warning("⚠️ AIScrape file ids %s were rejected (%s); re-uploading", file_ids, exc)
+            uploads.forget(file_ids)
+            response = submit(upload_all())
         self.logger.info("AIScrape response received (model=%s)", selected_model)
         return self._extract_openai_response_text(response)
 
     def _call_openai_with_text(
-        self, api_key: str, prompt: str, text_payload: str, model_name: str
+        self,
+        api_key: str,
+        prompt: str,
+        text_payload: str,
+        model_name: str,
+        slot: Optional[RequestSlot] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> str:
         sanitized_key = api_key.strip()
         if not sanitized_key:
@@ -201,36 +343,31 @@ class ScrapeManagerMixin:
         if OpenAI is None:  # pragma: no cover - checked at runtime
             raise ValueError("OpenAI client is not available")
 
-        client = OpenAI(api_key=sanitized_key)
-
-        user_entries: List[Dict[str, Any]] = [
-            {"type": "input_text", "text": prompt},
-            {
-                "type": "input_text",
-                "text": "Parse the provided text excerpt and return the multiplier value and CSV rows.",
-            },
-            {"type": "input_text", "text": cleaned_text},
-        ]
+        client = self._openai_client(sanitized_key)
 
         self.logger.info(
             "AIScrape submitting text request (model=%s, characters=%s)",
             selected_model,
             len(cleaned_text),
         )
-        response = client.responses.create(
+        response = self._create_openai_response(
+            client,
+            slot,
+            on_delta,
             model=selected_model,
-            input=[
-                {
-                    "role": "system",
-                    "content": "You are a financial statement parser.",
-                },
-                {"role": "user", "content": user_entries},
-            ],
+            input=self._text_request_input(prompt, cleaned_text),
         )
         self.logger.info("AIScrape text response received (model=%s)", selected_model)
         return self._extract_openai_response_text(response)
 
-    def _call_openai_for_job(self, job: ScrapeJob, api_key: str) -> str:
+    def _call_openai_for_job(
+        self,
+        job: ScrapeJob,
+        api_key: str,
+        slot: Optional[RequestSlot] = None,
+        uploads: Optional[UploadRegistry] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
+    ) -> str:
         if job.upload_mode == "text":
             if not job.text_payload:
                 raise ValueError("No extracted text available for OpenAI request")
@@ -239,16 +376,56 @@ class ScrapeManagerMixin:
                 job.prompt_text,
                 job.text_payload,
                 job.model_name,
+                slot,
+                on_delta,
             )
-        if job.temp_pdf is None:
+        if job.pdf_bytes is None:
             raise ValueError("No PDF prepared for OpenAI request")
         return self._call_openai_with_pdfs(
             api_key,
             job.prompt_text,
-            [job.temp_pdf],
+            [(self._scrape_job_pdf_name(job), job.pdf_bytes)],
             job.model_name,
+            slot,
+            uploads,
+            on_delta,
         )
 
+    def _call_openai_for_batch(
+        self,
+        group: ScrapeJobGroup,
+        api_key: str,
+        slot: Optional[RequestSlot] = None,
+        uploads: Optional[UploadRegistry] = None,
+    ) -> Dict[str, str]:
+        """One request for several categories of the same PDF; returns text per category.
+
+        Sends the union payload built by :meth:`_prepare_scrape_group`.
+        """
+
+        jobs = group.jobs
+        first = jobs[0]
+        pages = union_pages([job.pages for job in jobs])
+        sections = [(job.category, job.prompt_text, job.pages) for job in jobs]
+        if first.upload_mode == "text":
+            if not group.text_payload:
+                raise ValueError("No extracted text available for OpenAI request")
+            prompt = build_batched_prompt(sections)
+            response_text = self._call_openai_with_text(api_key, prompt, group.text_payload, first.model_name, slot)
+        else:
+            if group.pdf_bytes is None:
+                raise ValueError("No PDF prepared for OpenAI request")
+            prompt = build_batched_prompt(sections, pages)
+            response_text = self._call_openai_with_pdfs(
+                api_key,
+                prompt,
+                [(f"{first.entry.path.stem}_batched.pdf", group.pdf_bytes)],
+                first.model_name,
+                slot,
+                uploads,
+            )
+        return split_batched_response(response_text, [job.category for job in jobs])
+
     def _extract_openai_response_text(self, response: Any) -> str:
         text_output = getattr(response, "output_text", None)
         if text_output:
@@ -278,28 +455,34 @@ class ScrapeManagerMixin:
 
         raise ValueError("OpenAI response did not contain any text output")
 
-    def scrape_selected_pages(self) -> None:
+    def _prepare_scrape_jobs(self) -> Optional[Tuple[str, Path, List[ScrapeJob]]]:
+        """Validate the AIScrape inputs and snapshot one job per selected, unscraped category.
+
+        Returns ``(api_key, scrape_root, jobs)`` or ``None`` after telling the
+        user what is missing.
+        """
+
         if OpenAI is None:
             messagebox.showwarning(
                 "OpenAI Required",
                 "Install the 'openai' package to use AIScrape.",
             )
-            return
+            return None
 
         if not self.pdf_entries:
             messagebox.showinfo("AIScrape", "Load PDFs before running AIScrape.")
-            return
+            return None
 
         company = self.company_var.get().strip()
         if not company:
             messagebox.showinfo("AIScrape", "Select a company before running AIScrape.")
-            return
+            return None
 
         api_key = self.api_key_var.get().strip()
         if not api_key:
             messagebox.showwarning("AIScrape", "Enter an OpenAI API key before running AIScrape.")
             self.api_key_entry.focus_set()
-            return
+            return None
         self._persist_api_key(api_key)
 
         prompts: Dict[str, str] = {}
@@ -315,7 +498,7 @@ class ScrapeManagerMixin:
             messagebox.showerror(
                 "AIScrape", f"Prompt files not found for: {', '.join(missing)}."
             )
-            return
+            return None
 
         self._save_pattern_config()
 
@@ -323,7 +506,6 @@ class ScrapeManagerMixin:
         scrape_root.mkdir(parents=True, exist_ok=True)
 
         jobs: List[ScrapeJob] = []
-        prep_errors: List[str] = []
 
         for entry in self.pdf_entries:
             for category in COLUMNS:
@@ -363,71 +545,327 @@ class ScrapeManagerMixin:
                         category,
                     )
                     continue
-                temp_pdf: Optional[Path] = None
-                text_payload: Optional[str] = None
-                if upload_mode == "text":
-                    text_payload = self.extract_pages_text(entry.doc, pages)
-                    if not text_payload:
-                        prep_errors.append(
-                            f"{entry.path.name} - {category}: Unable to extract text from selected pages"
-                        )
-                        continue
-                else:
-                    temp_pdf = self.export_pages_to_pdf(entry.doc, pages)
-                    if temp_pdf is None:
-                        prep_errors.append(
-                            f"{entry.path.name} - {category}: Unable to prepare selected pages"
-                        )
-                        continue
+                # Only snapshot the selection here; slices are exported and
+                # text extracted by the worker pipeline (_prepare_scrape_job).
                 panel = self.scrape_panels.get((entry.path, category))
                 jobs.append(
                     ScrapeJob(
                         entry=entry,
                         category=category,
-                        pages=pages,
+                        pages=list(pages),
                         prompt_text=prompt_text,
                         model_name=model_name,
                         upload_mode=upload_mode,
                         target_dir=target_dir,
-                        temp_pdf=temp_pdf,
-                        text_payload=text_payload,
                     )
                 )
                 if panel is not None:
                     panel.mark_loading()
 
-        if prep_errors and not jobs:
-            messagebox.showerror("AIScrape", "\n".join(prep_errors))
+        return api_key, scrape_root, jobs
+
+    def scrape_selected_pages(self) -> None:
+        prepared = self._prepare_scrape_jobs()
+        if prepared is None:
             return
+        api_key, _, jobs = prepared
+
         if not jobs:
             messagebox.showinfo("AIScrape", "Select pages before running AIScrape.")
             return
 
-        self.scrape_button.configure(state="disabled")
-        self.scrape_progress.configure(value=0, maximum=len(jobs))
+        self._set_scrape_running(len(jobs))
 
         thread = threading.Thread(
             target=self._run_scrape_jobs,
-            args=(jobs, api_key, prep_errors),
+            args=(
+                jobs,
+                api_key,
+                bool(self.bypass_response_cache_var.get()),
+                bool(self.batch_scrape_categories_var.get()),
+                bool(self.stream_scrape_responses_var.get()),
+            ),
             daemon=True,
         )
         self._scrape_thread = thread
         thread.start()
 
+    def backfill_selected_pages(self) -> None:
+        """Send the selected pages through the OpenAI Batch API instead of interactive calls."""
+
+        prepared = self._prepare_scrape_jobs()
+        if prepared is None:
+            return
+        api_key, scrape_root, jobs = prepared
+        account = account_fingerprint(api_key, self.get_openai_base_url())
+        pending = BatchBackfillState.for_scrape_root(scrape_root).pending(account)
+
+        if not jobs and not pending:
+            messagebox.showinfo("AIScrape", "Select pages before running AIScrape.")
+            return
+
+        self._set_scrape_running(max(1, len(jobs)))
+        thread = threading.Thread(
+            target=self._run_batch_backfill,
+            args=(jobs, api_key, scrape_root, bool(self.bypass_response_cache_var.get())),
+            daemon=True,
+        )
+        self._scrape_thread = thread
+        thread.start()
+
+    def _set_scrape_running(self, total: int) -> None:
+        self.scrape_button.configure(state="disabled")
+        self.backfill_button.configure(state="disabled")
+        self.scrape_progress.configure(value=0, maximum=total)
+
+    def _prepare_scrape_job(self, job: ScrapeJob, doc: Any) -> Optional[str]:
+        """Export the page slice and, in text mode, extract the text for ``job``.
+
+        ``doc`` is a private document opened from ``job.entry.path``; this runs
+        on a worker thread, never on the Tk thread. Returns an error message
+        on failure.
+        """
+
+        if job.pdf_bytes is None:
+            job.pdf_bytes = self.export_pages_to_bytes(doc, job.pages)
+        if job.upload_mode == "text":
+            if job.text_payload is None:
+                job.text_payload = self._scrape_text_payload(
+                    job.entry, doc, job.pages, f"{job.entry.path.name} | {job.category}"
+                )
+            if not job.text_payload:
+                return "Unable to extract text from selected pages"
+        elif job.pdf_bytes is None:
+            return "Unable to prepare selected pages"
+        return None
+
+    def _prepare_scrape_group(self, group: ScrapeJobGroup, doc: Any) -> Optional[str]:
+        """Build the union payload of a batched group once, so retries reuse it."""
+
+        first = group.jobs[0]
+        pages = union_pages([job.pages for job in group.jobs])
+        if first.upload_mode == "text":
+            group.text_payload = self._scrape_text_payload(
+                first.entry, doc, pages, f"{first.entry.path.name} | batched"
+            )
+            if not group.text_payload:
+                return "Unable to extract text from selected pages"
+        else:
+            group.pdf_bytes = self.export_pages_to_bytes(doc, pages)
+            if group.pdf_bytes is None:
+                return "Unable to prepare selected pages"
+        return None
+
+    def _scrape_text_payload(self, entry: PDFEntry, doc: Any, pages: List[int], label: str) -> Optional[str]:
+        """Text sent for ``pages`` in text mode, compacted unless disabled in the configuration."""
+
+        config = getattr(self, "config", None)
+        if not getattr(config, "compact_text_payload", True):
+            return self.extract_pages_text(doc, pages, cache_key=entry.text_key)
+        result = self.extract_pages_text_compacted(
+            doc,
+            pages,
+            cache_key=entry.text_key,
+            tables_only=bool(getattr(config, "text_tables_only", False)),
+        )
+        if result is None:
+            return None
+        self.logger.info(
+            "🗜️ AIScrape text for %s: ~%d → ~%d tokens (-%.0f%%, %d header/footer line(s) removed)",
+            label,
+            result.tokens_before,
+            result.tokens_after,
+            result.saved_fraction * 100,
+            result.removed_lines,
+        )
+        return result.text
+
+    def _try_local_extraction(self, job: ScrapeJob, doc: Any) -> Optional[str]:
+        """Response text for ``job`` read straight from the PDF, or ``None`` when OpenAI is needed.
+
+        ``doc`` is the private document opened from ``job.entry.path``, as
+        for :meth:`_prepare_scrape_job`. Only used when enabled in the
+        configuration. The local extractor follows the stock Financial/Income
+        prompt conventions, not the job's prompt text.
+        """
+
+        if not getattr(getattr(self, "config", None), "local_table_extract", False):
+            return None
+        try:
+            result = extract_statement(doc, job.pages, job.category)
+        except Exception as exc:
+            self.logger.warning("⚠️ Local extraction failed for %s | %s: %s", job.entry.path.name, job.category, exc)
+            return None
+        if not result.accepted:
+            self.logger.info(
+                "↪️ AIScrape local extraction declined for %s | %s (%s, %.1f ms); using OpenAI",
+                job.entry.path.name,
+                job.category,
+                result.reason,
+                result.elapsed * 1000,
+            )
+            return None
+        self.logger.info(
+            "⚡ AIScrape extracted %s | %s locally via %s in %.1f ms (rows=%d, confidence=%.2f, multiplier=%s)",
+            job.entry.path.name,
+            job.category,
+            result.method,
+            result.elapsed * 1000,
+            result.rows,
+            result.confidence,
+            result.multiplier,
+        )
+        return result.text
+
+    def _scrape_job_key(self, job: ScrapeJob) -> str:
+        return f"{job.entry.path.stem}/{job.category}"
+
+    def _scrape_response_cache(self, scrape_root: Path) -> ResponseCache:
+        max_mb = getattr(getattr(self, "config", None), "response_cache_max_mb", 0)
+        return ResponseCache(scrape_root.parent / RESPONSE_CACHE_DIRNAME, int(max_mb) * 1024 * 1024)
+
+    def _scrape_request_key(self, job: ScrapeJob) -> Optional[str]:
+        """Response cache key for ``job``, or ``None`` when its content is unavailable."""
+
+        if job.upload_mode == "text":
+            content: Any = job.text_payload or ""
+        elif job.pdf_bytes is not None:
+            content = job.pdf_bytes
+        else:
+            return None
+        return response_key(job.model_name, job.prompt_text, content)
+
+    def _scrape_job_pdf_name(self, job: ScrapeJob) -> str:
+        return f"{job.entry.path.stem}_{job.category}.pdf"
+
+    def _write_scrape_job_pdf(self, job: ScrapeJob) -> int:
+        """Write the slice prepared for ``job`` to ``PDF_FOLDER/<Category>.pdf``; return the bytes written."""
+
+        if job.pdf_bytes is None:
+            return 0
+        pdf_folder = job.target_dir / "PDF_FOLDER"
+        pdf_folder.mkdir(parents=True, exist_ok=True)
+        (pdf_folder / f"{job.category}.pdf").write_bytes(job.pdf_bytes)
+        return len(job.pdf_bytes)
+
+    def _write_scrape_outputs(
+        self,
+        target_dir: Path,
+        category: str,
+        response_text: str,
+        streamed: Optional[StreamingCSVWriter] = None,
+    ) -> Tuple[Optional[str], int]:
+        """Write ``_raw.txt``, the multiplier and the CSV; return ``(multiplier, row count)``.
+
+        ``streamed`` holds the rows already written while the response streamed in.
+        """
+
+        multiplier, header, rows = self._parse_multiplier_response(response_text)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        raw_path = target_dir / f"{category}_raw.txt"
+        raw_path.write_text(response_text, encoding="utf-8")
+        if multiplier is not None:
+            multiplier_path = target_dir / f"{category}_multiplier.txt"
+            multiplier_path.write_text(str(multiplier).strip(), encoding="utf-8")
+
+        csv_path = target_dir / f"{category}.csv"
+        header_row = header or SCRAPE_EXPECTED_COLUMNS
+        if streamed is not None:
+            streamed.commit([list(header_row), *(rows or [])])
+        else:
+            get_scrape_store().write_rows(csv_path, [header_row, *(rows or [])])
+        return multiplier, len(rows)
+
     def _run_scrape_jobs(
         self,
         jobs: List[ScrapeJob],
         api_key: str,
-        prep_errors: List[str],
+        bypass_cache: bool = False,
+        batched: bool = False,
+        stream: bool = False,
     ) -> None:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        import threading, time
+        import time
 
-        errors: List[str] = list(prep_errors)
+        errors: List[str] = []
         total = len(jobs)
         start_all = time.time()
+        completed = 0
+        progress_lock = threading.Lock()
+
+        scrape_root = jobs[0].target_dir.parent
+        response_cache = self._scrape_response_cache(scrape_root)
+        request_keys: Dict[str, str] = {}
+        uploads = UploadRegistry.for_company(scrape_root.parent)
+        state = ScrapeJobState.for_scrape_root(scrape_root)
+        pdf_bytes_written: Dict[str, int] = {}
+        # Which path produced each job's CSV: "local", "cache" or "openai".
+        job_sources: Dict[str, str] = {}
+
+        def write_job_pdf(job: ScrapeJob) -> None:
+            """Write the job's slice once; scheduler retries reuse the file already on disk."""
+
+            key = self._scrape_job_key(job)
+            with progress_lock:
+                if key in pdf_bytes_written:
+                    return
+            written = self._write_scrape_job_pdf(job)
+            with progress_lock:
+                pdf_bytes_written[key] = written
+
+        def stream_job(job: ScrapeJob, slot: RequestSlot) -> Tuple[str, Optional[str], int]:
+            """Stream one response, appending rows to the CSV and the panel as lines complete."""
+
+            parser = IncrementalScrapeParser()
+            writer = StreamingCSVWriter(job.target_dir / f"{job.category}.csv")
+            started = time.perf_counter()
+            last_push = 0.0
+
+            def push_rows(force: bool = False) -> None:
+                nonlocal last_push
+                now = time.perf_counter()
+                if force or now - last_push >= STREAM_UI_INTERVAL:
+                    last_push = now
+                    self.root.after(0, self._on_scrape_stream_rows, job, parser.header_row, list(parser.rows))
+
+            def on_delta(delta: str) -> None:
+                new_rows = parser.feed(delta)
+                if not new_rows:
+                    return
+                if len(parser.rows) == len(new_rows):
+                    self.logger.info(
+                        "⏱️ AIScrape first row for %s | %s after %.2fs",
+                        job.entry.path.name,
+                        job.category,
+                        time.perf_counter() - started,
+                    )
+                writer.append(parser.header_row, new_rows)
+                push_rows()
+
+            try:
+                response_text = self._call_openai_for_job(job, api_key, slot, uploads, on_delta)
+                tail_rows = parser.finish()
+                if tail_rows:
+                    writer.append(parser.header_row, tail_rows)
+                multiplier, row_count = self._write_scrape_outputs(
+                    job.target_dir, job.category, response_text, writer
+                )
+            except BaseException:
+                writer.abort()
+                raise
+            first_row = parser.first_row_at - started if parser.first_row_at is not None else None
+            self.logger.info(
+                "⏱️ AIScrape streamed %s | %s | rows=%d | first row=%s | total=%.2fs",
+                job.entry.path.name,
+                job.category,
+                row_count,
+                f"{first_row:.2f}s" if first_row is not None else "n/a",
+                time.perf_counter() - started,
+            )
+            return response_text, multiplier, row_count
+
+        def process_job(job: ScrapeJob, slot: RequestSlot) -> Optional[str]:
+            """One attempt at a job; raises so the scheduler can retry."""
 
-        def process_job(index: int, job: ScrapeJob) -> tuple[ScrapeJob, bool, Optional[str]]:
             thread_name = threading.current_thread().name
             start_time = time.time()
             self.logger.info(
@@ -439,107 +877,615 @@ class ScrapeManagerMixin:
                 job.model_name,
                 start_time - start_all,
             )
+            write_job_pdf(job)
+            if stream:
+                response_text, multiplier, row_count = stream_job(job, slot)
+            else:
+                response_text = self._call_openai_for_job(job, api_key, slot, uploads)
+                multiplier, row_count = self._write_scrape_outputs(job.target_dir, job.category, response_text)
+            self.logger.info(
+                "[THREAD] %s finished OpenAI call for %s | %s | rows=%d | elapsed=%.2fs",
+                thread_name,
+                job.entry.path.name,
+                job.category,
+                row_count,
+                time.time() - start_time,
+            )
+            key = request_keys.get(self._scrape_job_key(job))
+            if key:
+                response_cache.put(key, response_text)
+            return multiplier
 
-            multiplier: Optional[str] = None
-            success = False
-            try:
-                job.target_dir.mkdir(parents=True, exist_ok=True)
-                pdf_folder = job.target_dir / "PDF_FOLDER"
-                pdf_folder.mkdir(parents=True, exist_ok=True)
-                out_pdf = pdf_folder / f"{job.category}.pdf"
-                if job.temp_pdf is not None and job.temp_pdf.exists():
-                    shutil.copyfile(job.temp_pdf, out_pdf)
-                else:
-                    tmp_cut = self.export_pages_to_pdf(job.entry.doc, job.pages)
-                    if tmp_cut is not None and tmp_cut.exists():
-                        try:
-                            shutil.copyfile(tmp_cut, out_pdf)
-                        finally:
-                            try:
-                                tmp_cut.unlink()
-                            except Exception:
-                                pass
-
-                response_text = self._call_openai_for_job(job, api_key)
-                multiplier, header, rows = self._parse_multiplier_response(response_text)
-                self.logger.info(
-                    "[THREAD] %s finished OpenAI call for %s | %s | rows=%d",
-                    thread_name,
+        def process_group(group: ScrapeJobGroup, slot: RequestSlot) -> Dict[str, Optional[str]]:
+            """One attempt at a request; returns the multiplier of each category it produced."""
+
+            if len(group.jobs) == 1:
+                return {group.jobs[0].category: process_job(group.jobs[0], slot)}
+            first = group.jobs[0]
+            start_time = time.time()
+            self.logger.info(
+                "[THREAD-START] %s → %s | batched categories=%s | model=%s | start=%.2fs",
+                threading.current_thread().name,
+                first.entry.path.name,
+                [job.category for job in group.jobs],
+                first.model_name,
+                start_time - start_all,
+            )
+            sections = self._call_openai_for_batch(group, api_key, slot, uploads)
+            results: Dict[str, Optional[str]] = {}
+            for job in group.jobs:
+                section = sections.get(job.category)
+                if section is None:
+                    continue
+                write_job_pdf(job)
+                multiplier, _ = self._write_scrape_outputs(job.target_dir, job.category, section)
+                results[job.category] = multiplier
+                key = request_keys.get(self._scrape_job_key(job))
+                if key:
+                    response_cache.put(key, section)
+            self.logger.info(
+                "[THREAD] batched request for %s returned %d/%d categories | elapsed=%.2fs",
+                first.entry.path.name,
+                len(results),
+                len(group.jobs),
+                time.time() - start_time,
+            )
+            return results
+
+        def job_finished(
+            job: ScrapeJob,
+            attempts: int,
+            multiplier: Optional[str],
+            error: Optional[BaseException],
+        ) -> None:
+            nonlocal completed
+            success = error is None
+            if error is not None:
+                self.logger.error(
+                    "[THREAD-ERROR] %s | %s failed after %d attempt(s): %s",
                     job.entry.path.name,
                     job.category,
-                    len(rows),
+                    attempts,
+                    error,
                 )
+                errors.append(f"{job.entry.path.name} - {job.category}: {error}")
+            # Release the slice; it is on disk in PDF_FOLDER by now.
+            job.pdf_bytes = None
+            with progress_lock:
+                completed += 1
+                done = completed
+                written = pdf_bytes_written.get(self._scrape_job_key(job), 0)
+            source = job_sources.get(self._scrape_job_key(job))
+            if source == "openai":
+                state.update_job(self._scrape_job_key(job), source=source)
+            elif source is not None:
+                state.update_job(
+                    self._scrape_job_key(job),
+                    source=source,
+                    status=JOB_DONE if success else JOB_FAILED,
+                    attempts=0,
+                    error="" if success else str(error),
+                )
+            self.logger.info(
+                "[THREAD-END] %s | category=%s | success=%s | attempts=%d | source=%s | pdf_bytes_written=%d",
+                job.entry.path.name,
+                job.category,
+                success,
+                attempts,
+                source or "none",
+                written,
+            )
+            self.root.after(0, self._on_scrape_job_progress, job, done, success, multiplier)
 
-                job.target_dir.mkdir(parents=True, exist_ok=True)
-                raw_path = job.target_dir / f"{job.category}_raw.txt"
-                raw_path.write_text(response_text, encoding="utf-8")
-                if multiplier is not None:
-                    multiplier_path = job.target_dir / f"{job.category}_multiplier.txt"
-                    multiplier_path.write_text(str(multiplier).strip(), encoding="utf-8")
-
-                csv_path = job.target_dir / f"{job.category}.csv"
-                header_row = header or SCRAPE_EXPECTED_COLUMNS
-                with csv_path.open("w", encoding="utf-8", newline="") as fh:
-                    writer = csv.writer(fh, quoting=csv.QUOTE_MINIMAL)
-                    writer.writerow(header_row)
-                    if rows:
-                        writer.writerows(rows)
-                success = True
-            except Exception as exc:
-                self.logger.exception("[THREAD-ERROR] %s failed for %s | %s", thread_name, job.entry.path.name, job.category)
-                errors.append(f"{job.entry.path.name} - {job.category}: {exc}")
-            finally:
-                try:
-                    if job.temp_pdf is not None and job.temp_pdf.exists():
-                        job.temp_pdf.unlink()
-                except Exception:
-                    pass
+        def group_finished(
+            scheduled: ScheduledJob[ScrapeJobGroup],
+            results: Optional[Dict[str, Optional[str]]],
+            error: Optional[BaseException],
+        ) -> None:
+            nonlocal requests_made
+            group = scheduled.payload
+            # Release the union slice; retries of this request are over.
+            group.pdf_bytes = None
+            group.text_payload = None
+            for job in group.jobs:
+                if error is None and job.category not in (results or {}):
+                    # The batched reply skipped this category: ask for it on its own.
+                    self.logger.warning(
+                        "↩️ Batched response for %s had no %s section; re-queuing it as its own request",
+                        job.entry.path.name,
+                        job.category,
+                    )
+                    with progress_lock:
+                        requests_made += 1
+                    scheduler.submit(schedule_group(ScrapeJobGroup([job])))
+                    continue
+                multiplier = (results or {}).get(job.category)
+                job_finished(job, scheduled.attempts, multiplier, error)
+
+        # Use the thread_count from ReportAppV2 as the concurrency ceiling
+        max_workers = getattr(self, "thread_count", None)
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            self.logger.warning("⚠️ Invalid thread_count on self, defaulting to 3")
+            max_workers = 3
+
+        unfinished = set(state.unfinished())
+        cached_jobs = 0
+        local_jobs = 0
+        requests_made = 0
+        resumed = 0
 
-            end_time = time.time()
-            elapsed = end_time - start_time
+        def serve_from_cache(job: ScrapeJob) -> bool:
+            nonlocal cached_jobs
+            key = self._scrape_request_key(job)
+            if key:
+                request_keys[self._scrape_job_key(job)] = key
+            cached_text = response_cache.get(key) if key and not bypass_cache else None
+            if cached_text is None:
+                return False
+            # Identical request answered before: no upload, no API call.
+            try:
+                write_job_pdf(job)
+                multiplier, row_count = self._write_scrape_outputs(job.target_dir, job.category, cached_text)
+            except Exception as exc:
+                job_finished(job, 0, None, exc)
+                return True
+            cached_jobs += 1
+            job_sources[self._scrape_job_key(job)] = "cache"
             self.logger.info(
-                "[THREAD-END] %s completed → %s | category=%s | success=%s | elapsed=%.2fs",
-                thread_name,
+                "♻️ AIScrape served %s | %s from the response cache (rows=%d)",
                 job.entry.path.name,
                 job.category,
-                success,
-                elapsed,
+                row_count,
             )
-            return job, success, multiplier
-        # Use the thread_count from ReportAppV2 if available
-        try:
-            max_workers = getattr(self, "thread_count", None)
-            if not isinstance(max_workers, int) or max_workers <= 0:
-                self.logger.warning("⚠️ Invalid thread_count on self, defaulting to 3")
-                max_workers = 3
+            job_finished(job, 0, multiplier, None)
+            return True
+
+        def serve_locally(job: ScrapeJob, doc: Any) -> bool:
+            nonlocal local_jobs
+            response_text = self._try_local_extraction(job, doc)
+            if response_text is None:
+                return False
+            job_sources[self._scrape_job_key(job)] = "local"
+            try:
+                job.pdf_bytes = self.export_pages_to_bytes(doc, job.pages)
+                write_job_pdf(job)
+                multiplier, _ = self._write_scrape_outputs(job.target_dir, job.category, response_text)
+            except Exception as exc:
+                job_finished(job, 0, None, exc)
+                return True
+            local_jobs += 1
+            job_finished(job, 0, multiplier, None)
+            return True
+
+        groups: List[List[ScrapeJob]]
+        if batched:
+            # One request per PDF for categories sharing a model and upload mode.
+            grouped: Dict[Tuple[Path, str, str], List[ScrapeJob]] = {}
+            for job in jobs:
+                grouped.setdefault((job.entry.path, job.model_name, job.upload_mode), []).append(job)
+            groups = list(grouped.values())
+        else:
+            groups = [[job] for job in jobs]
+
+        def schedule_group(group: ScrapeJobGroup) -> ScheduledJob[ScrapeJobGroup]:
+            ready = group.jobs
+            pages = union_pages([job.pages for job in ready])
+            prompt_text = "\n".join(job.prompt_text for job in ready)
+            if ready[0].upload_mode == "text":
+                text = group.text_payload or "\n".join(job.text_payload or "" for job in ready)
+                tokens = estimate_tokens(prompt_text, text)
             else:
-                self.logger.info(
-                    "Using configured thread_count from ReportAppV2: %d", max_workers
-                )
+                tokens = estimate_tokens(prompt_text, pages=len(pages))
+            key = "+".join(self._scrape_job_key(job) for job in ready)
+            return ScheduledJob(key=key, model=ready[0].model_name, tokens=tokens, payload=group)
 
-            if total < max_workers:
-                max_workers = total
-        except Exception as e:
-            self.logger.warning("⚠️ Could not get thread_count from ReportAppV2: %s", e)
-            max_workers = 3
+        def produce() -> Iterator[ScheduledJob[ScrapeJobGroup]]:
+            """Prepare jobs in order; the scheduler runs each as soon as it is yielded."""
+
+            nonlocal requests_made, resumed
+            source = _SourceDocument()
+            try:
+                for group in groups:
+                    try:
+                        doc = source.get(group[0].entry)
+                    except Exception as exc:
+                        for job in group:
+                            job_finished(job, 0, None, exc)
+                        continue
+                    ready: List[ScrapeJob] = []
+                    for job in group:
+                        if serve_locally(job, doc):
+                            continue
+                        prep_error = self._prepare_scrape_job(job, doc)
+                        if prep_error is not None:
+                            job_finished(job, 0, None, ValueError(prep_error))
+                        elif not serve_from_cache(job):
+                            job_sources[self._scrape_job_key(job)] = "openai"
+                            ready.append(job)
+                    if not ready:
+                        continue
+                    request = ScrapeJobGroup(ready)
+                    if len(ready) > 1:
+                        prep_error = self._prepare_scrape_group(request, doc)
+                        if prep_error is not None:
+                            for job in ready:
+                                job_finished(job, 0, None, ValueError(prep_error))
+                            continue
+                    scheduled = schedule_group(request)
+                    with progress_lock:
+                        requests_made += 1
+                    if scheduled.key in unfinished:
+                        resumed += 1
+                    yield scheduled
+            finally:
+                source.close()
 
         self.logger.info(
-            "Starting parallel AIScrape: %d jobs with %d workers (configured=%d)",
+            "Starting AIScrape scheduler: %d jobs in up to %d request(s), up to %d concurrent requests",
             total,
+            len(groups),
             max_workers,
-            getattr(self, "thread_count", 3),
         )
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_job, idx, jb): jb for idx, jb in enumerate(jobs, start=1)}
-            for future in as_completed(futures):
-                job, success, multiplier = future.result()
-                self.root.after(0, self._on_scrape_job_progress, job, 1, success, multiplier)
+        scheduler: ScrapeScheduler[ScrapeJobGroup, Dict[str, Optional[str]]] = ScrapeScheduler(
+            process_group,
+            group_finished,
+            workers=min(max_workers, max(1, len(groups))),
+            state=state,
+        )
+        stats = scheduler.run(produce())
+        if resumed:
+            self.logger.info("⏯️ Resumed %d AIScrape job(s) left unfinished by a previous batch", resumed)
 
         total_time = time.time() - start_all
-        self.logger.info("✅ All threads finished for %d AIScrape jobs | total elapsed = %.2fs", total, total_time)
+        self.logger.info(
+            "✅ AIScrape finished %d jobs in %.2fs | local=%d cached=%d requests=%d ok=%d failed=%d retries=%d "
+            "throttled=%d concurrency=%s",
+            total,
+            total_time,
+            local_jobs,
+            cached_jobs,
+            requests_made,
+            stats.completed,
+            stats.failed,
+            stats.retries,
+            stats.throttled,
+            stats.concurrency,
+        )
+        self.logger.info("⏱️ OpenAI request latency: %s", get_openai_clients().latency.summary())
+        if uploads.uploaded or uploads.reused:
+            self.logger.info(
+                "📎 AIScrape uploads: new=%d (%d bytes) reused=%d",
+                uploads.uploaded,
+                uploads.uploaded_bytes,
+                uploads.reused,
+            )
+        if pdf_bytes_written:
+            written_total = sum(pdf_bytes_written.values())
+            self.logger.info(
+                "💾 AIScrape wrote %d PDF byte(s) for %d job(s) (%.1f KB per job)",
+                written_total,
+                len(pdf_bytes_written),
+                written_total / len(pdf_bytes_written) / 1024,
+            )
+        if requests_made and OpenAI is not None:
+            try:
+                client = self._openai_client(api_key.strip())
+                removed = uploads.cleanup(client, account_fingerprint(api_key, self.get_openai_base_url()))
+                if removed:
+                    self.logger.info("🧹 Deleted %d expired AIScrape upload(s)", removed)
+            except Exception as exc:
+                self.logger.warning("⚠️ Could not clean up expired AIScrape uploads: %s", exc)
         self.root.after(0, self._on_scrape_jobs_finished, total, errors)
 
+    def _run_batch_backfill(
+        self,
+        jobs: List[ScrapeJob],
+        api_key: str,
+        scrape_root: Path,
+        bypass_cache: bool = False,
+    ) -> None:
+        """Submit ``jobs`` as Batch API requests and collect batches that have already finished.
+
+        Does not wait for the new batches: they are recorded in
+        ``.scrape_batches.json`` and collected by :meth:`_poll_scrape_batches`
+        while the app runs, or by the next backfill. Jobs whose request is
+        still waiting in a recorded batch are not submitted again.
+        """
+
+        import time
+
+        errors: List[str] = []
+        start_all = time.time()
+        completed = 0
+        response_cache = self._scrape_response_cache(scrape_root)
+        uploads = UploadRegistry.for_company(scrape_root.parent)
+        state = BatchBackfillState.for_scrape_root(scrape_root)
+        account = account_fingerprint(api_key, self.get_openai_base_url())
+        jobs_by_id = {self._scrape_job_key(job): job for job in jobs}
+        pdf_bytes_written = 0
+        local_jobs = 0
+        already_pending = 0
+
+        def job_finished(custom_id: str, multiplier: Optional[str], error: Optional[str]) -> None:
+            nonlocal completed
+            job = jobs_by_id.get(custom_id)
+            if error is not None:
+                self.logger.error("[BATCH-ERROR] %s failed: %s", custom_id, error)
+                errors.append(f"{custom_id}: {error}")
+            if job is None:
+                return
+            job.pdf_bytes = None
+            completed += 1
+            self.root.after(0, self._on_scrape_job_progress, job, completed, error is None, multiplier)
+
+        try:
+            client = self._openai_client(api_key.strip())
+        except Exception as exc:
+            for custom_id in jobs_by_id:
+                job_finished(custom_id, None, str(exc))
+            self.root.after(0, self._on_batch_backfill_finished, completed, errors, 0, api_key, scrape_root)
+            return
+
+        pending_ids = state.pending_custom_ids(account)
+        requests: List[BatchRequest] = []
+        source = _SourceDocument()
+        for job in jobs:
+            custom_id = self._scrape_job_key(job)
+            if custom_id in pending_ids:
+                # Already paid for in a batch that has not been collected yet.
+                already_pending += 1
+                continue
+            try:
+                doc = source.get(job.entry)
+                local_text = self._try_local_extraction(job, doc)
+                if local_text is not None:
+                    job.pdf_bytes = self.export_pages_to_bytes(doc, job.pages)
+                    pdf_bytes_written += self._write_scrape_job_pdf(job)
+                    multiplier, _ = self._write_scrape_outputs(job.target_dir, job.category, local_text)
+                    local_jobs += 1
+                    job_finished(custom_id, multiplier, None)
+                    continue
+                prep_error = self._prepare_scrape_job(job, doc)
+                if prep_error is not None:
+                    raise ValueError(prep_error)
+                key = self._scrape_request_key(job)
+                pdf_bytes_written += self._write_scrape_job_pdf(job)
+                cached_text = response_cache.get(key) if key and not bypass_cache else None
+                if cached_text is not None:
+                    multiplier, _ = self._write_scrape_outputs(job.target_dir, job.category, cached_text)
+                    self.logger.info("♻️ AIScrape served %s from the response cache", custom_id)
+                    job_finished(custom_id, multiplier, None)
+                    continue
+                if job.upload_mode == "text":
+                    request_input = self._text_request_input(job.prompt_text, (job.text_payload or "").strip())
+                else:
+                    if job.pdf_bytes is None:
+                        raise ValueError("No PDF prepared for OpenAI request")
+                    file_id = uploads.file_id_for(client, account, job.pdf_bytes, self._scrape_job_pdf_name(job))
+                    request_input = self._pdf_request_input(job.prompt_text, [file_id])
+                # The batch only references the uploaded file id from here on.
+                job.pdf_bytes = None
+            except Exception as exc:
+                job_finished(custom_id, None, str(exc))
+                continue
+            requests.append(
+                BatchRequest(
+                    custom_id=custom_id,
+                    target_dir=job.target_dir,
+                    category=job.category,
+                    body={"model": job.model_name.strip() or DEFAULT_OPENAI_MODEL, "input": request_input},
+                    cache_key=key,
+                )
+            )
+        source.close()
+
+        if already_pending:
+            self.logger.info("⏭️ %d AIScrape job(s) are already waiting in a submitted batch", already_pending)
+        submitted = self._submit_scrape_batches(client, state, account, requests, 1, job_finished)
+        collected, remaining = self._collect_scrape_batches(client, state, account, response_cache, job_finished)
+
+        self.logger.info(
+            "✅ AIScrape backfill submitted %d request(s) in %d batch(es) in %.2fs | local=%d collected=%d "
+            "pending batches=%d errors=%d | pdf_bytes_written=%d uploaded_bytes=%d",
+            len(requests),
+            len(submitted),
+            time.time() - start_all,
+            local_jobs,
+            collected,
+            remaining,
+            len(errors),
+            pdf_bytes_written,
+            uploads.uploaded_bytes,
+        )
+        self.root.after(0, self._on_batch_backfill_finished, completed, errors, remaining, api_key, scrape_root)
+
+    def _submit_scrape_batches(
+        self,
+        client: Any,
+        state: BatchBackfillState,
+        account: str,
+        requests: List[BatchRequest],
+        round_no: int,
+        on_result: Callable[[str, Optional[str], Optional[str]], None],
+    ) -> List[str]:
+        """Submit ``requests`` in batches of at most ``MAX_BATCH_REQUESTS``; return the batch ids."""
+
+        submitted: List[str] = []
+        for offset in range(0, len(requests), MAX_BATCH_REQUESTS):
+            chunk = requests[offset : offset + MAX_BATCH_REQUESTS]
+            try:
+                batch = submit_batch(client, chunk)
+            except Exception as exc:
+                for req in chunk:
+                    on_result(req.custom_id, None, f"Batch submission failed: {exc}")
+                continue
+            state.add(batch.id, account, chunk, round_no)
+            submitted.append(batch.id)
+        return submitted
+
+    def _collect_scrape_batches(
+        self,
+        client: Any,
+        state: BatchBackfillState,
+        account: str,
+        response_cache: ResponseCache,
+        on_result: Callable[[str, Optional[str], Optional[str]], None],
+        cancel: Optional[threading.Event] = None,
+    ) -> Tuple[int, int]:
+        """Write the results of every finished batch of ``account`` without waiting for the rest.
+
+        Retryable failed lines are resubmitted from their recorded request
+        body. Returns ``(results written, batches still pending)``.
+        """
+
+        written = 0
+        with self._batch_collect_lock:
+            for batch_id in state.pending(account):
+                if cancel is not None and cancel.is_set():
+                    break
+                record = state.record(batch_id)
+                try:
+                    batch = wait_for_batch(client, batch_id, timeout=0, cancel=cancel)
+                    if batch is None:
+                        continue
+                    results = fetch_batch_results(client, batch)
+                except Exception as exc:
+                    retryable, _, _ = classify_error(exc)
+                    if retryable:
+                        # Keep the record so a later poll can collect it.
+                        self.logger.warning("⚠️ Could not collect AIScrape batch %s yet: %s", batch_id, exc)
+                        continue
+                    # Gone or rejected for good (e.g. cancelled or deleted elsewhere): stop polling it.
+                    self.logger.error("❌ Dropping AIScrape batch %s: %s", batch_id, exc)
+                    for custom_id in record.get("requests", {}):
+                        on_result(custom_id, None, f"Batch {batch_id} could not be collected: {exc}")
+                    state.remove(batch_id)
+                    continue
+                round_no = int(record.get("round", 1))
+                bodies = state.requests(batch_id)
+                retry: List[BatchRequest] = []
+                for custom_id, meta in record.get("requests", {}).items():
+                    result = results.get(custom_id)
+                    if result is not None and result.text is not None:
+                        try:
+                            multiplier, _ = self._write_scrape_outputs(
+                                Path(meta["target_dir"]), str(meta["category"]), result.text
+                            )
+                        except Exception as exc:
+                            on_result(custom_id, None, str(exc))
+                            continue
+                        if meta.get("cache_key"):
+                            response_cache.put(meta["cache_key"], result.text)
+                        written += 1
+                        on_result(custom_id, multiplier, None)
+                        continue
+                    error = result.error if result is not None else f"no result (batch {batch.status})"
+                    retryable = result is None or result.retryable
+                    if retryable and custom_id in bodies and round_no < BATCH_MAX_ROUNDS:
+                        retry.append(bodies[custom_id])
+                    else:
+                        on_result(custom_id, None, error)
+                delete_batch_files(client, batch)
+                if retry:
+                    self.logger.warning("🔁 Resubmitting %d failed AIScrape batch request(s)", len(retry))
+                    self._submit_scrape_batches(client, state, account, retry, round_no + 1, on_result)
+                state.remove(batch_id)
+            return written, len(state.pending(account))
+
+    def _poll_scrape_batches(self, api_key: str, scrape_root: Path) -> None:
+        """Collect finished backfill batches on a worker thread; reschedules itself while any are pending."""
+
+        self._batch_poll_after = None
+        cancel = self._batch_poll_cancel
+
+        def run() -> None:
+            errors: List[str] = []
+
+            def on_result(custom_id: str, _multiplier: Optional[str], error: Optional[str]) -> None:
+                if error is not None:
+                    self.logger.error("[BATCH-ERROR] %s failed: %s", custom_id, error)
+                    errors.append(f"{custom_id}: {error}")
+
+            collected, remaining = 0, 1
+            try:
+                client = self._openai_client(api_key.strip())
+                account = account_fingerprint(api_key, self.get_openai_base_url())
+                collected, remaining = self._collect_scrape_batches(
+                    client,
+                    BatchBackfillState.for_scrape_root(scrape_root),
+                    account,
+                    self._scrape_response_cache(scrape_root),
+                    on_result,
+                    cancel,
+                )
+            except Exception as exc:
+                self.logger.warning("⚠️ Could not poll AIScrape batches: %s", exc)
+            if collected or errors:
+                self.logger.info(
+                    "📦 AIScrape batch poll wrote %d result(s), %d error(s), %d batch(es) pending",
+                    collected,
+                    len(errors),
+                    remaining,
+                )
+            if not cancel.is_set():
+                self.root.after(0, self._on_scrape_batches_polled, api_key, scrape_root, collected, remaining)
+
+        threading.Thread(target=run, name="AIScrape-batch-poll", daemon=True).start()
+
+    def _schedule_batch_poll(self, api_key: str, scrape_root: Path) -> None:
+        if self._batch_poll_after is not None:
+            self.root.after_cancel(self._batch_poll_after)
+        self._batch_poll_cancel.clear()
+        self._batch_poll_after = self.root.after(
+            int(BATCH_POLL_SECONDS * 1000), self._poll_scrape_batches, api_key, scrape_root
+        )
+
+    def stop_batch_polling(self) -> None:
+        """Cancel the background batch poll; the batches stay recorded for the next run."""
+
+        if self._batch_poll_after is not None:
+            self.root.after_cancel(self._batch_poll_after)
+            self._batch_poll_after = None
+        self._batch_poll_cancel.set()
+
+    def _on_scrape_batches_polled(self, api_key: str, scrape_root: Path, collected: int, remaining: int) -> None:
+        if collected:
+            self._reload_scrape_panels()
+        if remaining:
+            self._schedule_batch_poll(api_key, scrape_root)
+
+    def _reload_scrape_panels(self) -> None:
+        # Results of batches from earlier sessions have no job to report progress.
+        for panel in self.scrape_panels.values():
+            try:
+                panel.load_from_files()
+            except Exception:
+                pass
+        self.refresh_combined_tab()
+
+    def _on_batch_backfill_finished(
+        self,
+        total: int,
+        errors: List[str],
+        pending: int,
+        api_key: str,
+        scrape_root: Path,
+    ) -> None:
+        self._reload_scrape_panels()
+        summary = None
+        if pending:
+            self._schedule_batch_poll(api_key, scrape_root)
+            summary = (
+                f"Saved {total} response(s) to 'openapiscrape'. {pending} batch(es) are still running; "
+                "their results are saved as they complete."
+            )
+        self._on_scrape_jobs_finished(total, errors, summary)
+
+    def _on_scrape_stream_rows(self, job: ScrapeJob, header: List[str], rows: List[List[str]]) -> None:
+        panel = self.scrape_panels.get((job.entry.path, job.category))
+        if panel is not None:
+            panel.show_streaming_rows(header, rows)
+
     def _on_scrape_job_progress(
         self,
         job: ScrapeJob,
@@ -559,8 +1505,9 @@ class ScrapeManagerMixin:
                 self._show_scrape_preview(job.entry, job.category)
         self.refresh_combined_tab()
 
-    def _on_scrape_jobs_finished(self, total: int, errors: List[str]) -> None:
+    def _on_scrape_jobs_finished(self, total: int, errors: List[str], summary: Optional[str] = None) -> None:
         self.scrape_button.configure(state="normal")
+        self.backfill_button.configure(state="normal")
         self.scrape_progress.configure(value=0)
         self._scrape_thread = None
         if errors:
@@ -568,5 +1515,5 @@ class ScrapeManagerMixin:
         else:
             messagebox.showinfo(
                 "AIScrape",
-                f"Saved {total} OpenAI response(s) to 'openapiscrape'.",
+                summary or f"Saved {total} OpenAI response(s) to 'openapiscrape'.",
             )
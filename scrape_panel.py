@@ -11,6 +11,7 @@ from tkinter import messagebox, simpledialog, ttk
 
 from pdf_utils import PDFEntry
 from scrape_context_menu import ScrapeContextMenu
+from scrape_store import get_scrape_store
 from scrape_table_model import ScrapeTableModel
 from scrape_table_view import ScrapeTableView
 
@@ -272,6 +273,12 @@ class ScrapeResultPanel:
         self.view.mark_loading()
         self._update_action_states()
 
+    def show_streaming_rows(self, header: List[str], rows: List[List[str]]) -> None:
+        """Show the rows of a response that is still streaming in."""
+
+        if rows:
+            self.view.populate(rows, register=False, header=header)
+
     def load_from_files(self) -> None:
         header, data_rows = self.model.load_csv_rows()
         if data_rows or header is not None:
@@ -418,6 +425,7 @@ class ScrapeResultPanel:
                 if file_path.exists():
                     try:
                         file_path.unlink()
+                        get_scrape_store().invalidate(file_path)
                         deleted.append(file_path.name)
                     except Exception as exc:
                         messagebox.showwarning(
@@ -0,0 +1,514 @@
+"""Rate-limit aware scheduling of AIScrape requests.
+
+:class:`ScrapeScheduler` runs jobs on a small pool of worker threads and
+keeps each OpenAI model inside its requests-per-minute and tokens-per-minute
+budget. Concurrency per model grows additively while requests succeed and is
+halved when the API answers 429 (AIMD). Retryable failures (429, 408/409,
+5xx, connection errors, timeouts) are retried with jittered exponential
+backoff, honouring ``Retry-After`` when the server sends it.
+
+Job progress and the limits learned per model are persisted in
+``openapiscrape/.scrape_jobs.json`` so an interrupted batch picks up its
+attempt counters, pending back-off and concurrency where it stopped.
+
+The scheduler knows nothing about OpenAI itself: jobs are executed by a
+callable, and errors are classified from their ``status_code`` and
+``response.headers`` attributes, which the ``openai`` SDK exceptions carry.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from app_logging import get_logger
+
+
+logger = get_logger()
+
+SCRAPE_JOB_STATE_FILENAME = ".scrape_jobs.json"
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+# Minimum spacing between two multiplicative decreases of one model's limit,
+# so a burst of 429s from requests already in flight halves it only once.
+THROTTLE_COOLDOWN = 2.0
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+
+def estimate_tokens(prompt: str, text: Optional[str] = None, pages: int = 0) -> int:
+    """Rough token cost of one request, used to reserve TPM budget up front."""
+
+    # ~4 characters per token; an attached PDF page costs roughly 1.5k
+    # tokens; the CSV answer is budgeted at 2k.
+    chars = len(prompt) + len(text or "")
+    return chars // 4 + pages * 1500 + 2000
+
+
+def parse_reset_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse ``x-ratelimit-reset-*`` values such as ``"1s"``, ``"6m0s"`` or ``"250ms"``."""
+
+    if not value:
+        return None
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    total = 0.0
+    matched = False
+    for amount, unit in re.findall(r"([\d.]+)(ms|h|m|s)", text):
+        matched = True
+        number = float(amount)
+        total += {"ms": number / 1000.0, "s": number, "m": number * 60.0, "h": number * 3600.0}[unit]
+    return total if matched else None
+
+
+def _header(headers: Optional[Mapping[str, str]], name: str) -> Optional[str]:
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.title())
+    return value
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    millis = _header(headers, "retry-after-ms")
+    if millis:
+        try:
+            return float(millis) / 1000.0
+        except ValueError:
+            pass
+    return parse_reset_seconds(_header(headers, "retry-after"))
+
+
+def classify_error(exc: BaseException) -> Tuple[bool, Optional[int], Optional[Mapping[str, str]]]:
+    """Return ``(retryable, status_code, headers)`` for a failed request."""
+
+    status = getattr(exc, "status_code", None)
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS or status >= 500, status, headers
+    name = type(exc).__name__
+    if isinstance(exc, (ConnectionError, TimeoutError)) or name in {"APIConnectionError", "APITimeoutError"}:
+        return True, None, headers
+    return False, None, headers
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: random.Random) -> float:
+    """Full-jitter exponential backoff for retry ``attempt`` (1-based)."""
+
+    return rng.uniform(0.0, min(cap, base * (2 ** max(0, attempt - 1))))
+
+
+class ModelBudget:
+    """Sliding one-minute request/token window and AIMD concurrency for one model."""
+
+    def __init__(self, concurrency: float, max_concurrency: int, rpm: Optional[int] = None, tpm: Optional[int] = None) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.limit = float(min(max(1.0, concurrency), self.max_concurrency))
+        self.rpm = rpm
+        self.tpm = tpm
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._window: Deque[List[float]] = deque()
+        self._last_throttle = float("-inf")
+
+    def _trim(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= 60.0:
+            self._window.popleft()
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a request costing ``tokens`` fits; 0 when it fits now."""
+
+        if self.in_flight >= int(self.limit):
+            return -1.0  # wait for a running request to finish
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._trim(now)
+        waits = [0.0]
+        if self.rpm and len(self._window) >= self.rpm:
+            waits.append(self._window[len(self._window) - self.rpm][0] + 60.0 - now)
+        if self.tpm and self._window:
+            used = sum(entry[1] for entry in self._window)
+            if used + tokens > self.tpm:
+                # Wait until enough of the window has expired.
+                excess = used + tokens - self.tpm
+                for stamp, cost in self._window:
+                    excess -= cost
+                    if excess <= 0:
+                        waits.append(stamp + 60.0 - now)
+                        break
+        return max(waits)
+
+    def reserve(self, tokens: int, now: float) -> List[float]:
+        self.in_flight += 1
+        entry = [now, float(tokens)]
+        self._window.append(entry)
+        return entry
+
+    def release(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def on_success(self) -> None:
+        self.limit = min(float(self.max_concurrency), self.limit + 1.0 / max(1.0, self.limit))
+
+    def on_throttle(self, now: float, pause: Optional[float]) -> None:
+        if now - self._last_throttle >= THROTTLE_COOLDOWN:
+            self.limit = max(1.0, self.limit / 2.0)
+            self._last_throttle = now
+        if pause:
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+    def observe_headers(self, headers: Optional[Mapping[str, str]], now: float) -> None:
+        for name, attr in (("x-ratelimit-limit-requests", "rpm"), ("x-ratelimit-limit-tokens", "tpm")):
+            value = _header(headers, name)
+            if value:
+                try:
+                    setattr(self, attr, max(1, int(float(value))))
+                except ValueError:
+                    pass
+        for remaining_name, reset_name in (
+            ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+            ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+        ):
+            remaining = _header(headers, remaining_name)
+            if remaining is not None and remaining.strip() in {"0", "0.0"}:
+                reset = parse_reset_seconds(_header(headers, reset_name))
+                if reset:
+                    self.blocked_until = max(self.blocked_until, now + reset)
+
+
+class ScrapeJobState:
+    """JSON record of job outcomes and learned model limits for one company."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.models: Dict[str, Dict[str, Any]] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if isinstance(data, dict):
+            if isinstance(data.get("jobs"), dict):
+                self.jobs = {str(k): v for k, v in data["jobs"].items() if isinstance(v, dict)}
+            if isinstance(data.get("models"), dict):
+                self.models = {str(k): v for k, v in data["models"].items() if isinstance(v, dict)}
+
+    @classmethod
+    def for_scrape_root(cls, scrape_root: Path) -> "ScrapeJobState":
+        return cls(scrape_root / SCRAPE_JOB_STATE_FILENAME)
+
+    def unfinished(self) -> List[str]:
+        with self._lock:
+            return [key for key, rec in self.jobs.items() if rec.get("status") in {JOB_PENDING, JOB_RUNNING}]
+
+    def job(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.jobs.get(key, {}))
+
+    def update_job(self, key: str, **values: Any) -> None:
+        with self._lock:
+            record = self.jobs.setdefault(key, {})
+            record.update(values)
+            record["updated"] = time.time()
+            self._save_locked()
+
+    def update_model(self, model: str, budget: ModelBudget) -> None:
+        with self._lock:
+            self.models[model] = {"concurrency": round(budget.limit, 2), "rpm": budget.rpm, "tpm": budget.tpm}
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        payload = json.dumps({"version": 1, "jobs": self.jobs, "models": self.models}, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".scrape_jobs.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp_name, self.path)
+        except OSError as exc:
+            logger.warning("⚠️ Could not save AIScrape job state %s: %s", self.path, exc)
+
+
+@dataclass
+class ScheduledJob(Generic[P]):
+    key: str
+    model: str
+    tokens: int
+    payload: P
+    attempts: int = 0
+    not_before: float = 0.0
+
+
+@dataclass
+class RequestSlot:
+    """Handed to the job callable so it can report what the API told it."""
+
+    headers: Optional[Mapping[str, str]] = None
+    tokens_used: Optional[int] = None
+
+    def observe(self, headers: Optional[Mapping[str, str]], tokens_used: Optional[int] = None) -> None:
+        self.headers = headers
+        if tokens_used is not None:
+            self.tokens_used = int(tokens_used)
+
+
+@dataclass
+class SchedulerStats:
+    completed: int = 0
+    failed: int = 0
+    retries: int = 0
+    throttled: int = 0
+    elapsed: float = 0.0
+    concurrency: Dict[str, float] = field(default_factory=dict)
+
+
+class ScrapeScheduler(Generic[P, R]):
+    """Run jobs within per-model rate limits, retrying transient failures.
+
+    ``run_job(payload, slot)`` performs one request and returns its result;
+    ``on_done(job, result, error)`` is called from a worker thread once a job
+    has succeeded or given up.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[P, RequestSlot], R],
+        on_done: Callable[[ScheduledJob[P], Optional[R], Optional[BaseException]], None],
+        *,
+        workers: int,
+        state: Optional[ScrapeJobState] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.run_job = run_job
+        self.on_done = on_done
+        self.workers = max(1, int(workers))
+        self.state = state
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+        self.stats = SchedulerStats()
+        self._budgets: Dict[str, ModelBudget] = {}
+        self._queue: List[Tuple[float, int, ScheduledJob[P]]] = []
+        self._order = itertools.count()
+        self._remaining = 0
+        self._feeding = False
+        self._cond = threading.Condition()
+
+    def budget(self, model: str) -> ModelBudget:
+        budget = self._budgets.get(model)
+        if budget is None:
+            learned = self.state.models.get(model, {}) if self.state is not None else {}
+            budget = ModelBudget(
+                concurrency=float(learned.get("concurrency") or self.workers),
+                max_concurrency=self.workers,
+                rpm=learned.get("rpm"),
+                tpm=learned.get("tpm"),
+            )
+            self._budgets[model] = budget
+        return budget
+
+    def run(self, jobs: Iterable[ScheduledJob[P]]) -> SchedulerStats:
+        """Process ``jobs`` and block until every one has finished or failed.
+
+        ``jobs`` may be lazy (e.g. a generator that prepares each job): it is
+        consumed on its own thread, so workers start on the first job while
+        later ones are still being produced.
+        """
+
+        start = time.monotonic()
+        self._feeding = True
+        feeder = threading.Thread(target=self._feed, args=(iter(jobs), start), name="AIScrape-feed", daemon=True)
+        threads = [
+            threading.Thread(target=self._worker, name=f"AIScrape-{idx + 1}", daemon=True)
+            for idx in range(self.workers)
+        ]
+        feeder.start()
+        for thread in threads:
+            thread.start()
+        feeder.join()
+        for thread in threads:
+            thread.join()
+
+        self.stats.elapsed = time.monotonic() - start
+        self.stats.concurrency = {model: round(b.limit, 2) for model, b in self._budgets.items()}
+        return self.stats
+
+    def _feed(self, jobs: Iterator[ScheduledJob[P]], start: float) -> None:
+        wall_offset = time.time() - start
+        try:
+            for job in jobs:
+                if self.state is not None:
+                    previous = self.state.job(job.key)
+                    if previous.get("status") in {JOB_PENDING, JOB_RUNNING}:
+                        job.attempts = int(previous.get("attempts", 0) or 0)
+                        # Persisted as wall-clock time; convert to this clock.
+                        job.not_before = max(0.0, float(previous.get("not_before", 0) or 0) - wall_offset)
+                self.submit(job)
+        except Exception:
+            logger.exception("❌ AIScrape job preparation stopped unexpectedly")
+        finally:
+            with self._cond:
+                self._feeding = False
+                self._cond.notify_all()
+
+    def submit(self, job: ScheduledJob[P]) -> None:
+        """Queue a job; also usable while :meth:`run` is in progress, e.g. from ``on_done``."""
+
+        if self.state is not None:
+            self.state.update_job(job.key, status=JOB_PENDING, attempts=job.attempts, error="")
+        with self._cond:
+            heapq.heappush(self._queue, (job.not_before, next(self._order), job))
+            self._remaining += 1
+            self._cond.notify()
+
+    def _next_job(self) -> Optional[Tuple[ScheduledJob[P], ModelBudget, List[float]]]:
+        with self._cond:
+            while True:
+                if self._remaining <= 0 and not self._feeding:
+                    self._cond.notify_all()
+                    return None
+                now = time.monotonic()
+                wait: Optional[float] = None
+                deferred: List[Tuple[float, int, ScheduledJob[P]]] = []
+                chosen: Optional[Tuple[ScheduledJob[P], ModelBudget, List[float]]] = None
+                while self._queue:
+                    item = heapq.heappop(self._queue)
+                    job = item[2]
+                    if job.not_before > now:
+                        deferred.append(item)
+                        delay = job.not_before - now
+                        wait = delay if wait is None else min(wait, delay)
+                        break
+                    budget = self.budget(job.model)
+                    delay = budget.wait_time(job.tokens, now)
+                    if delay == 0.0:
+                        chosen = (job, budget, budget.reserve(job.tokens, now))
+                        break
+                    deferred.append(item)
+                    if delay > 0:
+                        wait = delay if wait is None else min(wait, delay)
+                for item in deferred:
+                    heapq.heappush(self._queue, item)
+                if chosen is not None:
+                    return chosen
+                # Nothing runnable: sleep until a back-off expires, a window
+                # frees up, or a running request finishes.
+                self._cond.wait(timeout=wait if wait is not None else 1.0)
+
+    def _worker(self) -> None:
+        while True:
+            picked = self._next_job()
+            if picked is None:
+                return
+            job, budget, reservation = picked
+            job.attempts += 1
+            if self.state is not None:
+                self.state.update_job(job.key, status=JOB_RUNNING, attempts=job.attempts)
+            slot = RequestSlot()
+            result: Optional[R] = None
+            error: Optional[BaseException] = None
+            try:
+                result = self.run_job(job.payload, slot)
+            except Exception as exc:  # noqa: BLE001 - classified below
+                error = exc
+            self._finish(job, budget, reservation, slot, result, error)
+
+    def _finish(
+        self,
+        job: ScheduledJob[P],
+        budget: ModelBudget,
+        reservation: List[float],
+        slot: RequestSlot,
+        result: Optional[R],
+        error: Optional[BaseException],
+    ) -> None:
+        now = time.monotonic()
+        retry = False
+        with self._cond:
+            budget.release()
+            headers = slot.headers
+            if error is None:
+                if slot.tokens_used is not None:
+                    reservation[1] = float(slot.tokens_used)
+                budget.observe_headers(headers, now)
+                budget.on_success()
+                self.stats.completed += 1
+            else:
+                retryable, status, headers = classify_error(error)
+                budget.observe_headers(headers, now)
+                retry_after = retry_after_seconds(headers)
+                if status == 429:
+                    self.stats.throttled += 1
+                    budget.on_throttle(now, retry_after)
+                if retryable and job.attempts < self.max_attempts:
+                    retry = True
+                    delay = max(retry_after or 0.0, backoff_delay(job.attempts, self.base_delay, self.max_delay, self.rng))
+                    job.not_before = now + delay
+                    self.stats.retries += 1
+                    heapq.heappush(self._queue, (job.not_before, next(self._order), job))
+                    logger.warning(
+                        "🔁 AIScrape retry %d/%d for %s in %.1fs (%s)",
+                        job.attempts,
+                        self.max_attempts,
+                        job.key,
+                        delay,
+                        status or type(error).__name__,
+                    )
+                else:
+                    self.stats.failed += 1
+            self._cond.notify_all()
+
+        if self.state is not None:
+            if error is None:
+                self.state.update_job(job.key, status=JOB_DONE, attempts=job.attempts, error="", not_before=0)
+            elif retry:
+                self.state.update_job(
+                    job.key,
+                    status=JOB_PENDING,
+                    attempts=job.attempts,
+                    error=str(error),
+                    not_before=time.time() + (job.not_before - now),
+                )
+            else:
+                self.state.update_job(job.key, status=JOB_FAILED, attempts=job.attempts, error=str(error), not_before=0)
+            self.state.update_model(job.model, budget)
+        if not retry:
+            try:
+                self.on_done(job, result, error)
+            except Exception:  # noqa: BLE001 - keep the worker alive
+                logger.exception("❌ AIScrape completion handler failed for %s", job.key)
+            finally:
+                # Counted down only now, so idle workers stay up for jobs on_done submits.
+                with self._cond:
+                    self._remaining -= 1
+                    self._cond.notify_all()
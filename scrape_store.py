@@ -0,0 +1,203 @@
+"""Process-wide cache of parsed scrape CSV tables.
+
+``openapiscrape/<pdf>/<Category>.csv`` files are read by the scrape panels,
+the Combined builder, AIScrape's skip check and the NOTE-conflict viewer.
+:class:`ScrapeTableStore` parses each file once and keeps the result keyed by
+path, validated against the file's mtime and size, so an edit made outside
+the app is still picked up. Writes go through the store so the cached copy
+never lags behind the file.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app_logging import get_logger
+from pdf_utils import normalize_header_row
+
+
+logger = get_logger()
+
+FileStamp = Tuple[int, int]
+
+
+def _file_stamp(path: Path) -> Optional[FileStamp]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class ScrapeTable:
+    """Rows of one scrape CSV as ``csv.reader`` yields them (empty lines dropped).
+
+    The views below reproduce the exact semantics of the readers they
+    replaced, so callers see the same data as before.
+    """
+
+    raw_rows: List[List[str]]
+    _stripped: Optional[List[List[str]]] = field(default=None, repr=False)
+
+    @property
+    def stripped_rows(self) -> List[List[str]]:
+        if self._stripped is None:
+            self._stripped = [[cell.strip() for cell in row] for row in self.raw_rows]
+        return self._stripped
+
+    def model_view(self) -> Tuple[Optional[List[str]], List[List[str]]]:
+        """``(header, data_rows)`` skipping blank rows; header only if recognised."""
+
+        rows = [row for row in self.stripped_rows if any(row)]
+        if rows:
+            candidate = normalize_header_row(rows[0])
+            if candidate is not None:
+                return candidate, [list(row) for row in rows[1:]]
+        return None, [list(row) for row in rows]
+
+    def combined_view(self) -> Tuple[List[str], List[List[str]]]:
+        """``(header, rows)`` where the first row is always taken as the header."""
+
+        rows = self.stripped_rows
+        if not rows:
+            return [], []
+        first = rows[0]
+        header = normalize_header_row(list(first)) or list(first)
+        return header, [list(row) for row in rows[1:]]
+
+    def has_data(self) -> bool:
+        """True when the file has a data row (or a first row that is not a header)."""
+
+        rows = [row for row in self.stripped_rows if any(row)]
+        if not rows:
+            return False
+        return normalize_header_row(rows[0]) is None or len(rows) > 1
+
+    def dict_rows(self) -> List[Dict[Any, Any]]:
+        """Rows keyed by the first line, as ``csv.DictReader`` would produce them."""
+
+        if not self.raw_rows:
+            return []
+        fieldnames = self.raw_rows[0]
+        out: List[Dict[Any, Any]] = []
+        for row in self.raw_rows[1:]:
+            mapping: Dict[Any, Any] = dict(zip(fieldnames, row))
+            if len(row) > len(fieldnames):
+                mapping[None] = row[len(fieldnames):]
+            elif len(row) < len(fieldnames):
+                for key in fieldnames[len(row):]:
+                    mapping[key] = None
+            out.append(mapping)
+        return out
+
+
+class ScrapeTableStore:
+    """Thread-safe path → :class:`ScrapeTable` cache with write-through."""
+
+    def __init__(self) -> None:
+        self._tables: Dict[Path, Tuple[FileStamp, ScrapeTable]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    @staticmethod
+    def _key(path: Path) -> Path:
+        return Path(os.path.abspath(path))
+
+    def get(self, path: Path) -> Optional[ScrapeTable]:
+        """Return the parsed table for ``path``; ``None`` if missing or unreadable."""
+
+        key = self._key(path)
+        stamp = _file_stamp(key)
+        if stamp is None:
+            with self._lock:
+                self._tables.pop(key, None)
+            return None
+        with self._lock:
+            cached = self._tables.get(key)
+            if cached is not None and cached[0] == stamp:
+                self.hits += 1
+                return cached[1]
+        try:
+            with key.open("r", encoding="utf-8", newline="") as fh:
+                raw_rows = [row for row in csv.reader(fh) if row]
+        except (OSError, UnicodeDecodeError, csv.Error):
+            return None
+        table = ScrapeTable(raw_rows)
+        with self._lock:
+            self._tables[key] = (stamp, table)
+            self.loads += 1
+        return table
+
+    def write_rows(self, path: Path, rows: Iterable[Sequence[Any]]) -> None:
+        """Atomically write ``rows`` (header first) to ``path`` and cache them.
+
+        Raises :class:`OSError` like a direct write would.
+        """
+
+        key = self._key(path)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+        cached_rows: List[List[str]] = []
+        for row in rows:
+            cells = ["" if cell is None else str(cell) for cell in row]
+            writer.writerow(cells)
+            if cells:
+                cached_rows.append(cells)
+
+        key.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=key.parent, prefix=f".{key.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+                fh.write(buffer.getvalue())
+            with self._lock:
+                os.replace(tmp_name, key)
+                stamp = _file_stamp(key)
+                if stamp is None:
+                    self._tables.pop(key, None)
+                else:
+                    self._tables[key] = (stamp, ScrapeTable(cached_rows))
+        except Exception:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def adopt(self, path: Path, written_path: Path, rows: Sequence[Sequence[str]]) -> None:
+        """Move the finished file ``written_path`` over ``path``; ``rows`` are its contents."""
+
+        key = self._key(path)
+        cached_rows = [[str(cell) for cell in row] for row in rows if row]
+        with self._lock:
+            os.replace(written_path, key)
+            stamp = _file_stamp(key)
+            if stamp is None:
+                self._tables.pop(key, None)
+            else:
+                self._tables[key] = (stamp, ScrapeTable(cached_rows))
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._tables.pop(self._key(path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+
+_store = ScrapeTableStore()
+
+
+def get_scrape_store() -> ScrapeTableStore:
+    """Return the process-wide scrape table store."""
+
+    return _store
@@ -0,0 +1,143 @@
+"""Incremental parsing of streamed AIScrape responses.
+
+With streaming enabled, the response arrives as text deltas.
+:class:`IncrementalScrapeParser` turns every completed line into a CSV row
+following the same rules as ``_parse_multiplier_response`` (multiplier line,
+optional header, rows padded or cut to the header width). Rows are appended
+by :class:`StreamingCSVWriter` to ``.<Category>.csv.part`` beside the final
+file, which is renamed over ``<Category>.csv`` once the response completes.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+import time
+from pathlib import Path
+from typing import IO, List, Optional
+
+from constants import SCRAPE_EXPECTED_COLUMNS
+from pdf_utils import normalize_header_row
+from scrape_store import get_scrape_store
+
+
+# Minimum seconds between live panel updates while a response streams in.
+STREAM_UI_INTERVAL = 0.25
+
+_NUMBER_RE = re.compile(r"([-+]?\d[\d,]*\.?\d*)")
+
+
+def _split_csv_line(line: str) -> List[str]:
+    try:
+        cells = next(csv.reader([line]), [])
+    except csv.Error:
+        cells = line.split(",")
+    return [cell.strip() for cell in cells]
+
+
+class IncrementalScrapeParser:
+    """Feed response text deltas; get back the CSV rows completed so far."""
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._seen_data = False
+        self.multiplier: Optional[str] = None
+        self.header: Optional[List[str]] = None
+        self.rows: List[List[str]] = []
+        self.first_row_at: Optional[float] = None
+
+    @property
+    def header_row(self) -> List[str]:
+        return self.header or list(SCRAPE_EXPECTED_COLUMNS)
+
+    def feed(self, delta: str) -> List[List[str]]:
+        self._pending += delta
+        *lines, self._pending = self._pending.split("\n")
+        return self._consume(lines)
+
+    def finish(self) -> List[List[str]]:
+        """Parse the trailing line that had no newline."""
+
+        lines, self._pending = [self._pending], ""
+        return self._consume(lines)
+
+    def _consume(self, lines: List[str]) -> List[List[str]]:
+        new_rows: List[List[str]] = []
+        for line in lines:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("```"):
+                continue
+            if self.multiplier is None and stripped.lower().startswith("multiplier"):
+                match = _NUMBER_RE.search(stripped)
+                if match:
+                    self.multiplier = match.group(1)
+                continue
+            cells = _split_csv_line(stripped)
+            if not self._seen_data:
+                self._seen_data = True
+                candidate = normalize_header_row(cells)
+                if candidate is not None:
+                    self.header = candidate
+                    continue
+            width = len(self.header_row)
+            row = cells[:width] + [""] * max(0, width - len(cells))
+            self.rows.append(row)
+            new_rows.append(row)
+            if self.first_row_at is None:
+                self.first_row_at = time.perf_counter()
+        return new_rows
+
+
+class StreamingCSVWriter:
+    """Append rows to a ``.part`` file and move it over the CSV when complete."""
+
+    def __init__(self, csv_path: Path) -> None:
+        self.csv_path = csv_path
+        self.part_path = csv_path.with_name(f".{csv_path.name}.part")
+        self._fh: Optional[IO[str]] = None
+        self._writer: Optional[csv.writer] = None  # type: ignore[valid-type]
+        self.written: List[List[str]] = []
+
+    def append(self, header: List[str], rows: List[List[str]]) -> None:
+        if self._fh is None:
+            self.part_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.part_path.open("w", encoding="utf-8", newline="")
+            self._writer = csv.writer(self._fh, quoting=csv.QUOTE_MINIMAL)
+            self._write([list(header)])
+        self._write(rows)
+        self._fh.flush()
+
+    def _write(self, rows: List[List[str]]) -> None:
+        for row in rows:
+            self._writer.writerow(row)  # type: ignore[union-attr]
+            self.written.append(list(row))
+
+    def commit(self, rows: List[List[str]]) -> bool:
+        """Publish ``rows`` (header first) as the CSV.
+
+        The streamed file is renamed into place when it already holds exactly
+        ``rows``; otherwise the CSV is written from ``rows``. Returns whether
+        the streamed file was used.
+        """
+
+        self._close()
+        if self.written and self.written == [list(row) for row in rows]:
+            get_scrape_store().adopt(self.csv_path, self.part_path, self.written)
+            return True
+        self.abort()
+        get_scrape_store().write_rows(self.csv_path, rows)
+        return False
+
+    def abort(self) -> None:
+        self._close()
+        self.written = []
+        try:
+            self.part_path.unlink()
+        except OSError:
+            pass
+
+    def _close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._writer = None
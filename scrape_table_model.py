@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from app_logging import get_logger
-from pdf_utils import PDFEntry, normalize_header_row
+from pdf_utils import PDFEntry
+from scrape_store import get_scrape_store
 
 logger = get_logger()
 
@@ -41,26 +41,11 @@ class ScrapeTableModel:
     # CSV helpers
     # ------------------------------------------------------------------
     def load_csv_rows(self) -> Tuple[Optional[List[str]], List[List[str]]]:
-        rows: List[List[str]] = []
-        if self.csv_path.exists():
-            try:
-                with self.csv_path.open("r", encoding="utf-8", newline="") as fh:
-                    reader = csv.reader(fh)
-                    for raw_row in reader:
-                        if any(cell.strip() for cell in raw_row):
-                            rows.append([cell.strip() for cell in raw_row])
-            except OSError:
-                rows = []
-
         header: Optional[List[str]] = None
         data_rows: List[List[str]] = []
-        if rows:
-            candidate = normalize_header_row(rows[0])
-            if candidate is not None:
-                header = candidate
-                data_rows = rows[1:]
-            else:
-                data_rows = rows
+        table = get_scrape_store().get(self.csv_path)
+        if table is not None:
+            header, data_rows = table.model_view()
 
         self.has_csv_data = bool(data_rows)
         return header, data_rows
@@ -74,16 +59,15 @@ class ScrapeTableModel:
             )
             return
 
+        expected_len = len(columns)
+        table_rows: List[List[str]] = [list(columns)]
+        for values in rows:
+            row = list(values[:expected_len])
+            if len(row) < expected_len:
+                row.extend([""] * (expected_len - len(row)))
+            table_rows.append(row)
         try:
-            with self.csv_path.open("w", encoding="utf-8", newline="") as fh:
-                writer = csv.writer(fh, quoting=csv.QUOTE_MINIMAL)
-                writer.writerow(columns)
-                expected_len = len(columns)
-                for values in rows:
-                    row = list(values[:expected_len])
-                    if len(row) < expected_len:
-                        row.extend([""] * (expected_len - len(row)))
-                    writer.writerow(row)
+            get_scrape_store().write_rows(self.csv_path, table_rows)
         except OSError:
             logger.exception(
                 "Unable to persist CSV after table modification for %s - %s",
@@ -0,0 +1,203 @@
+"""On-disk cache of extracted page text, keyed by PDF content hash.
+
+Blobs live in ``companies/<company>/page_text_cache/<key>.json.gz`` where the
+key is the SHA-256 of the PDF bytes combined with the PyMuPDF version, so a
+MuPDF upgrade or an edited report never serves stale text. The module level
+helpers only touch the file system and are safe to call from scan worker
+processes; :class:`PageTextCache` owns the path index and LRU eviction and is
+used from the main thread.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fitz  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - handled at runtime
+    fitz = None  # type: ignore[assignment]
+
+from app_logging import get_logger
+
+
+logger = get_logger()
+
+TEXT_CACHE_DIRNAME = "page_text_cache"
+INDEX_FILENAME = "index.json"
+BLOB_SUFFIX = ".json.gz"
+
+
+def _mupdf_version() -> str:
+    return str(getattr(fitz, "VersionBind", "none")) if fitz is not None else "none"
+
+
+def compute_text_key(pdf_path: Path) -> str:
+    """Return the cache key for ``pdf_path`` (content hash + PyMuPDF version)."""
+
+    digest = hashlib.sha256()
+    with Path(pdf_path).open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    digest.update(f"|mupdf={_mupdf_version()}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def blob_path(cache_dir: Path, key: str) -> Path:
+    return Path(cache_dir) / f"{key}{BLOB_SUFFIX}"
+
+
+def read_texts(cache_dir: Path, key: str) -> Optional[List[str]]:
+    """Return cached page texts for ``key`` or ``None`` on a miss."""
+
+    if not key:
+        return None
+    path = blob_path(cache_dir, key)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            texts = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return None
+    try:
+        # The blob mtime doubles as the last-access time for LRU eviction.
+        os.utime(path)
+    except OSError:
+        pass
+    return texts
+
+
+def write_texts(cache_dir: Path, key: str, texts: List[str]) -> None:
+    """Atomically write ``texts`` for ``key``; failures are logged and ignored."""
+
+    if not key:
+        return
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as gz:
+                gz.write(json.dumps(texts, ensure_ascii=False).encode("utf-8"))
+            os.replace(tmp_name, blob_path(cache_dir, key))
+        except Exception:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+    except OSError as exc:
+        logger.warning("⚠️ Could not write page text cache %s: %s", key[:12], exc)
+
+
+class PageTextCache:
+    """Path index and size-capped LRU eviction for one company's text cache."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, object]] = {}
+        self._load_index()
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / INDEX_FILENAME
+
+    def _load_index(self) -> None:
+        try:
+            with self.index_path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._index = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def save_index(self) -> None:
+        with self._lock:
+            payload = dict(self._index)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".json.tmp")
+            with tmp_path.open("w", encoding="utf-8") as fh:
+                json.dump(payload, fh, indent=2)
+            os.replace(tmp_path, self.index_path)
+        except OSError as exc:
+            logger.warning("⚠️ Could not save page text cache index: %s", exc)
+
+    def known_key(self, pdf_path: Path) -> str:
+        """Return the recorded key if ``pdf_path`` is unchanged since it was hashed."""
+
+        try:
+            stat = Path(pdf_path).stat()
+        except OSError:
+            return ""
+        with self._lock:
+            record = self._index.get(str(pdf_path))
+        if not record:
+            return ""
+        if record.get("size") != stat.st_size or record.get("mtime_ns") != stat.st_mtime_ns:
+            return ""
+        if record.get("mupdf") != _mupdf_version():
+            return ""
+        key = record.get("key")
+        return key if isinstance(key, str) else ""
+
+    def remember(self, pdf_path: Path, key: str) -> None:
+        if not key:
+            return
+        try:
+            stat = Path(pdf_path).stat()
+        except OSError:
+            return
+        with self._lock:
+            self._index[str(pdf_path)] = {
+                "key": key,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "mupdf": _mupdf_version(),
+            }
+
+    def read(self, key: str) -> Optional[List[str]]:
+        return read_texts(self.cache_dir, key)
+
+    def write(self, key: str, texts: List[str]) -> None:
+        write_texts(self.cache_dir, key, texts)
+
+    def evict(self) -> int:
+        """Delete least recently used blobs until the cache fits ``max_bytes``."""
+
+        try:
+            blobs = [
+                (path.stat().st_mtime_ns, path.stat().st_size, path)
+                for path in self.cache_dir.glob(f"*{BLOB_SUFFIX}")
+            ]
+        except OSError:
+            return 0
+        total = sum(size for _, size, _ in blobs)
+        removed_keys = set()
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed_keys.add(path.name[: -len(BLOB_SUFFIX)])
+        if removed_keys:
+            with self._lock:
+                self._index = {
+                    name: record
+                    for name, record in self._index.items()
+                    if record.get("key") not in removed_keys
+                }
+            logger.info("🧹 Evicted %d page text cache blob(s)", len(removed_keys))
+        return len(removed_keys)
@@ -0,0 +1,160 @@
+"""Shrink AIScrape text payloads before they are sent to OpenAI.
+
+In ``text`` upload mode every selected page is sent as its raw
+``get_text("text")`` output. Annual-report pages repeat the same running
+header and footer (report title, company name, page number) and carry long
+whitespace runs, all of which cost tokens and latency without adding rows.
+
+:func:`compact_page_texts` removes lines that recur at the top or bottom of
+most pages of the document, collapses whitespace and drops blank lines.
+Optionally each page is first rebuilt by :func:`table_blocks_text` from its
+``get_text("blocks")`` output, keeping only blocks that hold numbers and the
+label blocks on the same lines as them. The ``--- Page N ---`` separators are
+kept in both cases.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+
+# Lines this close to the top or bottom of a page are header/footer candidates.
+EDGE_LINES = 2
+# A candidate must recur on at least this share of the reference pages...
+REPEAT_MIN_FRACTION = 0.5
+# ...and on at least this many of them.
+REPEAT_MIN_PAGES = 3
+
+_WHITESPACE_RE = re.compile(r"[ \t\u00a0\u2000-\u200b\u3000]+")
+_DIGITS_RE = re.compile(r"\d+")
+_NUMBER_RE = re.compile(r"\(?[-+]?\$?\d[\d,]*\.?\d*\)?%?")
+
+
+@dataclass
+class CompactionResult:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    removed_lines: int = 0
+
+    @property
+    def saved_fraction(self) -> float:
+        if self.tokens_before <= 0:
+            return 0.0
+        return 1.0 - self.tokens_after / self.tokens_before
+
+
+def estimate_text_tokens(text: str) -> int:
+    """~4 characters per token, the same ratio ``estimate_tokens`` budgets with."""
+
+    return len(text) // 4
+
+
+def collapse_whitespace(text: str) -> List[str]:
+    """Non-empty lines of ``text`` with whitespace runs collapsed to one space."""
+
+    lines = (_WHITESPACE_RE.sub(" ", line).strip() for line in text.splitlines())
+    return [line for line in lines if line]
+
+
+def _signature(line: str) -> str:
+    # Page numbers and years change from page to page; the header does not.
+    return _DIGITS_RE.sub("#", line.lower())
+
+
+def _numeric_tokens(line: str) -> int:
+    return sum(1 for token in line.split() if _NUMBER_RE.fullmatch(token))
+
+
+def detect_repeating_lines(page_texts: Sequence[str]) -> Set[str]:
+    """Signatures of header/footer lines recurring across ``page_texts``.
+
+    Lines with two or more numbers (column headings such as ``2024 2023``
+    and data rows) are never treated as headers.
+    """
+
+    counts: Counter = Counter()
+    pages = 0
+    for text in page_texts:
+        lines = collapse_whitespace(text)
+        if not lines:
+            continue
+        pages += 1
+        edges = lines[:EDGE_LINES] + lines[-EDGE_LINES:]
+        counts.update({_signature(line) for line in edges if _numeric_tokens(line) < 2})
+    threshold = max(REPEAT_MIN_PAGES, int(pages * REPEAT_MIN_FRACTION + 0.999))
+    return {signature for signature, count in counts.items() if count >= threshold}
+
+
+def _strip_edges(lines: List[str], repeating: Set[str]) -> Tuple[List[str], int]:
+    if not repeating:
+        return lines, 0
+    keep = [True] * len(lines)
+    edge_indexes = list(range(min(EDGE_LINES, len(lines))))
+    edge_indexes += range(max(0, len(lines) - EDGE_LINES), len(lines))
+    for idx in edge_indexes:
+        line = lines[idx]
+        if _numeric_tokens(line) < 2 and _signature(line) in repeating:
+            keep[idx] = False
+    kept = [line for line, flag in zip(lines, keep) if flag]
+    return kept, len(lines) - len(kept)
+
+
+def table_blocks_text(page: Any) -> Optional[str]:
+    """Text of the table-like blocks of a PyMuPDF ``page``, top to bottom.
+
+    A block is kept when it contains a number or shares a line band with one
+    that does, so row labels laid out as their own column are not lost.
+    Returns ``None`` when the page has no numeric block at all.
+    """
+
+    blocks = [b for b in page.get_text("blocks") if len(b) > 6 and b[6] == 0 and str(b[4]).strip()]
+    numeric = [b for b in blocks if any(_NUMBER_RE.fullmatch(t) for t in str(b[4]).split())]
+    if not numeric:
+        return None
+
+    def beside_numbers(block: Any) -> bool:
+        top, bottom = block[1], block[3]
+        return any(min(bottom, other[3]) - max(top, other[1]) > 0 for other in numeric)
+
+    kept = [b for b in blocks if b in numeric or beside_numbers(b)]
+    kept.sort(key=lambda b: (round(b[1], 1), b[0]))
+    return "\n".join(str(b[4]) for b in kept)
+
+
+def compact_page_texts(
+    pages: Sequence[Tuple[int, str]],
+    reference_texts: Optional[Sequence[str]] = None,
+    block_texts: Optional[Sequence[Optional[str]]] = None,
+) -> CompactionResult:
+    """Compact ``(page_index, text)`` pairs into one ``--- Page N ---`` payload.
+
+    ``reference_texts`` are the page texts used to detect running headers
+    and footers (ideally the whole document; the selected pages otherwise).
+    ``block_texts`` holds the :func:`table_blocks_text` of each page when
+    only table-like blocks should be kept; a ``None`` entry falls back to the
+    page's full text.
+    """
+
+    raw = "\n\n".join(f"--- Page {index + 1} ---\n{text.strip()}" for index, text in pages if text.strip())
+    repeating = detect_repeating_lines(reference_texts if reference_texts is not None else [t for _, t in pages])
+    snippets: List[str] = []
+    removed = 0
+    for position, (index, text) in enumerate(pages):
+        source = text
+        if block_texts is not None and block_texts[position] is not None:
+            source = block_texts[position] or ""
+        lines, dropped = _strip_edges(collapse_whitespace(source), repeating)
+        removed += dropped
+        if lines:
+            snippets.append(f"--- Page {index + 1} ---\n" + "\n".join(lines))
+    text = "\n\n".join(snippets)
+    return CompactionResult(
+        text=text,
+        tokens_before=estimate_text_tokens(raw),
+        tokens_after=estimate_text_tokens(text),
+        removed_lines=removed,
+    )
@@ -0,0 +1,200 @@
+"""Background rendering of Review-grid thumbnails.
+
+Pages are rasterised in worker processes that open the PDF by path, so the
+``fitz.Document`` handles owned by the Tk thread are never shared. Finished
+PIL images are collected by polling the futures from the Tk thread with
+``root.after`` (executor callbacks never touch Tk), and the caller turns them
+into ``PhotoImage`` objects. Requests are dispatched nearest-to-viewport
+first, and :meth:`ThumbnailPipeline.cancel` drops everything queued for a
+grid that is being rebuilt.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+import tkinter as tk
+
+try:
+    import fitz  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - handled at runtime
+    fitz = None  # type: ignore[assignment]
+
+from PIL import Image
+
+from app_logging import get_logger
+from render_cache import file_identity, rasterize_page
+
+
+logger = get_logger()
+
+# Documents kept open per worker process; rows render many pages of one PDF.
+_WORKER_DOC_LIMIT = 8
+_worker_docs: "OrderedDict[str, Any]" = OrderedDict()
+# How often the Tk thread checks for finished renders while any are in flight.
+_POLL_MS = 30
+
+
+def _worker_document(path: str) -> Any:
+    identity = file_identity(path)
+    cached = _worker_docs.get(path)
+    if cached is not None and cached[0] == identity:
+        _worker_docs.move_to_end(path)
+        return cached[1]
+    if cached is not None:
+        cached[1].close()
+    doc = fitz.open(path)  # type: ignore[union-attr]
+    _worker_docs[path] = (identity, doc)
+    while len(_worker_docs) > _WORKER_DOC_LIMIT:
+        _, (_, stale) = _worker_docs.popitem(last=False)
+        stale.close()
+    return doc
+
+
+def render_thumbnail(path: str, page_index: int, target_width: int) -> Image.Image:
+    """Process-pool entry point: render one page of ``path`` at ``target_width``."""
+
+    return rasterize_page(_worker_document(path), page_index, target_width)
+
+
+@dataclass(order=True)
+class _Request:
+    priority: Tuple[float, int]
+    order: int
+    path: str = field(compare=False)
+    page_index: int = field(compare=False)
+    target_width: int = field(compare=False)
+    generation: int = field(compare=False)
+    priority_fn: Callable[[], Optional[Tuple[float, int]]] = field(compare=False)
+    on_ready: Callable[[Image.Image], None] = field(compare=False)
+
+
+class ThumbnailPipeline:
+    """Prioritised, cancellable thumbnail rendering on a process pool."""
+
+    def __init__(self, root: tk.Misc, workers: int) -> None:
+        self.root = root
+        self.workers = max(1, int(workers))
+        self.generation = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[_Request] = []
+        self._in_flight: List[Tuple[Future, _Request]] = []
+        self._poll_after: Optional[str] = None
+        self._counter = itertools.count()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def request(
+        self,
+        path: str,
+        page_index: int,
+        target_width: int,
+        priority_fn: Callable[[], Optional[Tuple[float, int]]],
+        on_ready: Callable[[Image.Image], None],
+    ) -> None:
+        """Queue a render; ``on_ready`` runs on the Tk thread with the image.
+
+        ``priority_fn`` returns a sort key (lower renders first) or ``None``
+        once the requester is gone, which drops the request.
+        """
+
+        priority = priority_fn()
+        if priority is None:
+            return
+        item = _Request(
+            priority=priority,
+            order=next(self._counter),
+            path=path,
+            page_index=page_index,
+            target_width=target_width,
+            generation=self.generation,
+            priority_fn=priority_fn,
+            on_ready=on_ready,
+        )
+        heapq.heappush(self._pending, item)
+        self._pump()
+
+    def reprioritize(self) -> None:
+        """Recompute queued priorities, e.g. after the Review grid scrolled."""
+
+        kept: List[_Request] = []
+        for item in self._pending:
+            priority = item.priority_fn()
+            if priority is not None:
+                item.priority = priority
+                kept.append(item)
+        heapq.heapify(kept)
+        self._pending = kept
+
+    def cancel(self) -> None:
+        """Forget every queued request; results still in flight are dropped."""
+
+        self.generation += 1
+        self._pending.clear()
+
+    def shutdown(self) -> None:
+        """Drop all work and stop the worker processes; call before the root window is destroyed."""
+
+        self.cancel()
+        self._in_flight.clear()
+        if self._poll_after is not None:
+            try:
+                self.root.after_cancel(self._poll_after)
+            except tk.TclError:
+                pass
+            self._poll_after = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pump(self) -> None:
+        # Keep each worker busy with one job plus one queued behind it, so a
+        # scroll can still reorder everything else.
+        while self._pending and len(self._in_flight) < self.workers * 2:
+            item = heapq.heappop(self._pending)
+            try:
+                future = self._pool().submit(
+                    render_thumbnail, item.path, item.page_index, item.target_width
+                )
+            except RuntimeError as exc:
+                logger.warning("⚠️ Thumbnail pool unavailable: %s", exc)
+                self._pending.clear()
+                return
+            self._in_flight.append((future, item))
+        self._schedule_poll()
+
+    def _schedule_poll(self) -> None:
+        if self._poll_after is None and self._in_flight:
+            try:
+                self._poll_after = self.root.after(_POLL_MS, self._poll)
+            except tk.TclError:
+                pass
+
+    def _poll(self) -> None:
+        self._poll_after = None
+        finished: List[Tuple[Future, _Request]] = []
+        still_running: List[Tuple[Future, _Request]] = []
+        for entry in self._in_flight:
+            # One done() check per future, so none can slip between the two lists.
+            (finished if entry[0].done() else still_running).append(entry)
+        self._in_flight = still_running
+        for future, item in finished:
+            self._deliver(future, item)
+        self._pump()
+
+    def _deliver(self, future: Future, item: _Request) -> None:
+        if item.generation != self.generation or future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.warning("⚠️ Thumbnail render failed for %s page %d: %s", item.path, item.page_index + 1, exc)
+            return
+        item.on_ready(future.result())
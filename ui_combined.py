@@ -10,7 +10,7 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -24,6 +24,7 @@ from combined_utils import (
     build_release_date_prompt,
     build_stock_multiplier_prompt,
     generate_and_open_stock_multipliers,
+    pivot_scrape_tables,
 )
 
 COMBINED_BASE_COLUMNS = [
@@ -34,15 +35,17 @@ COMBINED_BASE_COLUMNS = [
     "NOTE",
     "Key4Coloring",
 ]
+from scrape_store import get_scrape_store
 from ui_widgets import CollapsibleFrame
-from pdf_utils import PDFEntry, normalize_header_row
+from virtual_treeview import VirtualTreeview
+from pdf_utils import PDFEntry
 
 
 class CombinedUIMixin:
     root: tk.Misc
     combined_tab: Optional[ttk.Frame]
     combined_date_tree: Optional[ttk.Treeview]
-    combined_table: Optional[ttk.Treeview]
+    combined_table: Optional[VirtualTreeview]
     combined_create_button: Optional[ttk.Button]
     mapping_create_button: Optional[ttk.Button]
     combined_columns: List[str]
@@ -57,6 +60,10 @@ class CombinedUIMixin:
     companies_dir: Path
     assigned_pages: Dict[str, Dict[str, Any]]
     canvas_window: int
+    combined_refresh_requests: int
+    combined_refresh_runs: int
+    combined_refresh_coalesced: int
+    _combined_refresh_after: Optional[str]
 
     def _on_note_conflict_double_click(self, event: tk.Event, tree: ttk.Treeview) -> None:
         """Focus the Scrape TYPE/PDF tabs when a conflict row is double-clicked."""
@@ -486,7 +493,7 @@ class CombinedUIMixin:
         table_container.pack(fill=tk.BOTH, expand=True)
         table_container.rowconfigure(0, weight=1)
         table_container.columnconfigure(0, weight=1)
-        self.combined_table = ttk.Treeview(table_container, columns=("init",), show="headings")
+        self.combined_table = VirtualTreeview(table_container, columns=("init",), show="headings")
         self.combined_table.heading("init", text="Combined table not yet created. Click 'Create'.")
         self.combined_table.column("init", width=600, anchor=tk.W, stretch=True)
         self.combined_table.grid(row=0, column=0, sticky="nsew")
@@ -506,24 +513,10 @@ class CombinedUIMixin:
         return entry.path.parent / "openapiscrape" / entry.path.stem
 
     def _read_csv_path(self, path: Path) -> Tuple[List[str], List[List[str]]]:
-        header: List[str] = []
-        rows: List[List[str]] = []
-        if not path.exists():
-            return header, rows
-        try:
-            with path.open("r", encoding="utf-8", newline="") as fh:
-                reader = csv.reader(fh)
-                for raw in reader:
-                    if not raw:
-                        continue
-                    if not header:
-                        cand = normalize_header_row([c.strip() for c in raw])
-                        header = cand or [c.strip() for c in raw]
-                    else:
-                        rows.append([c.strip() for c in raw])
-        except Exception:
+        table = get_scrape_store().get(path)
+        if table is None:
             return [], []
-        return header, rows
+        return table.combined_view()
 
     @staticmethod
     def _date_columns_from_header(header: List[str]) -> List[str]:
@@ -654,6 +647,33 @@ class CombinedUIMixin:
         return ";".join(str(p + 1) for p in pages)
 
     def refresh_combined_tab(self) -> None:
+        """Request a rebuild of the date matrix.
+
+        Requests are coalesced: however many arrive before Tk goes idle, the
+        CSV headers are read and the Treeview rebuilt only once.
+        """
+
+        self.combined_refresh_requests += 1
+        if self._combined_refresh_after is not None:
+            self.combined_refresh_coalesced += 1
+            return
+        try:
+            self._combined_refresh_after = self.root.after_idle(self._refresh_combined_tab_now)
+        except (RuntimeError, tk.TclError):
+            self._refresh_combined_tab_now()
+
+    def _refresh_combined_tab_now(self) -> None:
+        self._combined_refresh_after = None
+        self.combined_refresh_runs += 1
+        if self.combined_refresh_coalesced:
+            logger = getattr(self, "logger", None)
+            if logger is not None:
+                logger.info(
+                    "🧮 Combined refresh #%d (%d requests so far, %d redundant refreshes avoided)",
+                    self.combined_refresh_runs,
+                    self.combined_refresh_requests,
+                    self.combined_refresh_coalesced,
+                )
         if self.combined_date_tree is None:
             return
         dyn_columns, rows_by_type, warnings = self._build_date_matrix_data()
@@ -697,27 +717,6 @@ class CombinedUIMixin:
         if warnings:
             messagebox.showwarning("Combined", "\n".join(warnings))
 
-    def _apply_note_color_to_combined_item(self, item_id: str, columns: List[str], tv: ttk.Treeview) -> None:
-        try:
-            note_idx = next(i for i, n in enumerate(columns) if n.strip().lower() == "note")
-        except StopIteration:
-            return
-        values = list(tv.item(item_id, "values"))
-        if note_idx >= len(values):
-            return
-        note_val = str(values[note_idx]).strip()
-        color = self.get_note_color(note_val)
-        existing_tags = list(tv.item(item_id, "tags"))
-        filtered = [t for t in existing_tags if not t.startswith("note-color-")]
-        if color:
-            tag = f"note-color-{color.replace('#','')}"
-            try:
-                tv.tag_configure(tag, background=color)
-            except Exception:
-                pass
-            filtered.append(tag)
-        tv.item(item_id, tags=filtered)
-
     def clear_combined_table(self) -> None:
         """Remove any Combined.csv data from the UI and disable save actions."""
 
@@ -728,8 +727,7 @@ class CombinedUIMixin:
         tv = getattr(self, "combined_table", None)
         if tv is not None:
             try:
-                for iid in tv.get_children(""):
-                    tv.delete(iid)
+                tv.set_rows([])
             except Exception:
                 pass
 
@@ -746,44 +744,71 @@ class CombinedUIMixin:
         if self.combined_table is None:
             return
         tv = self.combined_table
-        for iid in tv.get_children(""):
-            tv.delete(iid)
         col_ids = [f"c{idx}" for idx in range(len(columns))]
         self.combined_table_col_ids = col_ids
         tv.configure(columns=col_ids, displaycolumns=col_ids, show="headings")
+        text_columns = {
+            "category",
+            "subcategory",
+            "item",
+            "note",
+            "key4coloring",
+        }
         for idx, cid in enumerate(col_ids):
             name = columns[idx]
-            text_columns = {
-                "category",
-                "subcategory",
-                "item",
-                "note",
-                "key4coloring",
-            }
             anchor = tk.W if name.lower() in text_columns else tk.E
             tv.heading(cid, text=name)
             width = self.get_scrape_column_width(name)
             tv.column(cid, width=width, anchor=anchor, stretch=True)
-        for row in rows:
-            raw_values = list(row[:len(col_ids)])
-            if len(raw_values) < len(col_ids):
-                raw_values += [""] * (len(col_ids) - len(raw_values))
+        tv.set_rows(rows, self._combined_row_view(columns))
+
+    def _combined_row_view(self, columns: List[str]) -> Callable[[List[str]], Tuple[List[str], Tuple[str, ...]]]:
+        """Return the formatter the virtual Combined table applies to visible rows.
+
+        Column kinds, the NOTE index and the tag per note colour are resolved
+        once here rather than for every row.
+        """
+
+        width = len(columns)
+        text_flags = [
+            name.lower() in ("type", "category", "subcategory", "item", "note", "key4coloring")
+            for name in columns
+        ]
+        note_idx = next((i for i, n in enumerate(columns) if n.strip().lower() == "note"), None)
+        note_tags: Dict[str, Tuple[str, ...]] = {}
+        tv = self.combined_table
+
+        def note_tag(note_val: str) -> Tuple[str, ...]:
+            cached = note_tags.get(note_val)
+            if cached is not None:
+                return cached
+            color = self.get_note_color(note_val)
+            tags: Tuple[str, ...] = ()
+            if color:
+                tag = f"note-color-{color.replace('#','')}"
+                try:
+                    tv.tag_configure(tag, background=color)
+                except Exception:
+                    pass
+                tags = (tag,)
+            note_tags[note_val] = tags
+            return tags
 
-            # === NEW: Visual formatting only (commas) ===
+        def row_view(row: List[str]) -> Tuple[List[str], Tuple[str, ...]]:
+            raw_values = list(row[:width])
+            if len(raw_values) < width:
+                raw_values += [""] * (width - len(raw_values))
+
+            # Visual formatting only (commas)
             formatted = []
-            for c_name, val in zip(columns, raw_values):
+            for is_text, val in zip(text_flags, raw_values):
                 s = str(val).strip()
 
-                # Text columns render unchanged
-                if c_name.lower() in ("type", "category", "subcategory", "item", "note", "key4coloring"):
+                # Text columns and empty cells render unchanged
+                if is_text or s == "":
                     formatted.append(s)
                     continue
 
-                # Empty → show empty
-                if s == "":
-                    formatted.append("")
-                    continue
-
                 # Try formatting numbers
                 try:
                     num = float(s)
@@ -795,11 +820,10 @@ class CombinedUIMixin:
                     # Non-numeric → render raw
                     formatted.append(s)
 
-            # Insert *formatted* display values
-            iid = tv.insert("", "end", values=formatted)
+            tags = note_tag(formatted[note_idx]) if note_idx is not None else ()
+            return formatted, tags
 
-            # Apply NOTE coloring based on raw data (unchanged)
-            self._apply_note_color_to_combined_item(iid, columns, tv)
+        return row_view
 
     def save_combined_to_csv(self, quiet: bool = False) -> None:
         if not self.combined_columns or not self.combined_rows:
@@ -1142,7 +1166,7 @@ class CombinedUIMixin:
         model_name = DEFAULT_OPENAI_MODEL or "gpt-5"
 
         def run_prompt(typ: str, prompt_text: str) -> Dict[str, List[str]]:
-            client = OpenAI(api_key=api_key)
+            client = self._openai_client(api_key)
             response = client.responses.create(
                 model=model_name,
                 input=[
@@ -1301,6 +1325,51 @@ class CombinedUIMixin:
             if 0 <= dyn_idx < len(self.combined_rename_names):
                 self.combined_rename_names[dyn_idx] = new_name
 
+    @staticmethod
+    def _sorted_combined_columns(
+        columns: List[str],
+    ) -> Tuple[List[str], Callable[[List[str]], List[str]]]:
+        """Return ``columns`` with date columns moved to the end in date order.
+
+        The callable reorders a row built against ``columns``. A repeated name
+        takes the value of its last occurrence within the row.
+        """
+
+        import re
+
+        def _is_date_column(col: str) -> bool:
+            return bool(
+                re.match(r"\d{2}\.\d{2}\.\d{4}", str(col))
+                or re.match(r"\d{4}-\d{2}-\d{2}", str(col))
+                or re.match(r"\d{2}/\d{2}/\d{4}", str(col))
+            )
+
+        def _parse_date_str(s: str):
+            for fmt in ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%d.%m.%y"):
+                try:
+                    return datetime.strptime(s, fmt)
+                except Exception:
+                    continue
+            return datetime.min
+
+        date_cols = [c for c in columns if _is_date_column(c)]
+        date_names = set(date_cols)
+        non_date_cols = [c for c in columns if c not in date_names]
+        sorted_columns = non_date_cols + sorted(date_cols, key=_parse_date_str)
+
+        # Rows normally share one length, so the permutation is built once.
+        permutations: Dict[int, List[int]] = {}
+
+        def reorder(row: List[str]) -> List[str]:
+            source = permutations.get(len(row))
+            if source is None:
+                last_index = {name: idx for idx, name in enumerate(columns[: len(row)])}
+                source = [last_index.get(c, -1) for c in sorted_columns]
+                permutations[len(row)] = source
+            return [row[i] if i >= 0 else "" for i in source]
+
+        return sorted_columns, reorder
+
     def create_combined_dataset(self) -> None:
         dyn_cols, rows_by_type, warnings = self._build_date_matrix_data()
         self.combined_dyn_columns = dyn_cols
@@ -1310,70 +1379,15 @@ class CombinedUIMixin:
         if company_name:
             mapping_lookup = self._load_key4color_lookup(company_name)
 
-        conflicts_by_key: Dict[Tuple[str, str, str, str], List[str]] = {}
-        duplicate_tracker: Dict[
-            Tuple[str, str], Dict[Tuple[str, str, str], List[Dict[str, str]]]
-        ] = {}
-        key_data: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        tables = []
         for entry in self.pdf_entries:
             base = self._combined_scrape_dir_for_entry(entry)
             for typ in COLUMNS:
-                csv_path = base / f"{typ}.csv"
-                header, rows = self._read_csv_path(csv_path)
-                header = header or SCRAPE_EXPECTED_COLUMNS
-                normalized_header = [col.strip() for col in header]
-                for row in rows or [[]]:
-                    padded = list(row[: len(normalized_header)])
-                    if len(padded) < len(normalized_header):
-                        padded.extend([""] * (len(normalized_header) - len(padded)))
-                    mapping = dict(zip(normalized_header, padded))
-                    category = str(mapping.get("CATEGORY", "")).strip()
-                    subcategory = str(mapping.get("SUBCATEGORY", "")).strip()
-                    item = str(mapping.get("ITEM", "")).strip()
-                    note_val = mapping.get("NOTE", "")
-                    table_key = (entry.path.name, typ)
-                    row_info = {
-                        "type": str(mapping.get("TYPE", typ) or typ),
-                        "category": category,
-                        "subcategory": subcategory,
-                        "item": item,
-                        "note": str(note_val),
-                        "pdf": entry.path.name,
-                    }
-                    duplicate_tracker.setdefault(table_key, {}).setdefault(
-                        (category, subcategory, item),
-                        [],
-                    ).append(row_info)
-                    # Include typ in key for downstream TYPE assignment
-                    key = (category, subcategory, item, typ)
-                    record = key_data.setdefault(key, {"NOTE": "", "values_by_dyn": {}})
-                    if note_val:
-                        existing_note = record.get("NOTE")
-                        if existing_note and existing_note.strip().lower() != note_val.strip().lower():
-                            entries = conflicts_by_key.setdefault(key, [])
-                            seen = {v.lower() for v in entries}
-                            for candidate in (existing_note, note_val):
-                                candidate_str = str(candidate)
-                                if candidate_str.lower() not in seen:
-                                    entries.append(candidate_str)
-                                    seen.add(candidate_str.lower())
-                        else:
-                            record["NOTE"] = note_val
-                    col_list = record.setdefault("values_by_dyn", {})
-                    for dc in dyn_cols:
-                        pdf_name = dc.get("pdf")
-                        idx = dc.get("index")
-                        if pdf_name != entry.path.name or idx is None:
-                            continue
-                        label = dc.get("labels", {}).get(typ, "")
-                        value = mapping.get(label, "") if label else ""
-                        if label:
-                            col_list[(pdf_name, idx)] = value
-        duplicate_rows: Dict[Tuple[str, str], List[Dict[str, str]]] = {}
-        for table_key, key_map in duplicate_tracker.items():
-            for rows in key_map.values():
-                if len(rows) > 1:
-                    duplicate_rows.setdefault(table_key, []).extend(rows)
+                header, rows = self._read_csv_path(base / f"{typ}.csv")
+                tables.append((entry.path.name, typ, header or SCRAPE_EXPECTED_COLUMNS, rows))
+        pivot = pivot_scrape_tables(tables, dyn_cols)
+        conflicts_by_key = pivot.conflicts
+        duplicate_rows = pivot.duplicates
 
         if duplicate_rows:
             viewer = tk.Toplevel(self.root)
@@ -1501,32 +1515,30 @@ class CombinedUIMixin:
                 for entry in self.pdf_entries:
                     base = self._combined_scrape_dir_for_entry(entry)
                     csv_path = base / f"{typ}.csv"
-                    if not csv_path.exists():
+                    table = get_scrape_store().get(csv_path)
+                    if table is None:
                         continue
 
                     try:
-                        import csv as csvmod
-                        with csv_path.open("r", encoding="utf-8") as fh:
-                            reader = csvmod.DictReader(fh)
-                            for row in reader:
-                                if (
-                                    row.get("CATEGORY", "") == cat
-                                    and row.get("SUBCATEGORY", "") == sub
-                                    and row.get("ITEM", "") == item
-                                    and row.get("TYPE", typ) == typ
-                                ):
-                                    tree.insert(
-                                        "",
-                                        tk.END,
-                                        values=(
-                                            row.get("TYPE", typ),          # TYPE
-                                            row.get("CATEGORY", ""),       # Category
-                                            row.get("SUBCATEGORY", ""),    # Subcategory
-                                            row.get("ITEM", ""),           # Item
-                                            row.get("NOTE", ""),           # Note
-                                            entry.path.name,               # PDF
-                                        ),
-                                    )
+                        for row in table.dict_rows():
+                            if (
+                                row.get("CATEGORY", "") == cat
+                                and row.get("SUBCATEGORY", "") == sub
+                                and row.get("ITEM", "") == item
+                                and row.get("TYPE", typ) == typ
+                            ):
+                                tree.insert(
+                                    "",
+                                    tk.END,
+                                    values=(
+                                        row.get("TYPE", typ),          # TYPE
+                                        row.get("CATEGORY", ""),       # Category
+                                        row.get("SUBCATEGORY", ""),    # Subcategory
+                                        row.get("ITEM", ""),           # Item
+                                        row.get("NOTE", ""),           # Note
+                                        entry.path.name,               # PDF
+                                    ),
+                                )
                     except Exception as e:
                         print(f"⚠️ Failed to read {csv_path}: {e}")
 
@@ -1690,17 +1702,12 @@ class CombinedUIMixin:
             return (k[0] or "", k[1] or "", k[2] or "")
 
         rows_out: List[List[str]] = []
-        for key in sorted(key_data.keys(), key=key_sort):
-            rec = key_data[key]
+        order = sorted(range(len(pivot.keys)), key=lambda i: key_sort(pivot.keys[i]))
+        for slot in order:
             # Unpack typ as well
-            cat, sub, item, typ = key
-            note_val = rec.get("NOTE", "")
-            values_map_dyn: Dict[Tuple[str, int], str] = rec.get("values_by_dyn", {})
-            values_for_row: List[str] = []
-            for dc in dyn_cols:
-                pdf = str(dc.get("pdf", ""))
-                pos = int(dc.get("index", 0))
-                values_for_row.append(values_map_dyn.get((pdf, pos), ""))
+            cat, sub, item, typ = pivot.keys[slot]
+            note_val = pivot.notes[slot]
+            values_for_row = pivot.values[slot]
 
             # Determine TYPE by current CSV being processed (for typ in COLUMNS)
             assigned_type = None
@@ -1723,46 +1730,17 @@ class CombinedUIMixin:
                 key4_value = item_clean
             rows_out.append([assigned_type, cat, sub, item, note_val, key4_value] + values_for_row)
 
-        final_rows = [pdf_summary] + multiplier_rows + [share_row, release_row] + stock_price_rows + rows_out
-        self._populate_combined_table(columns, final_rows)
-        self.combined_columns = columns
+        # === Sort date columns ascending; rows are emitted in that order ===
+        sorted_columns, reorder = self._sorted_combined_columns(columns)
+        final_rows = [
+            reorder(row)
+            for rows in ([pdf_summary], multiplier_rows, [share_row, release_row], stock_price_rows, rows_out)
+            for row in rows
+        ]
+        self.combined_columns = sorted_columns
         self.combined_rows = final_rows
+        self._populate_combined_table(sorted_columns, final_rows)
         self._update_mapping_buttons()
-        # === Sort date columns (and reorder rows accordingly) ===
-        import re
-        from datetime import datetime
-
-        def _is_date_column(col: str) -> bool:
-            return bool(
-                re.match(r"\d{2}\.\d{2}\.\d{4}", str(col))
-                or re.match(r"\d{4}-\d{2}-\d{2}", str(col))
-                or re.match(r"\d{2}/\d{2}/\d{4}", str(col))
-            )
-
-        def _parse_date_str(s: str):
-            for fmt in ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%d.%m.%y"):
-                try:
-                    return datetime.strptime(s, fmt)
-                except Exception:
-                    continue
-            return datetime.min
-
-        # Identify and sort date columns ascending
-        date_cols = [c for c in columns if _is_date_column(c)]
-        non_date_cols = [c for c in columns if c not in date_cols]
-        sorted_dates = sorted(date_cols, key=_parse_date_str)
-        sorted_columns = non_date_cols + sorted_dates
-
-        # Rebuild rows to match sorted columns
-        reordered_rows = []
-        for row in self.combined_rows:
-            mapping = {columns[i]: row[i] for i in range(min(len(columns), len(row)))}
-            reordered_rows.append([mapping.get(c, "") for c in sorted_columns])
-
-        # Update table and memory
-        self.combined_columns = sorted_columns
-        self.combined_rows = reordered_rows
-        self._populate_combined_table(sorted_columns, reordered_rows)
 
         # Auto-save Combined.csv silently when the table is generated
         self.save_combined_to_csv(quiet=True)
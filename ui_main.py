@@ -6,7 +6,7 @@ from typing import Any, Dict
 import tkinter as tk
 from tkinter import colorchooser, messagebox, simpledialog, ttk
 
-from constants import DEFAULT_NOTE_COLOR_SCHEME
+from constants import DEFAULT_NOTE_COLOR_SCHEME, SCAN_MODE_PROCESS, SCAN_MODE_THREAD
 
 
 class MainUIMixin:
@@ -15,6 +15,12 @@ class MainUIMixin:
     scrape_type_notebook: ttk.Notebook
     auto_scale_tables_var: tk.BooleanVar
     auto_load_last_company_var: tk.BooleanVar
+    bypass_response_cache_var: tk.BooleanVar
+    batch_scrape_categories_var: tk.BooleanVar
+    stream_scrape_responses_var: tk.BooleanVar
+    compact_text_payload_var: tk.BooleanVar
+    text_tables_only_var: tk.BooleanVar
+    local_table_extract_var: tk.BooleanVar
     note_color_scheme: Dict[str, str]
     scrape_column_widths: Dict[str, int]
     scrape_panels: Dict[Any, Any]
@@ -124,6 +130,7 @@ class MainUIMixin:
             window.focus_force()
 
         view_menu.add_command(label="Configure Scrape Row Height…", command=_configure_scrape_row_height)
+        view_menu.add_command(label="Render Cache Stats…", command=self.show_render_cache_stats)
         menu_bar.add_cascade(label="View", menu=view_menu)
 
         # ---------------------- Configuration → AIScrape Threads ----------------------
@@ -169,6 +176,89 @@ class MainUIMixin:
             tk.Button(dialog, text="Save", command=save_and_close, width=8).pack(pady=(8, 4))
 
         config_menu.add_command(label="AIScrape Threads…", command=_configure_aiscrape_threads)
+
+        def _configure_scan_workers() -> None:
+            """Open small dialog to set the PDF scan worker count and engine."""
+            dialog = tk.Toplevel(self.root)
+            dialog.title("Configure PDF Scan Workers")
+            dialog.geometry("300x170")
+            dialog.resizable(False, False)
+            dialog.grab_set()
+
+            tk.Label(
+                dialog,
+                text="Enter number of PDF scan workers:",
+                font=("Segoe UI", 10)
+            ).pack(pady=(15, 5))
+
+            var = tk.StringVar(value=str(self.get_scan_worker_count()))
+            entry = tk.Entry(dialog, textvariable=var, justify="center", font=("Consolas", 11))
+            entry.pack(pady=5)
+
+            process_var = tk.BooleanVar(value=self.get_scan_mode() == SCAN_MODE_PROCESS)
+            ttk.Checkbutton(
+                dialog, text="Scan in separate processes", variable=process_var
+            ).pack(pady=(4, 0))
+
+            def save_and_close():
+                try:
+                    val = int(var.get())
+                    if val <= 0:
+                        raise ValueError
+                    mode = SCAN_MODE_PROCESS if process_var.get() else SCAN_MODE_THREAD
+                    self.set_scan_settings(val, mode)
+                    messagebox.showinfo("PDF Scan Workers", f"Saved scan workers = {val} ({mode})")
+                    dialog.destroy()
+                except ValueError:
+                    messagebox.showerror("Invalid Input", "Please enter a positive integer.")
+
+            tk.Button(dialog, text="Save", command=save_and_close, width=8).pack(pady=(8, 4))
+
+        config_menu.add_command(label="PDF Scan Workers…", command=_configure_scan_workers)
+
+        def _configure_openai_endpoint() -> None:
+            """Ask for an OpenAI-compatible base URL (blank restores the default)."""
+            value = simpledialog.askstring(
+                "OpenAI Endpoint",
+                "OpenAI-compatible base URL for AIScrape\n(leave blank for api.openai.com):",
+                initialvalue=self.get_openai_base_url(),
+                parent=self.root,
+            )
+            if value is None:
+                return
+            self.set_openai_base_url(value)
+
+        config_menu.add_command(label="OpenAI Endpoint…", command=_configure_openai_endpoint)
+        config_menu.add_checkbutton(
+            label="Bypass AIScrape Response Cache",
+            variable=self.bypass_response_cache_var,
+            command=self._save_config,
+        )
+        config_menu.add_checkbutton(
+            label="Batch AIScrape Categories per PDF",
+            variable=self.batch_scrape_categories_var,
+            command=self._save_config,
+        )
+        config_menu.add_checkbutton(
+            label="Stream AIScrape Responses",
+            variable=self.stream_scrape_responses_var,
+            command=self._save_config,
+        )
+        config_menu.add_checkbutton(
+            label="Compact AIScrape Text Payloads",
+            variable=self.compact_text_payload_var,
+            command=self._save_config,
+        )
+        config_menu.add_checkbutton(
+            label="Send Only Table Blocks in Text Mode",
+            variable=self.text_tables_only_var,
+            command=self._save_config,
+        )
+        config_menu.add_checkbutton(
+            label="Try Local Table Extraction Before OpenAI",
+            variable=self.local_table_extract_var,
+            command=self._save_config,
+        )
         menu_bar.add_cascade(label="Configuration", menu=config_menu)
 
         # ---------------------------------------------------------------
@@ -197,6 +287,8 @@ class MainUIMixin:
             return
         if getattr(self, "combined_tab", None) is not None and widget is self.combined_tab:
             self.refresh_combined_tab()
+        elif getattr(self, "scrape_tab", None) is not None and widget is self.scrape_tab:
+            self.apply_stale_scrape_updates()
 
     def _on_toggle_auto_scale_tables(self) -> None:
         enabled = self.auto_scale_tables_var.get()
@@ -16,8 +16,17 @@ from constants import (
     DEFAULT_PATTERNS,
     YEAR_DEFAULT_PATTERNS,
 )
-from pdf_utils import Match, PDFEntry
-from ui_widgets import CategoryRow, CollapsibleFrame
+from PIL import Image
+
+from pdf_utils import Match, MatchThumbnail, PDFEntry
+from thumbnail_pipeline import ThumbnailPipeline
+from ui_widgets import CategoryRow, CollapsibleFrame, ReviewEntryRow
+
+
+# Extra PDF rows materialized above and below the viewport.
+REVIEW_OVERSCAN_ROWS = 2
+# Vertical gap between Review rows, in pixels.
+REVIEW_ROW_GAP = 8
 
 
 class ReviewUIMixin:
@@ -58,6 +67,13 @@ class ReviewUIMixin:
     thumbnail_scale: ttk.Scale
     commit_button: ttk.Button
     canvas_window: int
+    thumbnail_pipeline: ThumbnailPipeline
+    _review_entry_positions: Dict[Path, int]
+    _reprioritize_after: Optional[str]
+    _review_rows_by_index: Dict[int, ReviewEntryRow]
+    _review_row_pool: List[ReviewEntryRow]
+    _review_slot_height: int
+    _review_update_after: Optional[str]
 
     def build_review_tab(self, notebook: ttk.Notebook) -> None:
         review_tab = ttk.Frame(notebook)
@@ -103,7 +119,7 @@ class ReviewUIMixin:
                 variable=whitespace_var,
             ).pack(anchor="w")
 
-        apply_button = ttk.Button(patterns_frame, text="Apply Patterns", command=self.load_pdfs)
+        apply_button = ttk.Button(patterns_frame, text="Apply Patterns", command=self.rescan_patterns)
         apply_button.pack(anchor="e", pady=(8, 0))
 
         year_frame = ttk.LabelFrame(options_inner, text="Year pattern", padding=8)
@@ -140,7 +156,8 @@ class ReviewUIMixin:
         self.review_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         review_scrollbar = ttk.Scrollbar(review_container, orient=tk.VERTICAL, command=self.review_canvas.yview)
         review_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.review_canvas.configure(yscrollcommand=review_scrollbar.set)
+        self._review_scrollbar = review_scrollbar
+        self.review_canvas.configure(yscrollcommand=self._on_review_yscroll)
         self.review_canvas.bind("<Enter>", self._bind_review_mousewheel)
         self.review_canvas.bind("<Leave>", self._unbind_review_mousewheel)
 
@@ -149,10 +166,7 @@ class ReviewUIMixin:
         self.inner_frame.bind(
             "<Configure>", lambda _e: self.review_canvas.configure(scrollregion=self.review_canvas.bbox("all"))
         )
-        self.review_canvas.bind(
-            "<Configure>",
-            lambda event: self.review_canvas.itemconfigure(self.canvas_window, width=event.width),
-        )
+        self.review_canvas.bind("<Configure>", self._on_review_canvas_configure)
 
         actions_frame = ttk.Frame(review_tab, padding=8)
         actions_frame.pack(fill=tk.X, padx=8, pady=(0, 8))
@@ -160,42 +174,169 @@ class ReviewUIMixin:
         self.commit_button.pack(side=tk.RIGHT)
 
     def _rebuild_review_grid(self) -> None:
+        """Reset the virtualized Review grid for the current ``pdf_entries``.
+
+        Only the PDF rows in or near the viewport get widgets; they are placed
+        at fixed slots inside ``inner_frame`` and recycled while scrolling.
+        """
+
+        self.thumbnail_pipeline.cancel()
         for child in self.inner_frame.winfo_children():
             child.destroy()
         self.category_rows.clear()
+        self._review_rows_by_index = {}
+        self._review_row_pool = []
+        self._review_slot_height = 0
+        self._review_entry_positions = {entry.path: idx for idx, entry in enumerate(self.pdf_entries)}
+        self.review_canvas.yview_moveto(0)
 
         if not self.pdf_entries:
-            ttk.Label(self.inner_frame, text="Load PDFs to begin reviewing.").grid(
-                row=0, column=0, padx=16, pady=16, sticky="nw"
-            )
+            ttk.Label(self.inner_frame, text="Load PDFs to begin reviewing.").place(x=16, y=16)
+            self.inner_frame.configure(height=60)
             return
 
-        for row_index, entry in enumerate(self.pdf_entries):
-            container = ttk.Frame(self.inner_frame, padding=8)
-            container.grid(row=row_index, column=0, sticky="ew", padx=4, pady=4)
-            container.columnconfigure(1, weight=1)
-
-            info_frame = ttk.Frame(container)
-            info_frame.grid(row=0, column=0, sticky="nw", padx=(0, 12))
-            ttk.Label(info_frame, text=str(entry.path.name), anchor="w", width=30, wraplength=200).pack(anchor="w")
-            if entry.year:
-                ttk.Label(info_frame, text=f"Year: {entry.year}", foreground="#555555").pack(anchor="w", pady=(4, 0))
-
-            types_frame = ttk.Frame(container)
-            types_frame.grid(row=0, column=1, sticky="ew")
-            types_frame.columnconfigure(0, weight=1)
-
-            for idx, column in enumerate(COLUMNS):
-                row = CategoryRow(types_frame, self, entry, column)
-                row.frame.grid(row=idx, column=0, sticky="ew")
-                if idx:
-                    row.frame.grid_configure(pady=(8, 0))
-                self.category_rows[(entry.path, column)] = row
-                row.refresh()
-
-        self.inner_frame.columnconfigure(0, weight=1)
+        self._update_visible_review_rows()
         self._refresh_scrape_results()
 
+    def _update_visible_review_rows(self) -> None:
+        """Materialize rows for the visible window (plus overscan), recycle the rest."""
+
+        self._review_update_after = None
+        total = len(self.pdf_entries)
+        if not total:
+            return
+        if self._review_slot_height <= 0:
+            self._measure_review_slot()
+
+        slot = self._review_slot_height
+        top = self.review_canvas.canvasy(0)
+        height = max(self.review_canvas.winfo_height(), self.review_canvas.winfo_reqheight())
+        first = max(0, int(top // slot) - REVIEW_OVERSCAN_ROWS)
+        last = min(total - 1, int((top + height) // slot) + REVIEW_OVERSCAN_ROWS)
+        wanted = range(first, last + 1)
+
+        for index in [idx for idx in self._review_rows_by_index if idx not in wanted]:
+            self._release_review_row(index)
+        for index in wanted:
+            if index not in self._review_rows_by_index:
+                self._materialize_review_row(index)
+
+        if self._grow_review_slot():
+            self._layout_review_rows()
+
+    def _materialize_review_row(self, index: int) -> ReviewEntryRow:
+        entry = self.pdf_entries[index]
+        bundle = self._review_row_pool.pop() if self._review_row_pool else ReviewEntryRow(self.inner_frame, self)
+        bundle.bind(entry)
+        self._review_rows_by_index[index] = bundle
+        for column, row in bundle.category_rows.items():
+            self.category_rows[(entry.path, column)] = row
+        if self._review_slot_height > 0:
+            self._place_review_row(index, bundle)
+        return bundle
+
+    def _release_review_row(self, index: int) -> None:
+        bundle = self._review_rows_by_index.pop(index)
+        if bundle.entry is not None:
+            for column in bundle.category_rows:
+                self.category_rows.pop((bundle.entry.path, column), None)
+        bundle.release()
+        bundle.container.place_forget()
+        self._review_row_pool.append(bundle)
+
+    def _place_review_row(self, index: int, bundle: ReviewEntryRow) -> None:
+        slot = self._review_slot_height
+        bundle.container.place(
+            x=4, y=index * slot + REVIEW_ROW_GAP, relwidth=1.0, width=-8, height=slot - REVIEW_ROW_GAP
+        )
+
+    def _measure_review_slot(self) -> None:
+        # Rows share one layout, so the first one determines the slot height.
+        bundle = self._review_rows_by_index.get(0) or self._materialize_review_row(0)
+        bundle.container.place(x=4, y=REVIEW_ROW_GAP, relwidth=1.0, width=-8)
+        self.inner_frame.update_idletasks()
+        self._review_slot_height = max(1, bundle.container.winfo_reqheight() + REVIEW_ROW_GAP)
+        self._layout_review_rows()
+
+    def _grow_review_slot(self) -> bool:
+        tallest = max(
+            (bundle.container.winfo_reqheight() for bundle in self._review_rows_by_index.values()),
+            default=0,
+        )
+        if tallest + REVIEW_ROW_GAP <= self._review_slot_height:
+            return False
+        self._review_slot_height = tallest + REVIEW_ROW_GAP
+        return True
+
+    def _layout_review_rows(self) -> None:
+        self.inner_frame.configure(height=len(self.pdf_entries) * self._review_slot_height + REVIEW_ROW_GAP)
+        for index, bundle in self._review_rows_by_index.items():
+            self._place_review_row(index, bundle)
+
+    def _schedule_review_update(self) -> None:
+        if self._review_update_after is None and self.pdf_entries:
+            self._review_update_after = self.root.after_idle(self._update_visible_review_rows)
+
+    def request_thumbnail(self, thumb: MatchThumbnail) -> None:
+        """Show ``thumb``'s page from the cache or queue it on the thumbnail pipeline."""
+
+        entry = thumb.entry
+        page_index = thumb.match.page_index
+        width = thumb.row.target_width
+        image = self.cached_page_image(entry.doc, page_index, target_width=width)
+        if image is not None:
+            thumb.set_image(image)
+            return
+        thumb.show_placeholder()
+
+        def on_ready(rendered: Image.Image) -> None:
+            self.store_page_image(entry.doc, page_index, rendered, target_width=width)
+            if thumb.exists() and thumb.row.target_width == width:
+                thumb.set_image(rendered)
+
+        self.thumbnail_pipeline.request(
+            str(entry.path),
+            page_index,
+            width,
+            lambda: self._thumbnail_priority(thumb),
+            on_ready,
+        )
+
+    def _thumbnail_priority(self, thumb: MatchThumbnail) -> Optional[Tuple[float, int]]:
+        """Distance of ``thumb``'s PDF row from the visible part of the grid.
+
+        ``None`` tells the pipeline the thumbnail was recycled and can be dropped.
+        """
+
+        if not thumb.exists():
+            return None
+        try:
+            top, bottom = self.review_canvas.yview()
+        except tk.TclError:
+            top, bottom = 0.0, 1.0
+        positions = self._review_entry_positions
+        total = max(1, len(positions))
+        position = (positions.get(thumb.entry.path, total) + 0.5) / total
+        if top <= position <= bottom:
+            distance = 0.0
+        else:
+            distance = min(abs(position - top), abs(position - bottom))
+        return (distance, thumb.match_index)
+
+    def _on_review_yscroll(self, first: str, last: str) -> None:
+        self._review_scrollbar.set(first, last)
+        self._schedule_review_update()
+        if self._reprioritize_after is None:
+            self._reprioritize_after = self.root.after_idle(self._reprioritize_thumbnails)
+
+    def _reprioritize_thumbnails(self) -> None:
+        self._reprioritize_after = None
+        self.thumbnail_pipeline.reprioritize()
+
+    def _on_review_canvas_configure(self, event: tk.Event) -> None:  # type: ignore[override]
+        self.review_canvas.itemconfigure(self.canvas_window, width=event.width)
+        self._schedule_review_update()
+
     def _bind_review_mousewheel(self, _: tk.Event) -> None:  # type: ignore[override]
         self.review_canvas.bind_all("<MouseWheel>", self._on_review_mousewheel)
         self.review_canvas.bind_all("<Button-4>", self._on_review_mousewheel)
@@ -221,6 +362,10 @@ class ReviewUIMixin:
         self.thumbnail_width_var.set(width)
         for row in self.category_rows.values():
             row.set_thumbnail_width(width)
+        if self._review_rows_by_index:
+            # Thumbnail height drives the row height; measure the slot again.
+            self._review_slot_height = 0
+            self._update_visible_review_rows()
 
     def select_match(
         self,
@@ -247,7 +392,7 @@ class ReviewUIMixin:
         row = self.category_rows.get((entry.path, category))
         if row is not None:
             row.update_selection()
-        self._refresh_scrape_results()
+        self._refresh_scrape_panel(entry, category)
 
     def manual_select(self, entry: PDFEntry, category: str) -> None:
         self.open_pdf(entry.path)
@@ -274,7 +419,7 @@ class ReviewUIMixin:
         row = self.category_rows.get((entry.path, category))
         if row is not None:
             row.refresh()
-        self._refresh_scrape_results()
+        self._refresh_scrape_panel(entry, category)
 
     def open_pdf(self, path: Path) -> None:
         self._open_with_default_app(path, "Open PDF")
@@ -404,7 +549,7 @@ class ReviewUIMixin:
 
         screen_height = window.winfo_screenheight()
         target_height = max(screen_height - 160, 400)
-        photo = self.render_page(entry.doc, page_index, target_height=target_height)
+        photo = self.render_page(entry.doc, page_index, target_height=target_height, high_quality=True)
         if photo is None:
             label = ttk.Label(inner, text="Preview unavailable", padding=24)
             label.pack(expand=True, fill=tk.BOTH)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import tkinter as tk
 from tkinter import ttk
@@ -45,6 +45,7 @@ class ScrapeUIMixin:
     scrape_row_registry: Dict[Tuple[str, str, str], List[Tuple[ScrapeResultPanel, str]]]
     scrape_row_state_by_key: Dict[Tuple[str, str, str], str]
     scrape_column_widths: Dict[str, int]
+    stale_scrape_keys: Set[Tuple[Path, str]]
 
     def build_scrape_tab(self, notebook: ttk.Notebook) -> None:
         scrape_tab = ttk.Frame(notebook)
@@ -55,6 +56,10 @@ class ScrapeUIMixin:
         scrape_controls.pack(fill=tk.X)
         self.scrape_button = ttk.Button(scrape_controls, text="AIScrape", command=self.scrape_selected_pages)
         self.scrape_button.pack(side=tk.LEFT)
+        self.backfill_button = ttk.Button(
+            scrape_controls, text="Batch Backfill", command=self.backfill_selected_pages
+        )
+        self.backfill_button.pack(side=tk.LEFT, padx=(6, 0))
         self.open_scrape_dir_button = ttk.Button(
             scrape_controls, text="Open Folder", command=self.open_scrape_folder
         )
@@ -199,7 +204,98 @@ class ScrapeUIMixin:
         new_idx = (current_idx + delta) % total_tabs
         notebook.select(new_idx)
 
+    def _scrape_target_base(self, entry: PDFEntry) -> Path:
+        company = self.company_var.get().strip()
+        if company:
+            return self.companies_dir / company / "openapiscrape" / entry.path.stem
+        return entry.path.parent / "openapiscrape" / entry.path.stem
+
+    def _ensure_scrape_panel(self, entry: PDFEntry, category: str) -> Optional[ScrapeResultPanel]:
+        """Return the panel for ``(entry, category)``, creating it when it has content.
+
+        A panel is only created once pages are selected or scrape output exists.
+        """
+
+        key = (entry.path, category)
+        panel = self.scrape_panels.get(key)
+        if panel is not None:
+            return panel
+        parent_inner = self.scrape_category_inners.get(key)
+        if parent_inner is None:
+            return None
+        target_base = self._scrape_target_base(entry)
+        csv_path = target_base / f"{category}.csv"
+        multiplier_path = target_base / f"{category}_multiplier.txt"
+        pages = self.get_selected_pages(entry, category)
+        if not pages and not csv_path.exists() and not multiplier_path.exists():
+            return None
+        placeholder = self.scrape_category_placeholders.get(key)
+        if placeholder is not None:
+            placeholder.destroy()
+            self.scrape_category_placeholders[key] = None
+        panel = ScrapeResultPanel(
+            parent_inner,
+            self,
+            entry,
+            category,
+            target_base,
+            self.auto_scale_tables_var.get(),
+        )
+        panel.load_from_files()
+        panel.update_note_coloring()
+        self.scrape_panels[key] = panel
+        return panel
+
+    def _is_scrape_tab_visible(self) -> bool:
+        notebook = getattr(self, "notebook", None)
+        if notebook is None or self.scrape_tab is None:
+            return False
+        try:
+            return self.root.nametowidget(notebook.select()) is self.scrape_tab
+        except Exception:
+            return False
+
+    def _refresh_scrape_panel(self, entry: PDFEntry, category: str) -> None:
+        """Update the Scrape tab after the selected pages of one category changed.
+
+        Only the ``(entry.path, category)`` panel is touched. While the Scrape
+        tab is hidden the key is just marked stale and applied when it is shown.
+        """
+
+        key = (entry.path, category)
+        if key not in self.scrape_category_inners:
+            # The tab structure does not know this PDF yet; rebuild it once.
+            self._refresh_scrape_results()
+            return
+        if not self._is_scrape_tab_visible():
+            self.stale_scrape_keys.add(key)
+            return
+        self._apply_scrape_panel_update(entry, category)
+
+    def _apply_scrape_panel_update(self, entry: PDFEntry, category: str) -> None:
+        key = (entry.path, category)
+        panel = self._ensure_scrape_panel(entry, category)
+        if panel is None:
+            return
+        if self.active_scrape_key is None:
+            self.set_active_scrape_panel(entry, category)
+        elif self.active_scrape_key == key:
+            self._show_scrape_preview(entry, category)
+        else:
+            panel.set_active(False)
+
+    def apply_stale_scrape_updates(self) -> None:
+        """Apply panel updates deferred by :meth:`_refresh_scrape_panel`."""
+
+        stale = self.stale_scrape_keys
+        self.stale_scrape_keys = set()
+        for path, category in stale:
+            entry = self._get_entry_by_path(path)
+            if entry is not None:
+                self._apply_scrape_panel_update(entry, category)
+
     def _refresh_scrape_results(self) -> None:
+        self.stale_scrape_keys = set()
         for panel in self.scrape_panels.values():
             panel.destroy()
         self.scrape_panels.clear()
@@ -294,43 +390,16 @@ class ScrapeUIMixin:
                 self.scrape_category_windows[key] = window
                 self.scrape_category_placeholders[key] = placeholder
 
-        company = self.company_var.get().strip()
         entry_lookup: Dict[Path, PDFEntry] = {entry.path: entry for entry in self.pdf_entries}
         default_entry: Optional[PDFEntry] = None
         default_category: Optional[str] = None
 
         for entry in self.pdf_entries:
-            if company:
-                target_base_base = self.companies_dir / company / "openapiscrape" / entry.path.stem
-            else:
-                target_base_base = entry.path.parent / "openapiscrape" / entry.path.stem
             for category in COLUMNS:
-                key = (entry.path, category)
-                parent_inner = self.scrape_category_inners.get(key)
-                if parent_inner is None:
-                    continue
-                pages = self.get_selected_pages(entry, category)
-                target_base = target_base_base
-                csv_path = target_base / f"{category}.csv"
-                multiplier_path = target_base / f"{category}_multiplier.txt"
-                if not pages and not csv_path.exists() and not multiplier_path.exists():
+                panel = self._ensure_scrape_panel(entry, category)
+                if panel is None:
                     continue
-                placeholder = self.scrape_category_placeholders.get(key)
-                if placeholder is not None:
-                    placeholder.destroy()
-                    self.scrape_category_placeholders[key] = None
-                panel = ScrapeResultPanel(
-                    parent_inner,
-                    self,
-                    entry,
-                    category,
-                    target_base,
-                    self.auto_scale_tables_var.get(),
-                )
-                panel.load_from_files()
-                panel.update_note_coloring()
-                self.scrape_panels[key] = panel
-        if panel.model.has_csv_data or pages:
+                if panel.model.has_csv_data or self.get_selected_pages(entry, category):
                     if default_entry is None:
                         default_entry = entry
                         default_category = category
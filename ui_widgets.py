@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 import tkinter as tk
 from tkinter import ttk
 
+from constants import COLUMNS
 from pdf_utils import MatchThumbnail
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -85,7 +86,18 @@ class CategoryRow:
         self.thumbnails: List[MatchThumbnail] = []
         self.empty_label: Optional[ttk.Label] = None
 
-    def refresh(self) -> None:
+    def bind_entry(self, entry: "PDFEntry") -> None:
+        """Reuse this row for ``entry`` (used by the virtualized Review grid)."""
+
+        self.entry = entry
+        width = max(80, self.app.thumbnail_width_var.get())
+        if width != self.target_width:
+            self.target_width = width
+            self.canvas.configure(height=self._compute_canvas_height())
+        self.canvas.xview_moveto(0)
+        self.refresh()
+
+    def clear(self) -> None:
         for thumb in self.thumbnails:
             thumb.destroy()
         self.thumbnails.clear()
@@ -93,6 +105,9 @@ class CategoryRow:
             self.empty_label.destroy()
             self.empty_label = None
 
+    def refresh(self) -> None:
+        self.clear()
+
         matches = self.entry.matches.get(self.category, [])
         if not matches:
             self.empty_label = ttk.Label(self.inner, text="No matches found", foreground="#666666")
@@ -148,3 +163,58 @@ class CategoryRow:
             self.scrollbar.grid_remove()
         else:
             self.scrollbar.grid()
+
+
+class ReviewEntryRow:
+    """Recyclable Review-grid row: one PDF's name, year and category rows.
+
+    The virtualized grid keeps a small pool of these and rebinds them to
+    whichever :class:`PDFEntry` scrolls into view.
+    """
+
+    def __init__(self, parent: tk.Widget, app: "ReportAppV2") -> None:
+        self.app = app
+        self.entry: Optional["PDFEntry"] = None
+
+        self.container = ttk.Frame(parent, padding=8)
+        self.container.columnconfigure(1, weight=1)
+
+        info_frame = ttk.Frame(self.container)
+        info_frame.grid(row=0, column=0, sticky="nw", padx=(0, 12))
+        self.name_label = ttk.Label(info_frame, anchor="w", width=30, wraplength=200)
+        self.name_label.pack(anchor="w")
+        self.year_label = ttk.Label(info_frame, foreground="#555555")
+
+        self.types_frame = ttk.Frame(self.container)
+        self.types_frame.grid(row=0, column=1, sticky="ew")
+        self.types_frame.columnconfigure(0, weight=1)
+
+        self.category_rows: Dict[str, CategoryRow] = {}
+
+    def bind(self, entry: "PDFEntry") -> None:
+        self.entry = entry
+        self.name_label.configure(text=str(entry.path.name))
+        if entry.year:
+            self.year_label.configure(text=f"Year: {entry.year}")
+            self.year_label.pack(anchor="w", pady=(4, 0))
+        else:
+            self.year_label.pack_forget()
+
+        for idx, column in enumerate(COLUMNS):
+            row = self.category_rows.get(column)
+            if row is None:
+                row = CategoryRow(self.types_frame, self.app, entry, column)
+                row.frame.grid(row=idx, column=0, sticky="ew")
+                if idx:
+                    row.frame.grid_configure(pady=(8, 0))
+                self.category_rows[column] = row
+                row.refresh()
+            else:
+                row.bind_entry(entry)
+
+    def release(self) -> None:
+        """Drop thumbnails so a pooled row holds no page images."""
+
+        self.entry = None
+        for row in self.category_rows.values():
+            row.clear()
@@ -0,0 +1,206 @@
+"""Per-company record of PDF slices already uploaded to OpenAI.
+
+AIScrape used to upload the exported page slice of every PDF-mode job, even
+when the same pages had been uploaded by an earlier batch or by another
+category pointing at the same pages. :class:`UploadRegistry` maps the
+SHA-256 of a slice to the OpenAI file id it was uploaded as and persists the
+map in ``companies/<company>/openai_uploads.json``.
+
+File ids belong to an account, so entries are keyed by a fingerprint of the
+API key and endpoint as well as the content hash. An id that has not been
+checked for a while is verified with ``files.retrieve`` before reuse; ids
+older than :data:`UPLOAD_MAX_AGE` are deleted remotely and uploaded afresh.
+Only files recorded here are ever deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app_logging import get_logger
+
+
+logger = get_logger()
+
+UPLOAD_REGISTRY_FILENAME = "openai_uploads.json"
+# Re-check an id with the API when it has not been seen for this long.
+UPLOAD_VERIFY_AFTER = 60 * 60
+# Replace (and delete remotely) uploads older than this.
+UPLOAD_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def account_fingerprint(api_key: str, base_url: str = "") -> str:
+    """Short, non-reversible id for the account that owns uploaded files."""
+
+    return hashlib.sha256(f"{base_url.strip()}\n{api_key.strip()}".encode("utf-8")).hexdigest()[:16]
+
+
+def is_missing_file_error(exc: BaseException) -> bool:
+    """True when the API rejected a request because a file id no longer exists."""
+
+    status = getattr(exc, "status_code", None)
+    if status == 404:
+        return True
+    return status == 400 and "file" in str(exc).lower()
+
+
+def upload_pdf_bytes(client: Any, data: bytes, name: str) -> str:
+    """Upload in-memory PDF ``data`` as ``name``; return the new file id."""
+
+    logger.info("AIScrape uploading %s (%d bytes)", name, len(data))
+    uploaded = client.files.create(file=(name, io.BytesIO(data), "application/pdf"), purpose="assistants")
+    file_id = getattr(uploaded, "id", None)
+    if not file_id:
+        raise ValueError(f"Failed to upload {name} to OpenAI")
+    logger.info("AIScrape uploaded %s as file id %s", name, file_id)
+    return str(file_id)
+
+
+class UploadRegistry:
+    """Thread-safe content hash → OpenAI file id map for one company."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_age: float = UPLOAD_MAX_AGE,
+        verify_after: float = UPLOAD_VERIFY_AFTER,
+    ) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self.verify_after = verify_after
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.reused = 0
+        self.uploaded = 0
+        self.uploaded_bytes = 0
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if isinstance(data, dict) and isinstance(data.get("files"), dict):
+            self.entries = {
+                str(k): v for k, v in data["files"].items() if isinstance(v, dict) and v.get("file_id")
+            }
+
+    @classmethod
+    def for_company(cls, company_dir: Path) -> "UploadRegistry":
+        return cls(company_dir / UPLOAD_REGISTRY_FILENAME)
+
+    def file_id_for(self, client: Any, account: str, data: bytes, name: str) -> str:
+        """Return a file id for the PDF ``data``, uploading only if no valid one is known."""
+
+        digest = hashlib.sha256(data).hexdigest()
+        key = f"{account}:{digest}"
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Jobs sharing a slice wait for the first upload instead of racing it.
+        with key_lock:
+            entry = self._valid_entry(client, key)
+            if entry is not None:
+                with self._lock:
+                    self.reused += 1
+                logger.info("♻️ AIScrape reusing uploaded file %s for %s", entry["file_id"], name)
+                return str(entry["file_id"])
+
+            file_id = upload_pdf_bytes(client, data, name)
+            now = time.time()
+            with self._lock:
+                self.uploaded += 1
+                self.uploaded_bytes += len(data)
+                self.entries[key] = {
+                    "file_id": file_id,
+                    "bytes": len(data),
+                    "name": name,
+                    "uploaded": now,
+                    "verified": now,
+                }
+                self._save_locked()
+            return file_id
+
+    def _valid_entry(self, client: Any, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self.entries.get(key)
+            entry = dict(entry) if entry else None
+        if entry is None:
+            return None
+        now = time.time()
+        file_id = str(entry["file_id"])
+        if now - float(entry.get("uploaded", 0)) > self.max_age:
+            self._delete_remote(client, file_id)
+            self._drop(file_id)
+            return None
+        if now - float(entry.get("verified", 0)) > self.verify_after:
+            try:
+                client.files.retrieve(file_id)
+            except Exception as exc:
+                if not is_missing_file_error(exc):
+                    raise
+                logger.info("🗑️ Uploaded file %s no longer exists, uploading again", file_id)
+                self._drop(file_id)
+                return None
+            with self._lock:
+                if key in self.entries:
+                    self.entries[key]["verified"] = now
+                    self._save_locked()
+        return entry
+
+    def forget(self, file_ids: List[str]) -> None:
+        """Drop ``file_ids`` after the API reported them missing."""
+
+        for file_id in file_ids:
+            self._drop(file_id)
+
+    def _drop(self, file_id: str) -> None:
+        with self._lock:
+            stale = [key for key, entry in self.entries.items() if entry.get("file_id") == file_id]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self._save_locked()
+
+    def _delete_remote(self, client: Any, file_id: str) -> bool:
+        try:
+            client.files.delete(file_id)
+        except Exception as exc:
+            if not is_missing_file_error(exc):
+                logger.warning("⚠️ Could not delete uploaded file %s: %s", file_id, exc)
+                return False
+        logger.info("🗑️ Deleted expired upload %s", file_id)
+        return True
+
+    def cleanup(self, client: Any, account: str) -> int:
+        """Delete this account's expired uploads remotely; return how many were removed."""
+
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            expired = [
+                str(entry["file_id"])
+                for key, entry in self.entries.items()
+                if key.startswith(f"{account}:") and float(entry.get("uploaded", 0)) < cutoff
+            ]
+        removed = 0
+        for file_id in expired:
+            if self._delete_remote(client, file_id):
+                self._drop(file_id)
+                removed += 1
+        return removed
+
+    def _save_locked(self) -> None:
+        payload = json.dumps({"version": 1, "files": self.entries}, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".openai_uploads.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp_name, self.path)
+        except OSError as exc:
+            logger.warning("⚠️ Could not save OpenAI upload registry %s: %s", self.path, exc)
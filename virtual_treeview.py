@@ -0,0 +1,246 @@
+"""A ``ttk.Treeview`` that only materialises the rows currently in view.
+
+Rows stay in a Python list; the widget holds one item per visible line and
+rewrites their values and tags as the view scrolls. Headings, column
+configuration, horizontal scrolling and ``identify_*`` behave exactly like a
+plain Treeview, so existing heading handlers keep working. The selection is
+kept as model-row indexes and re-applied to the recycled items on every
+render, so it survives scrolling; Up/Down scroll the model at the edges of
+the visible window.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Sequence, Set, Tuple
+
+import tkinter as tk
+from tkinter import ttk
+
+
+# (display values, tags) for one model row.
+RowView = Tuple[Sequence[Any], Sequence[str]]
+
+
+def _plain_row_view(row: Sequence[Any]) -> RowView:
+    return row, ()
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Treeview whose vertical scrolling is driven by a row model."""
+
+    def __init__(self, master: tk.Misc, **kw: Any) -> None:
+        self._yscrollcommand: Optional[Callable[[float, float], Any]] = kw.pop("yscrollcommand", None)
+        super().__init__(master, **kw)
+        self._rows: Sequence[Sequence[Any]] = []
+        self._row_view: Callable[[Sequence[Any]], RowView] = _plain_row_view
+        self._top = 0
+        self._visible = max(1, int(self.cget("height") or 10))
+        self._render_after: Optional[str] = None
+        self._selected: Set[int] = set()
+        self._cursor: Optional[int] = None
+        self.bind("<Configure>", self._on_configure, add="+")
+        self.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind("<Button-4>", self._on_linux_scroll, add="+")
+        self.bind("<Button-5>", self._on_linux_scroll, add="+")
+        for key, amount, what in (
+            ("<Prior>", -1, "pages"),
+            ("<Next>", 1, "pages"),
+            ("<Home>", -1, "all"),
+            ("<End>", 1, "all"),
+        ):
+            self.bind(key, lambda _e, n=amount, w=what: self._scroll_by(n, w), add="+")
+        for key, step, extend in (
+            ("<Up>", -1, False),
+            ("<Down>", 1, False),
+            ("<Shift-Up>", -1, True),
+            ("<Shift-Down>", 1, True),
+        ):
+            self.bind(key, lambda _e, n=step, x=extend: self._move_cursor(n, x), add="+")
+        self.bind("<<TreeviewSelect>>", self._sync_selection, add="+")
+
+    # ------------------------------------------------------------------
+    # Model
+    # ------------------------------------------------------------------
+    def set_rows(
+        self,
+        rows: Sequence[Sequence[Any]],
+        row_view: Optional[Callable[[Sequence[Any]], RowView]] = None,
+    ) -> None:
+        """Show ``rows``; ``row_view`` turns a model row into values and tags.
+
+        ``row_view`` only runs for rows that scroll into view.
+        """
+
+        self._rows = rows
+        self._row_view = row_view or _plain_row_view
+        self._top = 0
+        self._selected = set()
+        self._cursor = None
+        self._render()
+
+    @property
+    def row_count(self) -> int:
+        return len(self._rows)
+
+    def selected_rows(self) -> List[int]:
+        """Model indexes of the selected rows, including ones scrolled out of view."""
+
+        return sorted(self._selected)
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+    def _item_rows(self) -> List[Tuple[str, int]]:
+        return [(item, self._top + offset) for offset, item in enumerate(super().get_children(""))]
+
+    def _sync_selection(self, _event: Optional[tk.Event] = None) -> None:
+        # Rows outside the window keep their state; visible ones follow the widget.
+        items = self._item_rows()
+        visible = {row for _item, row in items}
+        chosen = set(super().selection())
+        self._selected = {row for row in self._selected if row not in visible}
+        self._selected.update(row for item, row in items if item in chosen)
+        focus = super().focus()
+        for item, row in items:
+            if item == focus:
+                self._cursor = row
+
+    def _move_cursor(self, step: int, extend: bool) -> str:
+        if not self._rows:
+            return "break"
+        self._sync_selection()
+        if self._cursor is None:
+            target = self._top
+        else:
+            target = max(0, min(len(self._rows) - 1, self._cursor + step))
+        self._cursor = target
+        if extend:
+            self._selected.add(target)
+        else:
+            self._selected = {target}
+        if target < self._top:
+            self._top = target
+        elif target >= self._top + self._visible:
+            self._top = target - self._visible + 1
+        self._render()
+        return "break"
+
+    # ------------------------------------------------------------------
+    # Scrolling (Treeview API overrides)
+    # ------------------------------------------------------------------
+    def configure(self, cnf: Any = None, **kw: Any) -> Any:
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand") or None
+            self._update_scrollbar()
+        if cnf is None and not kw:
+            return super().configure()
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def yview(self, *args: Any) -> Any:
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self.yview_moveto(float(args[1]))
+        elif args[0] == "scroll":
+            self.yview_scroll(int(args[1]), str(args[2]))
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        self._set_top(int(round(float(fraction) * len(self._rows))))
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        self._scroll_by(int(number), what)
+
+    def _scroll_by(self, number: int, what: str) -> str:
+        if what == "all":
+            self._set_top(0 if number < 0 else len(self._rows))
+        elif what == "pages":
+            self._set_top(self._top + number * max(1, self._visible - 1))
+        else:
+            self._set_top(self._top + number)
+        return "break"
+
+    def _set_top(self, top: int) -> None:
+        top = max(0, min(top, max(0, len(self._rows) - self._visible)))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _fractions(self) -> Tuple[float, float]:
+        total = len(self._rows)
+        if total <= 0:
+            return 0.0, 1.0
+        first = self._top / total
+        last = min(1.0, (self._top + self._visible) / total)
+        return first, last
+
+    def _update_scrollbar(self) -> None:
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def _render(self) -> None:
+        count = max(0, min(self._visible, len(self._rows) - self._top))
+        items = list(super().get_children(""))
+        if len(items) > count:
+            super().delete(*items[count:])
+            items = items[:count]
+        while len(items) < count:
+            items.append(super().insert("", "end"))
+        chosen = []
+        if super().focus() and not (self._cursor is not None and self._top <= self._cursor < self._top + count):
+            super().focus("")  # the focused item now shows another row
+        for offset, item in enumerate(items):
+            row = self._top + offset
+            values, tags = self._row_view(self._rows[row])
+            super().item(item, values=list(values), tags=list(tags))
+            if row in self._selected:
+                chosen.append(item)
+            if row == self._cursor:
+                super().focus(item)
+        if set(chosen) != set(super().selection()):
+            super().selection_set(chosen)
+        self._update_scrollbar()
+
+    def _measure_visible(self) -> int:
+        height = self.winfo_height()
+        items = super().get_children("")
+        if height <= 1 or not items:
+            return self._visible
+        bbox = super().bbox(items[0])
+        if not bbox:
+            return self._visible
+        header, row_height = bbox[1], max(1, bbox[3])
+        return max(1, (height - header) // row_height)
+
+    def _on_configure(self, _event: tk.Event) -> None:
+        if self._render_after is None:
+            self._render_after = self.after_idle(self._relayout)
+
+    def _relayout(self) -> None:
+        self._render_after = None
+        visible = self._measure_visible()
+        if visible != self._visible:
+            self._visible = visible
+            self._top = max(0, min(self._top, len(self._rows) - self._visible))
+            self._render()
+        else:
+            self._update_scrollbar()
+
+    def _on_mousewheel(self, event: tk.Event) -> str:  # type: ignore[override]
+        if event.delta == 0:
+            return "break"
+        if event.state & 0x0001:  # Shift scrolls horizontally
+            super().xview_scroll(-1 if event.delta > 0 else 1, "units")
+            return "break"
+        steps = max(1, abs(int(event.delta)) // 120) * 3
+        return self._scroll_by(-steps if event.delta > 0 else steps, "units")
+
+    def _on_linux_scroll(self, event: tk.Event) -> str:  # type: ignore[override]
+        if getattr(event, "num", None) == 4:
+            return self._scroll_by(-3, "units")
+        return self._scroll_by(3, "units")